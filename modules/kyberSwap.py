@@ -2,8 +2,11 @@ import sys
 import os
 import json
 import math, time
+import atexit
+import threading
 import logging
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Set
 
 import requests
@@ -22,13 +25,21 @@ from utils.helper import Web3Helper, FileHelper, NATIVE_SENTINEL
 
 console = Console()
 
+# Values treated as "empty" when pruning optional tx_params fields.
+_EMPTY_VALUES = (None, "", [])
+
 class SwapManager:
-    def __init__(self, chain_config, KYBERSWAP_API_HEADERS=config.KYBERSWAP_API_HEADERS):
+    def __init__(self, chain_config, KYBERSWAP_API_HEADERS=config.KYBERSWAP_API_HEADERS, auto_config=None):
         """
         Initialize the SwapManager with a specific chain configuration object.
+
+        auto_config: optional dict of pre-answered prompts (see batch.example.yaml).
+        Any key present there is used instead of the questionary prompt, enabling
+        fully non-interactive batch runs.
         """
         self.console = Console()
         self.KYBERSWAP_API_HEADERS = KYBERSWAP_API_HEADERS
+        self.auto_config = dict(auto_config or {})
 
         # Store the chain config (Polygon, OP, Base, etc.)
         self.chain_config = chain_config
@@ -46,6 +57,17 @@ class SwapManager:
         self.chain_name = chain_config.CHAIN_NAME
         self._token_meta = {}
         self._permit_support_cache = {}
+        # Short-TTL route cache: in fixed-amount batches every wallet requests
+        # the same (token_in, token_out, amount) route, so share the response.
+        self._route_cache: Dict[Tuple[str, str, int], Tuple[float, dict]] = {}
+        self._route_cache_ttl = 10.0  # seconds; Kyber routes drift with pool state
+        # Lowercased addresses known to be the native sentinel; lets hot loops
+        # test membership once instead of re-lowercasing per iteration.
+        self._native_tokens: set[str] = {NATIVE_SENTINEL}
+        # Locally tracked next nonce per sender; seeded once per batch so the
+        # send path never has to re-read eth_getTransactionCount.
+        self._next_nonce: Dict[str, int] = {}
+        self._nonce_lock = threading.Lock()
 
         self.rpc_urls = self._build_rpc_urls(chain_config)
         self.provider = RotatingHTTPProvider(self.rpc_urls)
@@ -86,6 +108,21 @@ class SwapManager:
         self.prefetched_ens_reverse: Dict[str, str] = {}
         self.prefetch_ready: bool = False
 
+        # Persistent allowance cache: approvals survive process restarts
+        # on-chain, so seed the in-memory cache from disk and skip the initial
+        # check_allowance RPC for (wallet, token) pairs approved in past runs.
+        self._allowance_cache_path = os.path.join(
+            str(config.BASE_PATH), f".allowance_cache_{self.chain_name}.json"
+        )
+        self._allowance_cache_dirty = False
+        # Keys whose cached value is permit-derived or optimistic rather than
+        # read back on-chain; they stay usable in-memory but never hit disk
+        # (a persisted single-use permit would skip the approval next run and
+        # let the swap revert).
+        self._allowance_cache_volatile: set[Tuple[str, str]] = set()
+        self._load_allowance_cache()
+        atexit.register(self._save_allowance_cache)
+
         # Use the chain-specific KyberSwap endpoints from config
         self.kyberswap_api_route = chain_config.KYBERSWAP_API_ROUTE
         self.kyberswap_api_build = chain_config.KYBERSWAP_API_BUILD
@@ -98,6 +135,29 @@ class SwapManager:
 
 
 
+    # ---- non-interactive prompt plumbing ----
+    def _auto_answer(self, key):
+        """Return the pre-configured answer for a prompt key, or None."""
+        return self.auto_config.get(key)
+
+    def _token_label_from_config(self, value) -> Optional[str]:
+        """Map an auto_config token entry (label or address) to a selection label."""
+        if not value:
+            return None
+        value = str(value).strip()
+        if value in self.tokens:
+            return value
+        checksum = self._checksum(value)
+        if not checksum:
+            self.console.log(f"[red]Invalid token in config: {value}[/red]")
+            return None
+        for label, addr in self.tokens.items():
+            if str(addr).lower() == checksum.lower():
+                return label
+        label = f"Custom ({checksum})"
+        self.tokens[label] = checksum
+        return label
+
     def multicall_available(self):
         return self.multicall is not None
 
@@ -168,10 +228,50 @@ class SwapManager:
         if key:
             self.prefetched_balances[key] = int(value)
 
-    def _update_cached_allowance(self, wallet: str, token: str, value: int) -> None:
+    def _update_cached_allowance(self, wallet: str, token: str, value: int,
+                                 *, persist: bool = True) -> None:
+        """Update the in-memory allowance; persist=False marks the entry
+        volatile (permit/optimistic value) so it never reaches the disk cache."""
         key = self._pair_key(wallet, token)
         if key:
             self.prefetched_allowances[key] = int(value) if value is not None else None
+            if persist:
+                self._allowance_cache_volatile.discard(key)
+                self._allowance_cache_dirty = True
+            else:
+                self._allowance_cache_volatile.add(key)
+
+    def _load_allowance_cache(self) -> None:
+        try:
+            with open(self._allowance_cache_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.console.log(f"[yellow]Could not load allowance cache: {e}[/yellow]")
+            return
+        for key, value in (raw or {}).items():
+            try:
+                wallet, token = key.split("|", 1)
+                self.prefetched_allowances[(wallet, token)] = int(value)
+            except Exception:
+                continue
+
+    def _save_allowance_cache(self) -> None:
+        if not self._allowance_cache_dirty:
+            return
+        try:
+            data = {
+                f"{wallet}|{token}": int(value)
+                for (wallet, token), value in self.prefetched_allowances.items()
+                if value is not None
+                and (wallet, token) not in self._allowance_cache_volatile
+            }
+            with open(self._allowance_cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self._allowance_cache_dirty = False
+        except Exception as e:
+            self.console.log(f"[yellow]Could not save allowance cache: {e}[/yellow]")
 
     def _get_prefetched_balance(self, wallet_address: str, token_address: str) -> Optional[int]:
         key = self._pair_key(wallet_address, token_address)
@@ -238,19 +338,44 @@ class SwapManager:
 
         ens_names_forward = [name for name in self.wallet_ens_names.values() if name] if include_ens else []
         try:
-            result = self.web3h.multicall_fetch(
-                wallets=wallets,
-                tokens=normalized_tokens,
-                spender=spender_checksum,
-                ens_names=ens_names_forward or None,
-                use_multicall=bool(self.web3h.multicall),
-                want_balance=True,
-                want_decimals=True,
-                with_name=True,
-                with_symbol=True,
-                want_ens=include_ens,
-                want_allowance=include_allowance,
-            )
+            if include_ens and wallets:
+                # The ENS reverse lookup and the token multicall hit independent
+                # contracts, so run them concurrently instead of serially inside
+                # multicall_fetch - one round trip hides behind the other.
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    ens_future = pool.submit(self.web3h.batch_ens_reverse, list(wallets))
+                    result = self.web3h.multicall_fetch(
+                        wallets=wallets,
+                        tokens=normalized_tokens,
+                        spender=spender_checksum,
+                        ens_names=ens_names_forward or None,
+                        use_multicall=bool(self.web3h.multicall),
+                        want_balance=True,
+                        want_decimals=True,
+                        with_name=True,
+                        with_symbol=True,
+                        want_ens=False,
+                        want_allowance=include_allowance,
+                    )
+                    try:
+                        result["ens_reverse"] = ens_future.result() or {}
+                    except Exception as ens_exc:
+                        self.console.log(f"[yellow]ENS reverse prefetch failed: {ens_exc}[/yellow]")
+                        result["ens_reverse"] = {}
+            else:
+                result = self.web3h.multicall_fetch(
+                    wallets=wallets,
+                    tokens=normalized_tokens,
+                    spender=spender_checksum,
+                    ens_names=ens_names_forward or None,
+                    use_multicall=bool(self.web3h.multicall),
+                    want_balance=True,
+                    want_decimals=True,
+                    with_name=True,
+                    with_symbol=True,
+                    want_ens=include_ens,
+                    want_allowance=include_allowance,
+                )
         except Exception as e:
             self.console.log(f"[yellow]Token prefetch via multicall_fetch failed: {e}[/yellow]")
             return
@@ -320,7 +445,11 @@ class SwapManager:
 
         self.prefetched_balances = new_balances
         if include_allowance:
-            self.prefetched_allowances = new_allowances
+            # Merge fresh on-chain values over any disk-seeded entries so pairs
+            # outside this prefetch keep their cached allowance.
+            self.prefetched_allowances.update(new_allowances)
+            self._allowance_cache_volatile.difference_update(new_allowances)
+            self._allowance_cache_dirty = True
         self.prefetched_decimals = new_decimals
         self.prefetched_names = new_names
         self.prefetched_symbols = new_symbols
@@ -352,6 +481,8 @@ class SwapManager:
         token_key = self._token_key(token_address)
         if not token_key:
             return
+        if str(token_address).lower() == NATIVE_SENTINEL:
+            self._native_tokens.add(token_key)
         if token_key not in self.prefetched_tokens:
             self.prefetch_wallet_token_data(
                 extra_tokens=[token_address],
@@ -360,6 +491,16 @@ class SwapManager:
                 include_ens=False,
             )
 
+    def _flush_log_buffer(self, lines: List[str]) -> None:
+        """Emit buffered per-wallet log lines with a single console.log call.
+
+        Console.log acquires a lock and renders markup per call; batching the
+        ~5 detail lines a wallet produces keeps that off the hot loop.
+        """
+        if lines:
+            self.console.log("\n".join(lines))
+            lines.clear()
+
     def _log_loaded_wallets(self) -> None:
         if not self.wallet_addresses:
             return
@@ -389,16 +530,24 @@ class SwapManager:
             extra = f" ({name})" if name else ""
             self.console.log(f"[magenta]{symbol}[/magenta] -> {checksum}{extra}")
 
+    _INPUT_METHOD_LABELS = {
+        "file": "Default path (file)",
+        "cli": "Manual input (CLI)",
+        "gui": "Manual input (GUI)",
+    }
+
     def select_token_input_method(self) -> OrderedDict[str, str]:
         if self.is_linux:
             choices = ["Default path (file)", "Manual input (CLI)"]
         else:
             choices = ["Default path (file)", "Manual input (GUI)"]
 
-        choice = questionary.select(
-            "Choose token contract input method:",
-            choices=choices
-        ).ask()
+        choice = self._INPUT_METHOD_LABELS.get(str(self._auto_answer("token_input") or "").lower())
+        if not choice:
+            choice = questionary.select(
+                "Choose token contract input method:",
+                choices=choices
+            ).ask()
 
         if not choice:
             self.console.log("[yellow]No selection made, falling back to file input.[/yellow]")
@@ -599,10 +748,12 @@ class SwapManager:
         else:
             choices = ["Default path (file)", "Manual input (GUI)"]
 
-        choice = questionary.select(
-            "Choose private key input method:",
-            choices=choices
-        ).ask()
+        choice = self._INPUT_METHOD_LABELS.get(str(self._auto_answer("wallet_input") or "").lower())
+        if not choice:
+            choice = questionary.select(
+                "Choose private key input method:",
+                choices=choices
+            ).ask()
 
         if not choice:
             self.console.log("[yellow]No selection made, falling back to file input.[/yellow]")
@@ -692,10 +843,12 @@ class SwapManager:
 
     def fetch_suggested_fees(self):
         """Fetch suggested gas fees with helper and a tier selector."""
-        tier_choice = questionary.select(
-            "Select gas tier to use:",
-            choices=["low", "medium", "high"]
-        ).ask()
+        tier_choice = self._auto_answer("gas_tier")
+        if tier_choice not in ("low", "medium", "high"):
+            tier_choice = questionary.select(
+                "Select gas tier to use:",
+                choices=["low", "medium", "high"]
+            ).ask()
 
         if not tier_choice:
             self.console.log("[yellow]No tier selected. Falling back to 'medium'.[/yellow]")
@@ -931,7 +1084,16 @@ class SwapManager:
         """
         Fetch the best swap route from KyberSwap Aggregator API for the selected chain.
         We'll also uncomment the fee logic so you can optionally define fee_amount > 0 if you want to charge fees.
+
+        Responses are cached for a few seconds keyed on (token_in, token_out,
+        amount_in); identical per-wallet requests in a batch reuse one fetch.
         """
+        cache_key = (str(token_in).lower(), str(token_out).lower(), int(amount_in))
+        cached = self._route_cache.get(cache_key)
+        if cached and (time.time() - cached[0]) < self._route_cache_ttl:
+            self.console.log("[green]Reusing cached swap route.[/green]")
+            return cached[1]
+
         url = self.kyberswap_api_route
         headers = self.KYBERSWAP_API_HEADERS.copy()
         headers["source"] = headers.get("x-client-id", "")
@@ -951,7 +1113,7 @@ class SwapManager:
             params["chargeFeeBy"] = "currency_in"  # or "currency_out"
 
         # Remove empty keys
-        params = {k: v for k, v in params.items() if v not in [None, "", []]}
+        params = {k: v for k, v in params.items() if v not in _EMPTY_VALUES}
 
         try:
             # Log the fully prepared URL for easier debugging of query formatting
@@ -966,6 +1128,7 @@ class SwapManager:
             route = response.json()
             if route.get("code") == 0:
                 self.console.log("[bold green]Fetched swap route successfully.[/bold green]")
+                self._route_cache[cache_key] = (time.time(), route)
                 return route
             else:
                 self.console.log(f"[bold red]Failed to fetch swap route: {route.get('message')}[/bold red]")
@@ -1009,6 +1172,36 @@ class SwapManager:
             self.console.log(f"[bold red]Error fetching encoded swap data: {e}[/bold red]")
             return None
 
+    def _encode_swaps_parallel(self, jobs: List[dict], chunk_size: int = 8) -> List[Optional[dict]]:
+        """Fetch encoded swap data for a batch of prepared swap jobs.
+
+        Each job carries its own ``route_summary`` and ``tx_params``, so the
+        /route/build POSTs are mutually independent and can be issued in
+        parallel; only transaction submission needs to stay sequential for
+        nonce ordering. Returns encoded-data dicts (None on failure) aligned
+        with ``jobs``.
+        """
+        results: List[Optional[dict]] = [None] * len(jobs)
+        if not jobs:
+            return results
+        chain_name = self.chain_config.CHAIN_NAME
+        with ThreadPoolExecutor(max_workers=chunk_size) as pool:
+            futures = {
+                pool.submit(
+                    self.get_encoded_swap_data,
+                    chain=chain_name,
+                    route_summary=job["route_summary"],
+                    tx_params=job["tx_params"],
+                ): idx
+                for idx, job in enumerate(jobs)
+            }
+            for future, idx in futures.items():
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    self.console.log(f"[bold red]Error encoding swap data: {e}[/bold red]")
+        return results
+
     def get_swap_info_with_encoded_data(self, encoded_data):
         """(Optional) Retrieve more info from encoded data if there's a separate /route/encode endpoint."""
         url = self.kyberswap_api_encode
@@ -1041,6 +1234,51 @@ class SwapManager:
                 self.console.log(f"[yellow]Response text: {e.response.text}[/yellow]")
             return None
 
+    def _prime_nonces(self, senders: List[str]) -> None:
+        """Seed the local nonce tracker with one pending-count read per sender.
+
+        Subsequent submissions take nonces from the local map instead of
+        re-querying eth_getTransactionCount per transaction, which removes an
+        RPC round-trip from the send path and keeps concurrent broadcasts from
+        racing on stale pending-pool reads.
+        """
+        unique = [s for s in dict.fromkeys(senders) if s not in self._next_nonce]
+        if not unique:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+            counts = list(pool.map(
+                lambda addr: self.w3.eth.get_transaction_count(addr, 'pending'),
+                unique,
+            ))
+        with self._nonce_lock:
+            for addr, count in zip(unique, counts):
+                self._next_nonce[addr] = count
+
+    def _take_nonce(self, sender: str) -> int:
+        """Reserve the next nonce for ``sender``, reading from RPC on first use."""
+        with self._nonce_lock:
+            if sender in self._next_nonce:
+                nonce = self._next_nonce[sender]
+                self._next_nonce[sender] = nonce + 1
+                return nonce
+        nonce = self.w3.eth.get_transaction_count(sender, 'pending')
+        with self._nonce_lock:
+            self._next_nonce[sender] = nonce + 1
+        return nonce
+
+    def _release_nonce(self, sender: str, nonce: int) -> None:
+        """Hand back a reserved nonce whose transaction never reached the chain.
+
+        If nothing else took a nonce in between, simply rewind the counter;
+        otherwise drop the sender's entry so the next take re-primes from the
+        chain rather than leaving a permanent gap.
+        """
+        with self._nonce_lock:
+            if self._next_nonce.get(sender) == nonce + 1:
+                self._next_nonce[sender] = nonce
+            else:
+                self._next_nonce.pop(sender, None)
+
     def execute_swap(self, private_key, encoded_data, router_address , from_token , amount_in_wei , max_fee_per_gas , max_priority_fee_per_gas):
         """Send the swap transaction to the KyberSwap router contract."""
         if not max_fee_per_gas or not max_priority_fee_per_gas:
@@ -1049,7 +1287,6 @@ class SwapManager:
 
         try:
             account = Account.from_key(private_key)
-            nonce = self.w3.eth.get_transaction_count(account.address)
 
             self.console.log(f"[debug]Executing swap for router_address: {router_address}[/debug]")
             calldata = encoded_data.get("data", {}).get("data")
@@ -1075,7 +1312,6 @@ class SwapManager:
                 'chainId': self.chain_id,
                 'from': account.address,
                 'to': router_address,
-                'nonce': nonce,
                 'gas': int(gas_detail) if gas_detail else 21000,
                 'maxFeePerGas': max_fee_per_gas,
                 'maxPriorityFeePerGas': max_priority_fee_per_gas,
@@ -1083,10 +1319,21 @@ class SwapManager:
                 'value': tx_value
             }
 
+            # Reserve the nonce only now that the transaction is fully built:
+            # the early validation returns above must not burn one.
+            nonce = self._take_nonce(account.address)
+            tx['nonce'] = nonce
+
             self.console.log(f"[debug]Transaction Params: {json.dumps(tx, indent=2)}[/debug]")
 
-            signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            try:
+                signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
+                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            except Exception:
+                # The reserved nonce never hit the chain; hand it back so
+                # later transactions for this sender don't strand behind a gap.
+                self._release_nonce(account.address, nonce)
+                raise
             self.console.log(f"[green]Swap transaction sent: {tx_hash.hex()}[/green]")
 
             receipt = self.wait_receipt_slow(tx_hash, timeout=300)
@@ -1283,7 +1530,8 @@ class SwapManager:
                             private_key=private_key
                         )
                         if permit_data:
-                            self._update_cached_allowance(sender, from_token, amount_in_wei)
+                            # Single-use permit: usable for this swap only.
+                            self._update_cached_allowance(sender, from_token, amount_in_wei, persist=False)
                             self.console.log("[bold green]Permit data generated successfully.[/bold green]")
                         else:
                             self.console.log("[bold red]Failed to generate permit data. Aborting swap.[/bold red]")
@@ -1303,7 +1551,7 @@ class SwapManager:
                             max_fee_per_gas=max_fee_per_gas,
                             max_priority_fee_per_gas=max_priority_fee_per_gas
                         )
-                        self._update_cached_allowance(sender, from_token, 2 ** 256 - 1)
+                        self._update_cached_allowance(sender, from_token, 2 ** 256 - 1, persist=False)
                         refreshed = self.check_allowance(from_token, sender, config.KYBER_ROUTER)
                         if refreshed is not None:
                             self._update_cached_allowance(sender, from_token, refreshed)
@@ -1333,7 +1581,7 @@ class SwapManager:
         }
 
         # Clean out empty
-        tx_params = {k: v for k, v in tx_params.items() if v not in [None, "", []]}
+        tx_params = {k: v for k, v in tx_params.items() if v not in _EMPTY_VALUES}
 
         # 9. Get encoded swap data
         encoded_data = self.get_encoded_swap_data(
@@ -1401,10 +1649,12 @@ class SwapManager:
 
         # 1) Select tokens (support manual input like single-threaded flow)
         from_token_choices = list(self.tokens.keys()) + ["[Enter contract address manually]"]
-        from_token_full = questionary.select(
-            "Select the token you want to swap from:",
-            choices=from_token_choices
-        ).ask()
+        from_token_full = self._token_label_from_config(self._auto_answer("from_token"))
+        if not from_token_full:
+            from_token_full = questionary.select(
+                "Select the token you want to swap from:",
+                choices=from_token_choices
+            ).ask()
         if from_token_full == "[Enter contract address manually]":
             manual_from_token = questionary.text(
                 "Enter the contract address of the token you want to swap from:"
@@ -1418,10 +1668,12 @@ class SwapManager:
             self.tokens[from_token_full] = manual_from_token
 
         to_token_choices = [symbol for symbol in self.tokens.keys() if symbol != from_token_full] + ["[Enter contract address manually]"]
-        to_token_full = questionary.select(
-            "Select the token you want to swap to:",
-            choices=to_token_choices
-        ).ask()
+        to_token_full = self._token_label_from_config(self._auto_answer("to_token"))
+        if not to_token_full:
+            to_token_full = questionary.select(
+                "Select the token you want to swap to:",
+                choices=to_token_choices
+            ).ask()
         if to_token_full == "[Enter contract address manually]":
             manual_to_token = questionary.text(
                 "Enter the contract address of the token you want to swap to:"
@@ -1454,17 +1706,23 @@ class SwapManager:
             return
 
         # 3) Amount selection (fixed or %)
-        amount_choice = questionary.select(
-            "Choose amount input method:",
-            choices=["Enter fixed amount", "Enter based %"]
-        ).ask()
+        amount_mode_cfg = str(self._auto_answer("amount_mode") or "").lower()
+        if amount_mode_cfg in ("fixed", "percentage"):
+            amount_choice = "Enter fixed amount" if amount_mode_cfg == "fixed" else "Enter based %"
+        else:
+            amount_choice = questionary.select(
+                "Choose amount input method:",
+                choices=["Enter fixed amount", "Enter based %"]
+            ).ask()
 
         fixed_amount_in_wei = None
         percentage_float = None
         if amount_choice == "Enter fixed amount":
-            amount = questionary.text(
-                f"Enter the fixed amount of {from_token_symbol} to swap:"
-            ).ask()
+            amount = self._auto_answer("amount")
+            if amount is None:
+                amount = questionary.text(
+                    f"Enter the fixed amount of {from_token_symbol} to swap:"
+                ).ask()
             try:
                 amount_float = float(amount)
                 if amount_float > human_readable_balance:
@@ -1475,9 +1733,11 @@ class SwapManager:
                 self.console.log("[bold red]Invalid amount. Aborting.[/bold red]")
                 return
         else:
-            percentage = questionary.text(
-                f"Enter how much (%) of {from_token_symbol} balance to swap (1-100):"
-            ).ask()
+            percentage = self._auto_answer("percentage")
+            if percentage is None:
+                percentage = questionary.text(
+                    f"Enter how much (%) of {from_token_symbol} balance to swap (1-100):"
+                ).ask()
             try:
                 percentage_float = float(percentage)
                 if not 0 < percentage_float <= 100:
@@ -1488,22 +1748,35 @@ class SwapManager:
                 return
 
         # 4) Slippage
-        slippage_choice = questionary.select(
-            "Choose slippage setting:",
-            choices=["Default (0.5%)", "Custom"]
-        ).ask()
-        if slippage_choice == "Custom":
-            slippage = questionary.text("Enter slippage tolerance % (e.g., 0.5 for 0.5%):").ask()
+        slippage_cfg = self._auto_answer("slippage")
+        if slippage_cfg is not None:
             try:
-                slippage_float = float(slippage) / 100
-            except ValueError:
-                self.console.log("[bold red]Invalid slippage value. Using default 0.5%[/bold red]")
+                slippage_float = float(slippage_cfg) / 100
+            except (TypeError, ValueError):
+                self.console.log("[bold red]Invalid slippage value in config. Using default 0.5%[/bold red]")
                 slippage_float = 0.005
         else:
-            slippage_float = 0.005
+            slippage_choice = questionary.select(
+                "Choose slippage setting:",
+                choices=["Default (0.5%)", "Custom"]
+            ).ask()
+            if slippage_choice == "Custom":
+                slippage = questionary.text("Enter slippage tolerance % (e.g., 0.5 for 0.5%):").ask()
+                try:
+                    slippage_float = float(slippage) / 100
+                except ValueError:
+                    self.console.log("[bold red]Invalid slippage value. Using default 0.5%[/bold red]")
+                    slippage_float = 0.005
+            else:
+                slippage_float = 0.005
 
-        # Confirm once
-        if not questionary.confirm(
+        # Confirm once (auto_config "confirm" skips the prompt entirely)
+        confirm_cfg = self._auto_answer("confirm")
+        if confirm_cfg is not None:
+            if not confirm_cfg:
+                self.console.log("[yellow]Batch swap cancelled by config[/yellow]")
+                return
+        elif not questionary.confirm(
             f"Proceed with batch swap from {from_token_symbol} to {to_token_symbol} for {len(self.wallet_private_keys)} wallets?"
         ).ask():
             self.console.log("[yellow]Batch swap cancelled by user[/yellow]")
@@ -1556,8 +1829,37 @@ class SwapManager:
         else:
             self.console.log("[yellow]Failed to probe router address. Proceeding with cached data.[/yellow]")
 
-        # 6) Process each wallet
+        # Shared timestamp for all deadline computations in this batch; avoids a
+        # time.time() syscall per wallet. Refreshed below if the batch runs long
+        # enough that permit/tx deadlines would drift.
+        batch_epoch = int(time.time())
+        batch_epoch_mono = time.monotonic()
+
+        # Constant across the whole batch: evaluate the native-token test once
+        from_token_is_native = str(from_token).lower() in self._native_tokens
+
+        # Static tx_params template shared by every wallet; only sender/recipient,
+        # deadline and permit vary per wallet, so the empty-value filtering is done once here.
+        base_tx_params = {
+            "slippageTolerance": int(slippage_float * 10000),  # bps
+            "feeAmount": 0,
+            "isInBps": True,
+            "enableGasEstimation": True,
+            "ignoreCappedSlippage": False,
+        }
+
+        # 6) Prepare each wallet: balance, route, allowance/permit. Successful
+        # wallets queue an encode job instead of blocking on the HTTP POST here.
+        pending_swaps: List[dict] = []
         for private_key in self.wallet_private_keys:
+            # Per-wallet log buffer: detail lines are collected here and flushed
+            # with a single console.log at decision points instead of one render
+            # (lock + markup) per line.
+            wallet_log: List[str] = []
+            # Take a fresh epoch only once the batch crosses a 5-minute boundary
+            if time.monotonic() - batch_epoch_mono > 300:
+                batch_epoch = int(time.time())
+                batch_epoch_mono = time.monotonic()
             try:
                 account = Account.from_key(private_key)
                 sender = account.address
@@ -1570,7 +1872,8 @@ class SwapManager:
                         balance_raw, _, _ = self.check_token_balance(from_token, sender)
                     amount_in_wei = int(balance_raw * (percentage_float / 100))
                     if amount_in_wei <= 0:
-                        self.console.log(f"[yellow]{sender}: Skipping, zero amount based on %.")
+                        wallet_log.append(f"[yellow]{sender}: Skipping, zero amount based on %.")
+                        self._flush_log_buffer(wallet_log)
                         continue
                 else:
                     amount_in_wei = fixed_amount_in_wei
@@ -1583,27 +1886,31 @@ class SwapManager:
                     amount_in=amount_in_wei
                 )
                 if not route:
-                    self.console.log(f"[bold red]{sender}: Failed to fetch route. Skipping.[/bold red]")
+                    wallet_log.append(f"[bold red]{sender}: Failed to fetch route. Skipping.[/bold red]")
+                    self._flush_log_buffer(wallet_log)
                     continue
                 data = route.get("data")
                 if not data:
-                    self.console.log("[bold red]No data found in route response. Skipping wallet.[/bold red]")
+                    wallet_log.append("[bold red]No data found in route response. Skipping wallet.[/bold red]")
+                    self._flush_log_buffer(wallet_log)
                     continue
                 route_summary = data.get("routeSummary")
                 router_address = data.get("routerAddress")
 
                 if not router_address:
-                    self.console.log("[bold red]Router address not found. Skipping wallet.[/bold red]")
+                    wallet_log.append("[bold red]Router address not found. Skipping wallet.[/bold red]")
+                    self._flush_log_buffer(wallet_log)
                     continue
                 if not route_summary:
-                    self.console.log("[bold red]Incomplete route data received. Skipping wallet.[/bold red]")
+                    wallet_log.append("[bold red]Incomplete route data received. Skipping wallet.[/bold red]")
+                    self._flush_log_buffer(wallet_log)
                     continue
-                
-                self.console.log(f"[bold green]KyberSwap Router Address: {router_address}[/bold green]")
+
+                wallet_log.append(f"[bold green]KyberSwap Router Address: {router_address}[/bold green]")
 
                 # Allowance (auto-approve unlimited if needed)
                 permit_data = None
-                if str(from_token).lower() != NATIVE_SENTINEL:
+                if not from_token_is_native:
                     allowance = self._get_prefetched_allowance(sender, from_token)
                     if allowance is None:
                         allowance = self.check_allowance(from_token, sender, config.KYBER_ROUTER)
@@ -1616,14 +1923,15 @@ class SwapManager:
                     allowance_human = allowance / (10 ** decimals_safe)
                     required_allowance_human = amount_in_wei / (10 ** decimals_safe)
                     
-                    self.console.log(f"[bold blue]Current Allowance: {allowance_human} {from_token_symbol}[/bold blue]")
-                    self.console.log(f"[bold blue]Required Allowance: {required_allowance_human} {from_token_symbol}[/bold blue]")                    
+                    wallet_log.append(f"[bold blue]Current Allowance: {allowance_human} {from_token_symbol}[/bold blue]")
+                    wallet_log.append(f"[bold blue]Required Allowance: {required_allowance_human} {from_token_symbol}[/bold blue]")
                     if allowance < amount_in_wei:
-                        self.console.log(f"[{sender}] [yellow]Insufficient allowance. Approving tokens...[/yellow]")
+                        wallet_log.append(f"[{sender}] [yellow]Insufficient allowance. Approving tokens...[/yellow]")
+                        self._flush_log_buffer(wallet_log)
                         supports_permit = self.check_eip2612_support(from_token, sender)
                         if supports_permit:
-                            self.console.log(f"[{sender}] [green]Token supports EIP-2612. Using permit for approval.[/green]")
-                            deadline = int(time.time()) + 1200
+                            wallet_log.append(f"[{sender}] [green]Token supports EIP-2612. Using permit for approval.[/green]")
+                            deadline = batch_epoch + 1200
                             permit_data = self.get_permit_data(
                                 token_address=from_token,
                                 owner=sender,
@@ -1633,10 +1941,12 @@ class SwapManager:
                                 private_key=private_key
                             )
                             if permit_data:
-                                self.console.log(f"[bold green]{sender}:Permit data generated successfully.[/bold green]")
-                                self._update_cached_allowance(sender, from_token, amount_in_wei)
+                                wallet_log.append(f"[bold green]{sender}:Permit data generated successfully.[/bold green]")
+                                # Single-use permit: usable for this swap only.
+                                self._update_cached_allowance(sender, from_token, amount_in_wei, persist=False)
                             else:
-                                self.console.log(f"[bold red]{sender}: Failed to generate permit data. Skipping swap.[/bold red]")
+                                wallet_log.append(f"[bold red]{sender}: Failed to generate permit data. Skipping swap.[/bold red]")
+                                self._flush_log_buffer(wallet_log)
                                 continue
 
                         else:
@@ -1649,40 +1959,47 @@ class SwapManager:
                                 max_priority_fee_per_gas=max_priority_fee_per_gas,
                                 approval_mode='unlimited'
                             )
-                        self._update_cached_allowance(sender, from_token, 2 ** 256 - 1)
+                        self._update_cached_allowance(sender, from_token, 2 ** 256 - 1, persist=False)
                     else:
-                        self.console.log(f"[green]Sufficient allowance exists: {allowance_human} {from_token_symbol}[/green]")
+                        wallet_log.append(f"[green]Sufficient allowance exists: {allowance_human} {from_token_symbol}[/green]")
                 else:
-                    self.console.log("[green]Native token - no allowance needed[/green]")
+                    wallet_log.append("[green]Native token - no allowance needed[/green]")
             except Exception as e:
-                self.console.log(f"[bold red]Error during allowance check/approval: {e}[/bold red]")
+                wallet_log.append(f"[bold red]Error during allowance check/approval: {e}[/bold red]")
+                self._flush_log_buffer(wallet_log)
                 continue
 
-                # Build TX params and execute
-            tx_params = {
+                # Build TX params from the shared template; the encode request
+                # itself is deferred to the parallel phase below.
+            tx_params = dict(base_tx_params)
+            tx_params["sender"] = sender
+            tx_params["recipient"] = recipient
+            tx_params["deadline"] = batch_epoch + 1200
+            permit_value = permit_data or route_summary.get('permit', "")
+            if permit_value:
+                tx_params["permit"] = permit_value
+
+            pending_swaps.append({
+                "private_key": private_key,
                 "sender": sender,
-                "recipient": recipient,
-                "deadline": int(time.time()) + 1200,
-                "slippageTolerance": int(slippage_float * 10000), #bps
-                "chargeFeeBy": "",
-                "feeAmount": 0,
-                "isInBps": True,
-                "feeReceiver": "",
-                "sources": "",
-                "referral": "",
-                "enableGasEstimation": True,
-                "permit": permit_data or route_summary.get('permit', ""),
-                "ignoreCappedSlippage": False
-            }
-            #clean out empty
-            tx_params = {k: v for k, v in tx_params.items() if v not in [None, "", []]}
-
+                "route_summary": route_summary,
+                "tx_params": tx_params,
+                "router_address": router_address,
+                "amount_in_wei": amount_in_wei,
+            })
+            self._flush_log_buffer(wallet_log)
+
+        # 7) Encode all prepared swaps in parallel (the /route/build calls are
+        # independent), then broadcast sequentially to preserve nonce ordering.
+        if pending_swaps:
+            self.console.log(f"[blue]Encoding swap data for {len(pending_swaps)} wallet(s)...[/blue]")
+            self._prime_nonces([job["sender"] for job in pending_swaps])
+        encoded_batch = self._encode_swaps_parallel(pending_swaps)
+
+        for job, encoded_data in zip(pending_swaps, encoded_batch):
+            sender = job["sender"]
+            wallet_log = []
             try:
-                encoded_data = self.get_encoded_swap_data(
-                    chain=self.chain_config.CHAIN_NAME,
-                    route_summary=route_summary,
-                    tx_params=tx_params
-                )
                 if not encoded_data:
                     self.console.log(f"[bold red]{sender}: Failed to get encoded swap data. Skipping.[/bold red]")
                     continue
@@ -1699,24 +2016,29 @@ class SwapManager:
                 amount_in_eth = Web3.from_wei(int(amount_in), 'ether') if amount_in else 0
                 amount_out_eth = Web3.from_wei(int(amount_out), 'ether') if amount_out else 0
 
-                self.console.log(f"[bold blue]Swap Details:[/bold blue]")
-                self.console.log(f"  - Amount In: {amount_in_eth} {from_token_symbol} (${amount_in_usd})")
-                self.console.log(f"  - Expected Amount Out: {amount_out_eth} {to_token_symbol} (${amount_out_usd})")
-                self.console.log(f"  - Gas: (${gas_usd})")
+                wallet_log.append(f"[bold blue]Swap Details:[/bold blue]")
+                wallet_log.append(f"  - Amount In: {amount_in_eth} {from_token_symbol} (${amount_in_usd})")
+                wallet_log.append(f"  - Expected Amount Out: {amount_out_eth} {to_token_symbol} (${amount_out_usd})")
+                wallet_log.append(f"  - Gas: (${gas_usd})")
+                # Flush before the swap itself so execute_swap's own logs stream live
+                self._flush_log_buffer(wallet_log)
 
                 self.execute_swap(
-                    private_key=private_key,
+                    private_key=job["private_key"],
                     encoded_data=encoded_data,
-                    router_address=router_address,
+                    router_address=job["router_address"],
                     from_token=from_token,
-                    amount_in_wei=amount_in_wei,
+                    amount_in_wei=job["amount_in_wei"],
                     max_fee_per_gas=max_fee_per_gas,
                     max_priority_fee_per_gas=max_priority_fee_per_gas  # pass in the from
                     )
             except Exception as e:
-                self.console.log(f"[bold red]{sender}: Error during batch processing: {e}[/bold red]")
+                wallet_log.append(f"[bold red]{sender}: Error during batch processing: {e}[/bold red]")
+                self._flush_log_buffer(wallet_log)
                 continue
 
+        self._save_allowance_cache()
+
     def run(self):
         """Run the SwapManager."""
         # Let user pick how to load private keys
@@ -1737,13 +2059,17 @@ class SwapManager:
         self._log_loaded_tokens()
 
         # Ask swap mode
-        mode = questionary.select(
-            "Choose swap mode:",
-            choices=[
-                "Batch swap (one setup for all wallets)",
-                "Single-threaded swap (configure each wallet)"
-            ]
-        ).ask()
+        mode_cfg = str(self._auto_answer("mode") or "").lower()
+        if mode_cfg in ("batch", "single"):
+            mode = "Batch swap" if mode_cfg == "batch" else "Single-threaded swap"
+        else:
+            mode = questionary.select(
+                "Choose swap mode:",
+                choices=[
+                    "Batch swap (one setup for all wallets)",
+                    "Single-threaded swap (configure each wallet)"
+                ]
+            ).ask()
 
         if mode.startswith("Batch swap"):
             self.start_swaps_batch()
@@ -1751,32 +2077,57 @@ class SwapManager:
             self.start_swaps()
 
 
+# Canonical chain name -> config mapping; also the single source for the
+# selection prompt and for validating non-interactive chain arguments.
+# Chains missing from config are dropped entirely so a present-but-None
+# entry can never reach SwapManager.
+_CHAINS = {
+    name: cfg
+    for name in ("POLYGON", "OP", "Base", "ARB", "Linea", "ETHER")
+    if (cfg := getattr(config, name, None)) is not None
+}
+
+
+def _load_auto_config(path: str) -> dict:
+    """Load a YAML (or JSON, which YAML parses) answers file for --config."""
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError("PyYAML is required for --config; install it with 'pip install pyyaml'")
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    if not isinstance(data, dict):
+        raise RuntimeError(f"Config file {path} must contain a mapping of prompt answers")
+    return data
+
+
 def main():
     """
     Main entry point. Prompt the user for which chain to use, then run the SwapManager with that chain config.
+
+    With --config batch.yaml every prompt answered in the file is skipped,
+    allowing fully scripted batch runs (see batch.example.yaml).
     """
-    chain_choices = ["POLYGON", "OP", "Base", "ARB", "Linea", "ETHER"]
-    chain_selection = questionary.select("Select chain:", choices=chain_choices).ask()
-
-    # Dynamically pick the chain config
-    if chain_selection == "POLYGON":
-        chain_config = config.POLYGON
-    elif chain_selection == "OP":
-        chain_config = config.OP
-    elif chain_selection == "Base":
-        chain_config = config.Base
-    elif chain_selection == "ARB":
-        chain_config = config.ARB
-    elif chain_selection == "Linea":
-        chain_config = config.Linea
-    elif chain_selection == "ETHER":
-        chain_config = config.ETHER
-    else:
-        # fallback
-        chain_config = config.POLYGON
+    import argparse
+
+    parser = argparse.ArgumentParser(description="KyberSwap batch swapper")
+    parser.add_argument("--config", metavar="PATH", default=None,
+                        help="YAML file with pre-answered prompts for non-interactive runs")
+    parser.add_argument("--chain", default=None, choices=list(_CHAINS),
+                        help="Chain to use (skips the chain prompt)")
+    args, _ = parser.parse_known_args()
+
+    auto_config = {}
+    if args.config:
+        auto_config = _load_auto_config(args.config)
+
+    chain_selection = args.chain or auto_config.get("chain")
+    if chain_selection not in _CHAINS:
+        chain_selection = questionary.select("Select chain:", choices=list(_CHAINS)).ask()
+    chain_config = _CHAINS.get(chain_selection, config.POLYGON)
 
     # Initialize and run
-    swap_manager = SwapManager(chain_config=chain_config)
+    swap_manager = SwapManager(chain_config=chain_config, auto_config=auto_config)
     swap_manager.run()
 
 
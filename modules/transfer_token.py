@@ -1,10 +1,18 @@
 import os, sys, json, time, logging, platform
+import random
+import re
+import threading
+from decimal import Decimal
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Tuple, Optional, Set
 
 import requests
+from requests.adapters import HTTPAdapter
 import questionary
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.table import Table
 from rich.progress import Progress, BarColumn, TimeElapsedColumn, TimeRemainingColumn
 
 from web3 import Web3
@@ -17,14 +25,84 @@ from utils.helper import Web3Helper, FileHelper, NATIVE_SENTINEL
 
 import config  # your config.py
 
+try:  # optional: orjson cuts JSON encode/decode time ~2-5x on the RPC hot path
+    import orjson
+
+    def _json_loads(data: bytes) -> object:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data: bytes) -> object:
+        return json.loads(data)
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 console = Console()
 
 
 
+def _sign_raw_tx(private_key: str, tx: dict) -> bytes:
+    """Sign a transaction dict and return the raw RLP bytes.
+
+    Kept at module level (picklable) so signing can be farmed out to worker
+    processes; eth-account's pure-Python ECDSA otherwise serializes on the GIL.
+    """
+    return Account.sign_transaction(tx, private_key).rawTransaction
+
+
+@lru_cache(maxsize=8192)
+def _checksum_cached(addr_lower: str) -> str:
+    """Checksum an already-lowercased address, memoized.
+
+    to_checksum_address keccak-hashes its input on every call; the same few
+    dozen addresses get normalized hundreds of times per run, so cache them.
+    """
+    return Web3.to_checksum_address(addr_lower)
+
+
 GAS_ERROR_HINTS = (
     "base fee", "underpriced", "fee cap", "max fee", "intrinsic gas too low",
     "replacement transaction underpriced", "max priority", "fee too low", "EIP-1559"
 )
+# One compiled alternation scans the message once instead of a Python-level
+# substring search per hint.
+_GAS_ERR_RE = re.compile("|".join(map(re.escape, GAS_ERROR_HINTS)), re.IGNORECASE)
+
+# Escalation ladder for gas-related send failures: (fee tier, multiplier)
+# per attempt, with exponential backoff between attempts so the retry does
+# not hit the same congested block the first submission did.
+GAS_RETRY_LADDER = (("medium", 1.0), ("high", 1.0), ("high", 1.25))
+
+# Minimal disperse-style batcher interface (disperse.app and its clones share
+# it). One call fans a sender's transfers out to up to BATCH_TRANSFER_CHUNK
+# recipients, so the 21k base cost is paid per chunk instead of per receiver.
+BATCH_TRANSFER_ABI = [
+    {
+        "type": "function",
+        "name": "disperseToken",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "token", "type": "address"},
+            {"name": "recipients", "type": "address[]"},
+            {"name": "values", "type": "uint256[]"},
+        ],
+        "outputs": [],
+    },
+    {
+        "type": "function",
+        "name": "disperseEther",
+        "stateMutability": "payable",
+        "inputs": [
+            {"name": "recipients", "type": "address[]"},
+            {"name": "values", "type": "uint256[]"},
+        ],
+        "outputs": [],
+    },
+]
+BATCH_TRANSFER_CHUNK = 100
 
 class BatchTransferManager:
     def __init__(self, chain_config):
@@ -41,7 +119,7 @@ class BatchTransferManager:
         self.infura_gas_api = chain_config.INFURA_GAS_API_URL
 
         # --- logging
-        logging.basicConfig(level=logging.INFO, handlers=[RichHandler(console=self.console)])
+        logging.basicConfig(level=logging.INFO, handlers=[RichHandler(console=self.console, show_path=False)])
         self.logger = logging.getLogger(__name__)
 
         # --- helper-backed web3 wiring
@@ -51,8 +129,60 @@ class BatchTransferManager:
         self.multicall = self.web3h.multicall
         self.erc20_abi = self.web3h.erc20_abi
 
+        # Optional per-chain disperse-style batcher; when unset every transfer
+        # ships as its own transaction.
+        self.batch_transfer_address = getattr(chain_config, "BATCH_TRANSFER_ADDRESS", None)
+
         self.is_linux = platform.system().lower() == "linux"
 
+        # Shared HTTP session for hand-rolled JSON-RPC batches and the gas
+        # oracle (keep-alive, one TCP/TLS setup per run instead of per
+        # request), with the pool sized for concurrent sender workers.
+        self._rpc_session = requests.Session()
+        _adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self._rpc_session.mount("http://", _adapter)
+        self._rpc_session.mount("https://", _adapter)
+
+        # Gas-oracle cache: tier -> (monotonic fetch time, max_fee, max_prio).
+        # A failed fetch is negative-cached briefly so a batch doesn't hammer
+        # the API during an outage.
+        self._gas_cache: Dict[str, Tuple[float, int, int]] = {}
+        self._gas_fail_at: float = 0.0
+        # Per-chain override of the fee-quote TTL: fast chains want fresher
+        # fees, slower ones can stretch one quote across more of a burst.
+        ttl_override = getattr(chain_config, "GAS_CACHE_TTL", None)
+        if ttl_override:
+            self.GAS_CACHE_TTL = float(ttl_override)
+
+        # Gas limit per token contract: transfer() costs the same for every
+        # receiver of a given token (modulo the cold-slot surcharge, covered
+        # by the headroom below), so estimate once and reuse.
+        self._gas_limit_cache: Dict[str, int] = {}
+
+        # Raw input string -> normalized key, so the hot _coerce_address_key
+        # path is one dict hit with no strip/lower/try-except machinery.
+        self._addr_key_memo: Dict[str, str] = {}
+
+        # Derived accounts per private key (secp256k1 derivation is ~2 ms a
+        # call, and the dispatch loop touches the same keys repeatedly) and a
+        # lazily created process pool that keeps ECDSA signing off the GIL.
+        self._account_cache: Dict[str, Account] = {}
+        self._sign_pool: Optional[ProcessPoolExecutor] = None
+        self._sign_pool_failed = False
+
+        # ENS reverse-lookup caches: resolved names are kept for an hour,
+        # misses are re-tried only after a minute so addresses without a
+        # reverse record don't trigger a resolver call on every preview row.
+        self._ens_hit: Dict[str, Tuple[float, str]] = {}
+        self._ens_miss: Dict[str, float] = {}
+
+        # Receipt watcher shared by all in-flight transactions: one background
+        # thread checks the block number and batch-fetches receipts per new
+        # block instead of each waiter running its own polling loop.
+        self._receipt_futures: Dict[str, Future] = {}
+        self._receipt_lock = threading.Lock()
+        self._receipt_thread: Optional[threading.Thread] = None
+
         # --- in-memory
         self.wallet_private_keys: List[str] = []
         # sender_addresses: addresses derived from loaded private keys (senders only)
@@ -68,7 +198,10 @@ class BatchTransferManager:
         self.token_modes: Dict[str, str] = {}
 
         # Prefetch caches (filled via Web3Helper.multicall_fetch)
-        self.prefetched_balances: Dict[Tuple[str, str], Optional[int]] = {}
+        # Balances stored as token -> {wallet -> value} rows: the hot loops
+        # fix one token and sweep wallets, so each lookup hashes one short
+        # string instead of a two-string tuple.
+        self.prefetched_balance_rows: Dict[str, Dict[str, Optional[int]]] = {}
         self.prefetched_decimals: Dict[str, int] = {}
         self.prefetched_names: Dict[str, str] = {}
         self.prefetched_symbols: Dict[str, str] = {}
@@ -83,6 +216,11 @@ class BatchTransferManager:
             except Exception as e:
                 self.console.log(f"[yellow]Could not ensure placeholder {kind} file {path_item}: {e}[/yellow]")
 
+        # Persistent token-metadata cache: decimals/name/symbol are immutable
+        # for a (chain, token) pair, so later runs skip those RPC reads.
+        self._meta_cache_path = os.path.join(str(config.BASE_PATH), f".token_meta_{self.chain_id}.json")
+        self._meta_cache: Dict[str, dict] = self._load_meta_cache()
+
     # ---- PK loaders (like Kyber) ----
 
     def load_private_keys_from_file(self):
@@ -267,12 +405,17 @@ class BatchTransferManager:
             mode = "erc20"
 
         try:
-            checksum = self.w3.to_checksum_address(target)
+            checksum = _checksum_cached(target.lower())
         except Exception:
             checksum = target
         return checksum, mode
 
     def _coerce_address_key(self, value) -> str:
+        memo_key = value if type(value) is str else None
+        if memo_key is not None:
+            hit = self._addr_key_memo.get(memo_key)
+            if hit is not None:
+                return hit
         candidate = value
         if isinstance(candidate, (list, tuple)):
             for item in candidate:
@@ -285,12 +428,71 @@ class BatchTransferManager:
             candidate = candidate.strip()
             if candidate:
                 try:
-                    return self.w3.to_checksum_address(candidate)
+                    result = _checksum_cached(candidate.lower())
                 except Exception:
-                    return candidate
-            return ""
-        return str(candidate)
-
+                    result = candidate
+            else:
+                result = ""
+        else:
+            result = str(candidate)
+        if memo_key is not None:
+            self._addr_key_memo[memo_key] = result
+        return result
+
+
+    def _allocate_plan(self, sender_remaining: Dict[str, int], per_receiver: int) -> Tuple[List[Tuple[str, str, int]], bool, int]:
+        """Allocate ``per_receiver`` units to every receiver from senders in order.
+
+        Two-pointer sweep over senders and receivers: O(S + R + plan) instead
+        of the nested O(S x R) greedy loops it replaces, with identical
+        allocation order. Mutates ``sender_remaining`` in place and returns
+        the (sender, receiver, amount) triples, whether every receiver was
+        fully funded, and the undistributed leftover. Already linear, so a
+        vectorized (R, S) allocation matrix buys nothing here — and token
+        amounts are uint256, which overflows int64 arrays anyway.
+        """
+        plan: List[Tuple[str, str, int]] = []
+        senders = self.sender_addresses
+        # Sweep over a parallel list: indexed int access in the inner loop
+        # instead of hashing the sender string on every touch. The dict is
+        # written back once at the end since callers read leftovers from it.
+        rem = [sender_remaining.get(s, 0) or 0 for s in senders]
+        # Leftover is tracked as allocations happen so callers never rescan
+        # the whole sender map just to report the remainder.
+        leftover = sum(rem)
+        si = 0
+        n = len(senders)
+        funded = True
+        for r in self.receiver_addresses:
+            remaining = per_receiver
+            while remaining > 0 and si < n:
+                avail = rem[si]
+                if avail <= 0:
+                    si += 1
+                    continue
+                send_amt = min(avail, remaining)
+                plan.append((senders[si], r, send_amt))
+                rem[si] = avail - send_amt
+                remaining -= send_amt
+                leftover -= send_amt
+                if rem[si] == 0:
+                    si += 1
+            if remaining > 0:
+                funded = False
+                break
+        for s, v in zip(senders, rem):
+            sender_remaining[s] = v
+        return plan, funded, leftover
+
+    @staticmethod
+    def _units_to_wei(units: str, decimals: int) -> int:
+        """Convert a user-entered token amount to base units exactly.
+
+        float carries 15-17 significant digits, so int(float(x) * 10**18)
+        silently mangles 18-decimal amounts; Decimal keeps the conversion
+        exact. Raises on unparseable input like float() did.
+        """
+        return int(Decimal(str(units).strip()) * (Decimal(10) ** decimals))
 
     def _fetch_token_decimals(self, token_address: str) -> int:
         try:
@@ -302,15 +504,44 @@ class BatchTransferManager:
         except Exception:
             return 18
 
-    def prefetch_wallet_token_metadata(self) -> None:
-        # Require senders and tokens to prefetch; wallet_addresses may include receivers as well
+    def _load_meta_cache(self) -> Dict[str, dict]:
+        try:
+            with open(self._meta_cache_path, "r") as fh:
+                data = json.load(fh)
+            if isinstance(data, dict):
+                return {k: v for k, v in data.items() if isinstance(v, dict)}
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            self.console.log(f"[yellow]Could not load token metadata cache: {exc}[/yellow]")
+        return {}
+
+    def _save_meta_cache(self) -> None:
+        try:
+            with open(self._meta_cache_path, "w") as fh:
+                json.dump(self._meta_cache, fh)
+        except Exception as exc:
+            self.console.log(f"[yellow]Could not save token metadata cache: {exc}[/yellow]")
+
+    def prefetch_wallet_token_metadata(self, wallets: Optional[List[str]] = None) -> None:
+        # Require senders and tokens to prefetch; wallet_addresses may include receivers as well.
+        # An explicit ``wallets`` snapshot lets the background prefetch run on the
+        # senders alone while the receiver prompt is still open.
         if not self.sender_addresses or not self.token_addresses:
             self.prefetch_ready = False
             return
+        snapshot_mode = wallets is not None
+        wallets = list(wallets) if snapshot_mode else list(self.wallet_addresses)
+
+        # Only request immutable metadata the on-disk cache doesn't cover yet
+        # (the multicall flags are all-or-nothing per field).
+        need_decimals = any("decimals" not in self._meta_cache.get(t, {}) for t in self.token_addresses)
+        need_names = any(not self._meta_cache.get(t, {}).get("name") for t in self.token_addresses)
+        need_symbols = any(not self._meta_cache.get(t, {}).get("symbol") for t in self.token_addresses)
 
         try:
             result = self.web3h.multicall_fetch(
-                wallets=self.wallet_addresses,
+                wallets=wallets,
                 tokens=self.token_addresses,
                 spender=None,
                 # Do not pass helper.ens_names here to avoid polluting sender wallets
@@ -318,11 +549,11 @@ class BatchTransferManager:
                 ens_names=None,
                 use_multicall=True,
                 want_balance=True,
-                want_decimals=True,
+                want_decimals=need_decimals,
                 want_allowance=False,
                 want_ens=True,
-                with_name=True,
-                with_symbol=True,
+                with_name=need_names,
+                with_symbol=need_symbols,
             )
         except Exception as exc:
             self.console.log(f"[yellow]Multicall prefetch failed: {exc}[/yellow]")
@@ -330,7 +561,22 @@ class BatchTransferManager:
             return
 
         wallets_resolved = result.get("wallets_resolved", []) or []
-        if wallets_resolved:
+        # In snapshot mode the receiver prompt may still be mutating
+        # wallet_addresses on the main thread, so leave it alone; nothing new
+        # can appear anyway since no ENS names were passed.
+        if wallets_resolved and not snapshot_mode:
+            # The merge is a no-op in the common case: multicall_fetch echoes
+            # back the wallets we passed in, so only bother when it actually
+            # surfaced an address we have not seen yet.
+            known = {str(a).lower() for a in self.wallet_addresses}
+            resolved_set = {str(a).lower() for a in wallets_resolved if a}
+            balance_wallets = {
+                str(w).lower() for w, _ in (result.get("balances", {}) or {}).keys()
+            }
+            if resolved_set <= known and balance_wallets <= known:
+                wallets_resolved = []
+
+        if wallets_resolved and not snapshot_mode:
             merged_wallets: List[str] = []
             seen: Set[str] = set()
 
@@ -364,51 +610,89 @@ class BatchTransferManager:
         ens_rev_raw = result.get("ens_reverse", {}) or {}
         ens_fwd_raw = result.get("ens_forward", {}) or {}
 
-        self.prefetched_balances = {}
+        # multicall_fetch checksums every wallet/token key it emits, and our
+        # own lists were normalized at load time; only genuinely unknown keys
+        # need another pass through _coerce_address_key.
+        trusted = set(self.token_addresses)
+        trusted.update(wallets)
+
+        def _norm(addr):
+            return addr if addr in trusted else self._coerce_address_key(addr)
+
+        self.prefetched_balance_rows = {}
         for (wallet, token), value in balances_raw.items():
-            w = self._coerce_address_key(wallet)
-            t = self._coerce_address_key(token)
-            self.prefetched_balances[(w, t)] = value
+            self.prefetched_balance_rows.setdefault(_norm(token), {})[_norm(wallet)] = value
 
         self.prefetched_decimals = {}
         for token, value in decimals_raw.items():
-            t = self._coerce_address_key(token)
             try:
-                self.prefetched_decimals[t] = int(value)
+                self.prefetched_decimals[_norm(token)] = int(value)
             except Exception:
                 pass
 
         self.prefetched_names = {}
         for token, value in names_raw.items():
-            t = self._coerce_address_key(token)
             if value:
-                self.prefetched_names[t] = value
+                self.prefetched_names[_norm(token)] = value
 
         self.prefetched_symbols = {}
         for token, value in symbols_raw.items():
-            t = self._coerce_address_key(token)
             if value:
-                self.prefetched_symbols[t] = value
+                self.prefetched_symbols[_norm(token)] = value
+
+        # Fill fields the multicall skipped from the on-disk cache, then fold
+        # anything newly fetched back into it.
+        meta_dirty = False
+        for token in self.token_addresses:
+            t = _norm(token)
+            meta = self._meta_cache.get(t, {})
+            if t not in self.prefetched_decimals and "decimals" in meta:
+                self.prefetched_decimals[t] = meta["decimals"]
+            if t not in self.prefetched_names and meta.get("name"):
+                self.prefetched_names[t] = meta["name"]
+            if t not in self.prefetched_symbols and meta.get("symbol"):
+                self.prefetched_symbols[t] = meta["symbol"]
+            for field, store in (
+                ("decimals", self.prefetched_decimals),
+                ("name", self.prefetched_names),
+                ("symbol", self.prefetched_symbols),
+            ):
+                value = store.get(t)
+                if value is not None and meta.get(field) != value:
+                    self._meta_cache.setdefault(t, {})[field] = value
+                    meta_dirty = True
+        if meta_dirty:
+            self._save_meta_cache()
 
         self.prefetched_ens_reverse = {}
         for wallet, name in ens_rev_raw.items():
-            w = self._coerce_address_key(wallet)
             if name:
-                self.prefetched_ens_reverse[w] = name
-
-        for addr, name in self.receiver_ens_map.items():
-            key = self._coerce_address_key(addr)
-            if key and name and key not in self.prefetched_ens_reverse:
-                self.prefetched_ens_reverse[key] = name
+                self.prefetched_ens_reverse[_norm(wallet)] = name
 
         enriched_forward = dict(ens_fwd_raw)
-        for addr, name in self.receiver_ens_map.items():
-            if not name:
-                continue
-            if name not in enriched_forward:
-                enriched_forward[name] = self._coerce_address_key(addr)
+        # In snapshot mode the receiver prompt may still be inserting into
+        # receiver_ens_map on the main thread, so iterating it here can die
+        # with "dictionary changed size during iteration";
+        # _merge_receiver_ens folds it in after the join instead.
+        if not snapshot_mode:
+            for addr, name in self.receiver_ens_map.items():
+                key = self._coerce_address_key(addr)
+                if key and name and key not in self.prefetched_ens_reverse:
+                    self.prefetched_ens_reverse[key] = name
+            for addr, name in self.receiver_ens_map.items():
+                if not name:
+                    continue
+                if name not in enriched_forward:
+                    enriched_forward[name] = self._coerce_address_key(addr)
         self.prefetched_ens_forward = enriched_forward
         self.web3h.ens_names = list(enriched_forward.keys())
+
+        # Warm the reverse-lookup cache so preview rows never re-resolve
+        # addresses the multicall already covered.
+        now = time.monotonic()
+        for addr, name in self.prefetched_ens_reverse.items():
+            self._ens_cache_put(self._ens_hit, addr, (now, name))
+
         self.prefetch_ready = True
 
         self._build_token_selection_map()
@@ -437,36 +721,280 @@ class BatchTransferManager:
             self.tokens[label] = checksum
 
     # ---------------- ENS reverse
+    ENS_HIT_TTL = 3600.0   # seconds a resolved name stays cached
+    ENS_MISS_TTL = 60.0    # seconds before retrying an address with no record
+    ENS_CACHE_MAX = 4096   # entries per cache before oldest are evicted
+
+    def _ens_cache_put(self, cache: dict, key: str, value) -> None:
+        """Insert into an ENS cache, evicting oldest entries past the cap.
+
+        Dicts iterate in insertion order, so dropping from the front is a
+        cheap approximation of LRU that keeps long runs from growing the
+        caches without bound.
+        """
+        if len(cache) >= self.ENS_CACHE_MAX:
+            for stale in list(cache.keys())[: len(cache) - self.ENS_CACHE_MAX + 1]:
+                cache.pop(stale, None)
+        cache[key] = value
+
     def reverse_ens(self, address: str) -> Optional[str]:
         if not address:
             return None
+        checksum = self._coerce_address_key(address)
+        if not checksum:
+            checksum = str(address)
+        now = time.monotonic()
+        hit = self._ens_hit.get(checksum)
+        if hit and now - hit[0] < self.ENS_HIT_TTL:
+            return hit[1]
+        miss_at = self._ens_miss.get(checksum)
+        if miss_at is not None and now - miss_at < self.ENS_MISS_TTL:
+            return None
         try:
-            result = self.web3h.batch_ens_reverse([address], use_multicall=True) or {}
+            result = self.web3h.batch_ens_reverse([checksum], use_multicall=True) or {}
         except Exception as exc:
             self.console.log(f"[yellow]ENS reverse lookup failed: {exc}[/yellow]")
+            self._ens_cache_put(self._ens_miss, checksum, now)
             return None
+        name = result.get(checksum) or result.get(checksum.lower()) or result.get(str(address))
+        if name:
+            self._ens_cache_put(self._ens_hit, checksum, (now, name))
+        else:
+            self._ens_cache_put(self._ens_miss, checksum, now)
+        return name
+
+    # ---------------- Batched JSON-RPC
+    def _json_rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Optional[object]]:
+        """Issue several JSON-RPC requests in a single HTTP POST.
+
+        ``calls`` is a list of (method, params) tuples. Returns each call's
+        ``result`` field (None for entries that errored), in input order.
+        One round-trip replaces len(calls) sequential provider calls.
+        """
+        if not calls:
+            return []
+        endpoint = getattr(self.provider, "endpoint_uri", None)
+        if not endpoint:
+            return [None] * len(calls)
+        payload = [
+            {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+            for idx, (method, params) in enumerate(calls)
+        ]
+        resp = self._rpc_session.post(
+            endpoint,
+            data=_json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        body = _json_loads(resp.content)
+        results: List[Optional[object]] = [None] * len(calls)
+        for entry in (body if isinstance(body, list) else []):
+            idx = entry.get("id")
+            if isinstance(idx, int) and 0 <= idx < len(calls) and "result" in entry:
+                results[idx] = entry["result"]
+        return results
+
+    def _fetch_missing_balances(self, wallets: List[str], token_key: str, native_mode: str) -> Dict[str, Optional[int]]:
+        """Fetch balances the multicall prefetch missed in one round-trip.
+
+        Prefers a single Multicall3 aggregate3 eth_call (native balances go
+        through getEthBalance on the multicall contract itself); drops to a
+        JSON-RPC batch of eth_getBalance / eth_call requests when the
+        multicall is unavailable.
+        """
+        out: Dict[str, Optional[int]] = {w: None for w in wallets}
+        mc = getattr(self.web3h, "multicall", None)
+        if mc is not None:
+            try:
+                if native_mode == "true-native":
+                    target = mc.address
+                    selector = bytes.fromhex("4d2301cc")  # getEthBalance(address)
+                else:
+                    target = token_key
+                    selector = bytes.fromhex("70a08231")  # balanceOf(address)
+                agg_calls = [
+                    (target, selector + bytes(12) + bytes.fromhex(w[2:]))
+                    for w in wallets
+                ]
+                res = self.web3h._aggregate3(agg_calls, allow_failure=True)
+                if res:
+                    for wallet, (ok, data) in zip(wallets, res):
+                        if ok and data:
+                            try:
+                                out[wallet] = int.from_bytes(data[-32:], "big")
+                            except Exception:
+                                pass
+                    return out
+            except Exception as exc:
+                self.console.log(f"[yellow]Multicall balance fallback failed: {exc}[/yellow]")
+        if native_mode == "true-native":
+            calls = [("eth_getBalance", [w, "latest"]) for w in wallets]
+        else:
+            calls = [
+                ("eth_call", [{
+                    "to": token_key,
+                    # balanceOf(address) selector + left-padded wallet argument
+                    "data": "0x70a08231" + w.lower().replace("0x", "").rjust(64, "0"),
+                }, "latest"])
+                for w in wallets
+            ]
         try:
-            checksum = self.w3.to_checksum_address(address)
-        except Exception:
-            checksum = self._coerce_address_key(address)
-        if not checksum:
-            checksum = str(address)
-        return result.get(checksum) or result.get(checksum.lower()) or result.get(str(address))
+            results = self._json_rpc_batch(calls)
+        except Exception as exc:
+            self.console.log(f"[yellow]Batched balance fallback failed: {exc}[/yellow]")
+            return out
+        for wallet, raw in zip(wallets, results):
+            if raw in (None, "0x"):
+                continue
+            try:
+                out[wallet] = int(raw, 16)
+            except (TypeError, ValueError):
+                pass
+        return out
 
     # ---------------- Gas + receipts
+    GAS_CACHE_TTL = 5.0   # seconds; roughly one block of fee drift
+    GAS_FAIL_TTL = 1.0    # negative-cache window after an API error
+
     def fetch_suggested_fees(self, tier: str) -> Tuple[Optional[int], Optional[int]]:
+        now = time.monotonic()
+        cached = self._gas_cache.get(tier)
+        if cached and now - cached[0] < self.GAS_CACHE_TTL:
+            return cached[1], cached[2]
+        if now - self._gas_fail_at < self.GAS_FAIL_TTL:
+            return None, None
         try:
-            r = requests.get(self.infura_gas_api)
+            r = self._rpc_session.get(self.infura_gas_api, timeout=3)
             r.raise_for_status()
-            data = r.json()
-            max_fee = Web3.to_wei(float(data[tier]["suggestedMaxFeePerGas"]), "gwei")
-            max_prio = Web3.to_wei(float(data[tier]["suggestedMaxPriorityFeePerGas"]), "gwei")
-            return max_fee, max_prio
+            data = _json_loads(r.content)
+            # One response carries every tier; cache them all so switching
+            # tiers (e.g. the 'medium' retry path) stays a dict lookup.
+            for level, fees in data.items():
+                if not isinstance(fees, dict):
+                    continue
+                try:
+                    mf = Web3.to_wei(float(fees["suggestedMaxFeePerGas"]), "gwei")
+                    mp = Web3.to_wei(float(fees["suggestedMaxPriorityFeePerGas"]), "gwei")
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._gas_cache[level] = (now, mf, mp)
+            cached = self._gas_cache.get(tier)
+            if cached:
+                return cached[1], cached[2]
+            raise KeyError(tier)
         except Exception as e:
             self.console.log(f"[red]Gas API error: {e}[/red]")
+            self._gas_fail_at = now
             return None, None
 
+    def _ensure_receipt_watcher(self) -> None:
+        with self._receipt_lock:
+            if self._receipt_thread is not None and self._receipt_thread.is_alive():
+                return
+            self._receipt_thread = threading.Thread(target=self._watch_receipts, daemon=True)
+            self._receipt_thread.start()
+
+    def _watch_receipts(self) -> None:
+        """Resolve receipt futures block-by-block with one batched RPC each.
+
+        Runs until no hashes are pending; restarted lazily by the next waiter.
+        """
+        last_block = -1
+        while True:
+            with self._receipt_lock:
+                if not self._receipt_futures:
+                    self._receipt_thread = None
+                    return
+                pending = list(self._receipt_futures.items())
+            try:
+                block = self.w3.eth.block_number
+            except Exception:
+                block = last_block
+            if block != last_block:
+                last_block = block
+                calls = [("eth_getTransactionReceipt", [h]) for h, _ in pending]
+                try:
+                    results = self._json_rpc_batch(calls)
+                except Exception:
+                    results = [None] * len(pending)
+                for (tx_key, fut), receipt in zip(pending, results):
+                    if not receipt:
+                        continue
+                    # Raw JSON-RPC receipts carry hex strings; normalize the
+                    # fields callers actually inspect.
+                    for field in ("status", "blockNumber"):
+                        value = receipt.get(field)
+                        if isinstance(value, str):
+                            try:
+                                receipt[field] = int(value, 16)
+                            except ValueError:
+                                pass
+                    with self._receipt_lock:
+                        self._receipt_futures.pop(tx_key, None)
+                    if not fut.done():
+                        fut.set_result(receipt)
+            time.sleep(2)
+
     def wait_receipt_slow(self, tx_hash, timeout=300, start_delay=2, max_delay=8):
+        """Wait for a receipt via the shared block-driven watcher.
+
+        All in-flight hashes share one watcher thread, so concurrent waits
+        cost one batched receipt query per new block rather than one polling
+        loop per transaction. Falls back to direct polling if the watcher
+        cannot start.
+        """
+        tx_key = tx_hash.hex() if hasattr(tx_hash, "hex") else str(tx_hash)
+        if not tx_key.startswith("0x"):
+            tx_key = "0x" + tx_key
+        fut: Future = Future()
+        try:
+            with self._receipt_lock:
+                self._receipt_futures[tx_key] = fut
+            self._ensure_receipt_watcher()
+        except Exception:
+            with self._receipt_lock:
+                self._receipt_futures.pop(tx_key, None)
+            return self._wait_receipt_polling(tx_hash, timeout, start_delay, max_delay)
+        try:
+            return fut.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._receipt_lock:
+                self._receipt_futures.pop(tx_key, None)
+            raise TimeExhausted(f"Transaction {tx_key} is not in the chain after {timeout} seconds")
+
+    def wait_receipts_slow(self, tx_hashes, timeout=300) -> Dict[str, Optional[dict]]:
+        """Wait for several receipts at once through the shared watcher.
+
+        Registers every hash up front so a single batched
+        eth_getTransactionReceipt poll per new block covers all of them.
+        Returns hash -> receipt, with None for transactions that did not
+        land within the timeout.
+        """
+        futures: Dict[str, Future] = {}
+        with self._receipt_lock:
+            for tx_hash in tx_hashes:
+                tx_key = tx_hash.hex() if hasattr(tx_hash, "hex") else str(tx_hash)
+                if not tx_key.startswith("0x"):
+                    tx_key = "0x" + tx_key
+                fut = self._receipt_futures.get(tx_key)
+                if fut is None:
+                    fut = Future()
+                    self._receipt_futures[tx_key] = fut
+                futures[tx_key] = fut
+        self._ensure_receipt_watcher()
+        deadline = time.monotonic() + timeout
+        out: Dict[str, Optional[dict]] = {}
+        for tx_key, fut in futures.items():
+            try:
+                out[tx_key] = fut.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                with self._receipt_lock:
+                    self._receipt_futures.pop(tx_key, None)
+                out[tx_key] = None
+        return out
+
+    def _wait_receipt_polling(self, tx_hash, timeout=300, start_delay=2, max_delay=8):
         delay = start_delay
         start = time.time()
         while True:
@@ -479,45 +1007,220 @@ class BatchTransferManager:
 
     # ------------- Multicall: one call for decimals + all balances
 
+    def _account_for(self, private_key: str):
+        acct = self._account_cache.get(private_key)
+        if acct is None:
+            acct = Account.from_key(private_key)
+            self._account_cache[private_key] = acct
+        return acct
+
+    def _get_sign_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._sign_pool is None and not self._sign_pool_failed:
+            try:
+                self._sign_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+            except Exception:
+                self._sign_pool_failed = True
+        return self._sign_pool
+
+    def _sign_tx_bytes(self, private_key: str, tx: dict) -> bytes:
+        """Sign through the shared process pool when available, inline otherwise.
+
+        Signing in a worker process releases the GIL, so concurrent sender
+        threads spend their time on RPC instead of queueing behind ECDSA.
+        """
+        pool = self._get_sign_pool()
+        if pool is not None:
+            try:
+                return pool.submit(_sign_raw_tx, private_key, dict(tx)).result()
+            except Exception:
+                self._sign_pool_failed = True
+                self._sign_pool = None
+        return _sign_raw_tx(private_key, tx)
+
     # ------------- ERC-20 / native sends (native sentinel -> use contract from config)
-    def send_erc20(self, private_key: str, token_address: str, to: str, amount_wei: int, max_fee: int, max_prio: int) -> str:
-        acct = Account.from_key(private_key)
-        # self.erc20_abi is already a loaded JSON object
-        erc20 = self.w3.eth.contract(address=self.w3.to_checksum_address(token_address), abi=self.erc20_abi)
-        tx = erc20.functions.transfer(self.w3.to_checksum_address(to), int(amount_wei)).build_transaction({
+    # transfer(address,uint256) -- fixed selector, no per-tx ABI dispatch
+    _TRANSFER_SELECTOR = bytes.fromhex("a9059cbb")
+
+    def _encode_transfer(self, to: str, amount_wei: int) -> bytes:
+        # transfer calldata is just selector + two left-padded 32-byte words;
+        # concatenating them directly skips the ABI codec dispatch per tx.
+        return (
+            self._TRANSFER_SELECTOR
+            + bytes.fromhex(self._coerce_address_key(to)[2:]).rjust(32, b"\x00")
+            + int(amount_wei).to_bytes(32, "big")
+        )
+
+    def send_erc20(self, private_key: str, token_address: str, to: str, amount_wei: int, max_fee: int, max_prio: int, nonce: Optional[int] = None) -> str:
+        acct = self._account_for(private_key)
+        token = self.w3.to_checksum_address(token_address)
+        tx = {
             "chainId": self.chain_id,
             "from": acct.address,
-            "nonce": self.w3.eth.get_transaction_count(acct.address),
+            "to": token,
+            "value": 0,
+            "data": self._encode_transfer(to, amount_wei),
+            "nonce": self.w3.eth.get_transaction_count(acct.address) if nonce is None else int(nonce),
             "type": 2,
             "maxFeePerGas": max_fee,
-            "maxPriorityFeePerGas": max_prio
-        })
-        try:
-            tx["gas"] = self.w3.eth.estimate_gas(tx)
-        except Exception:
-            tx["gas"] = 100000
-        signed = self.w3.eth.account.sign_transaction(tx, private_key)
-        return self.w3.eth.send_raw_transaction(signed.rawTransaction).hex()
+            "maxPriorityFeePerGas": max_prio,
+        }
+        gas = self._gas_limit_cache.get(token)
+        if gas is None:
+            try:
+                # 20% headroom covers receivers whose balance slot is cold
+                # (first transfer to an address costs an extra SSTORE).
+                gas = int(self.w3.eth.estimate_gas(tx) * 12 // 10)
+                self._gas_limit_cache[token] = gas
+            except Exception:
+                gas = 100000
+        tx["gas"] = gas
+        raw = self._sign_tx_bytes(private_key, tx)
+        return self.w3.eth.send_raw_transaction(raw).hex()
+
+    def _disperse_for_sender(self, pk: str, items: List[Tuple[str, int]], token_sel: str,
+                             native_mode: str, batcher, fees_for, nonce: Optional[int],
+                             progress, task) -> int:
+        """Ship one sender's transfers through the configured batcher contract.
+
+        Recipients ride in chunks of BATCH_TRANSFER_CHUNK per transaction, so
+        N transfers pay one base fee per chunk instead of one each. ERC-20
+        mode approves the batcher for the batch total first when the current
+        allowance falls short.
+        """
+        acct = self._account_for(pk)
+        sender_cs = acct.address
+        ok = 0
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(sender_cs, "pending")
+        erc20 = None
+        if native_mode != "true-native":
+            erc20 = self.w3.eth.contract(address=self.w3.to_checksum_address(token_sel), abi=self.erc20_abi)
+            total_needed = sum(a for _, a in items)
+            try:
+                allowance = erc20.functions.allowance(sender_cs, batcher.address).call()
+            except Exception:
+                allowance = 0
+            if allowance < total_needed:
+                try:
+                    max_fee, max_prio = fees_for()
+                    tx = erc20.functions.approve(batcher.address, total_needed).build_transaction({
+                        "chainId": self.chain_id,
+                        "from": sender_cs,
+                        "nonce": nonce,
+                        "type": 2,
+                        "maxFeePerGas": max_fee,
+                        "maxPriorityFeePerGas": max_prio,
+                    })
+                    raw = self._sign_tx_bytes(pk, tx)
+                    txh = self.w3.eth.send_raw_transaction(raw).hex()
+                    nonce += 1
+                    self.console.log(f"[cyan]Approve tx for batcher: {txh}[/cyan]")
+                    rcpt = self.wait_receipt_slow(txh)
+                    if not rcpt or rcpt.get("status", 0) != 1:
+                        raise RuntimeError("approve reverted")
+                except Exception as e:
+                    self.console.log(f"[red]Batcher approval failed for {sender_cs}: {e}[/red]")
+                    progress.advance(task, len(items))
+                    return 0
+        for start in range(0, len(items), BATCH_TRANSFER_CHUNK):
+            chunk = items[start:start + BATCH_TRANSFER_CHUNK]
+            recipients = [self.w3.to_checksum_address(r) for r, _ in chunk]
+            values = [int(a) for _, a in chunk]
+            try:
+                max_fee, max_prio = fees_for()
+                params = {
+                    "chainId": self.chain_id,
+                    "from": sender_cs,
+                    "nonce": nonce,
+                    "type": 2,
+                    "maxFeePerGas": max_fee,
+                    "maxPriorityFeePerGas": max_prio,
+                }
+                if native_mode == "true-native":
+                    params["value"] = sum(values)
+                    tx = batcher.functions.disperseEther(recipients, values).build_transaction(params)
+                else:
+                    tx = batcher.functions.disperseToken(erc20.address, recipients, values).build_transaction(params)
+                raw = self._sign_tx_bytes(pk, tx)
+                txh = self.w3.eth.send_raw_transaction(raw).hex()
+                nonce += 1
+                self.console.log(f"[green]Disperse tx ({len(chunk)} transfers): {txh}[/green]")
+                rcpt = self.wait_receipt_slow(txh)
+                if rcpt and rcpt.get("status", 0) == 1:
+                    ok += len(chunk)
+                else:
+                    self.console.log(f"[red]Disperse tx failed in block {rcpt.get('blockNumber')}[/red]")
+            except Exception as e:
+                self.console.log(f"[red]Disperse error for {sender_cs}: {e}[/red]")
+            finally:
+                progress.advance(task, len(chunk))
+        return ok
+
+    def _merge_receiver_ens(self) -> None:
+        """Fold receiver reverse-ENS data in after the background prefetch.
+
+        The sender/token multicall starts before receivers are entered, so
+        receiver addresses get their reverse records resolved here (one
+        batched lookup) and labels from the receiver input merged on top.
+        """
+        receivers = [self._coerce_address_key(r) for r in self.receiver_addresses]
+        unknown = [r for r in receivers if r and r not in self.prefetched_ens_reverse]
+        if unknown:
+            try:
+                resolved = self.web3h.batch_ens_reverse(unknown, use_multicall=True) or {}
+            except Exception as exc:
+                self.console.log(f"[yellow]ENS reverse lookup failed: {exc}[/yellow]")
+                resolved = {}
+            now = time.monotonic()
+            for addr, name in resolved.items():
+                key = self._coerce_address_key(addr)
+                if key and name:
+                    self.prefetched_ens_reverse[key] = name
+                    self._ens_cache_put(self._ens_hit, key, (now, name))
+        for addr, name in self.receiver_ens_map.items():
+            key = self._coerce_address_key(addr)
+            if key and name and key not in self.prefetched_ens_reverse:
+                self.prefetched_ens_reverse[key] = name
+            if name and name not in self.prefetched_ens_forward:
+                self.prefetched_ens_forward[name] = key
 
     # ------------- Main flow
     def run(self):
         # Keys input (helper-backed)
         self.select_private_key_input_method()
-        self.select_receiver_input_method()
         self.select_token_input_method()
 
         if not self.wallet_private_keys:
             self.console.log("[bold red]No private keys loaded. Exiting.[/bold red]")
             return
-        if not self.receiver_addresses:
-            self.console.log("[bold red]No receiver addresses loaded. Exiting.[/bold red]")
-            return
         if not self.token_addresses:
             self.console.log("[bold red]No token addresses provided. Exiting.[/bold red]")
             return
 
+        # Senders and tokens are known now, so run the multicall prefetch in
+        # the background while the user is still answering the receiver
+        # prompt: the RPC latency hides behind think-time.
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        prefetch_future = prefetch_pool.submit(
+            self.prefetch_wallet_token_metadata, list(self.sender_addresses)
+        )
+
+        try:
+            self.select_receiver_input_method()
+        except Exception:
+            prefetch_pool.shutdown(wait=False)
+            raise
+        if not self.receiver_addresses:
+            self.console.log("[bold red]No receiver addresses loaded. Exiting.[/bold red]")
+            prefetch_pool.shutdown(wait=False)
+            return
+
         self.console.rule("[bold cyan]Prefetching wallet/token data[/bold cyan]")
-        self.prefetch_wallet_token_metadata()
+        try:
+            prefetch_future.result()
+        finally:
+            prefetch_pool.shutdown(wait=False)
+        self._merge_receiver_ens()
         if not self.tokens:
             # fallback labels if multicall failed
             fallback = {}
@@ -533,28 +1236,31 @@ class BatchTransferManager:
                 fallback[label] = checksum
             self.tokens = fallback
 
+        # Normalize each address once and render each listing section with a
+        # single console write instead of one log call (markup + style pass)
+        # per row.
+        sender_keys = [self._coerce_address_key(w) for w in self.sender_addresses]
+        receiver_keys = [self._coerce_address_key(r) for r in self.receiver_addresses]
+
         self.console.rule("[bold cyan]Wallets loaded[/bold cyan]")
-        for idx, wallet in enumerate(self.sender_addresses, 1):
-            wallet_cs = self._coerce_address_key(wallet)
+        lines = []
+        for idx, wallet_cs in enumerate(sender_keys, 1):
             ens = self.prefetched_ens_reverse.get(wallet_cs)
-            if ens:
-                self.console.log(f"{idx:>2}. {wallet_cs} ({ens})")
-            else:
-                self.console.log(f"{idx:>2}. {wallet_cs}")
+            lines.append(f"{idx:>2}. {wallet_cs} ({ens})" if ens else f"{idx:>2}. {wallet_cs}")
+        if lines:
+            self.console.print("\n".join(lines), markup=False, highlight=False)
 
         self.console.rule("[bold cyan]Receivers loaded[/bold cyan]")
-        for idx, rcv in enumerate(self.receiver_addresses, 1):
-            rcv_cs = self._coerce_address_key(rcv)
+        lines = []
+        for idx, rcv_cs in enumerate(receiver_keys, 1):
             ens = self.prefetched_ens_reverse.get(rcv_cs) or self.receiver_ens_map.get(rcv_cs)
-            if not ens and rcv_cs in self.receiver_ens_map:
-                ens = self.receiver_ens_map.get(rcv_cs)
-            if ens:
-                self.console.log(f"{idx:>2}. {rcv_cs} (ENS: {ens})")
-            else:
-                self.console.log(f"{idx:>2}. {rcv_cs}")
+            lines.append(f"{idx:>2}. {rcv_cs} (ENS: {ens})" if ens else f"{idx:>2}. {rcv_cs}")
+        if lines:
+            self.console.print("\n".join(lines), markup=False, highlight=False)
 
         self.console.rule("[bold cyan]Tokens loaded[/bold cyan]")
         seen_tokens = set()
+        lines = []
         for idx, token in enumerate(self.token_addresses, 1):
             token_cs = self._coerce_address_key(token)
             if token_cs in seen_tokens:
@@ -567,9 +1273,11 @@ class BatchTransferManager:
             descriptor = " / ".join(dict.fromkeys(pieces)) if pieces else ""
             extra = f" | decimals: {decimals_cache}" if decimals_cache is not None else ""
             if descriptor:
-                self.console.log(f"{idx:>2}. {token_cs} ({descriptor}){extra}")
+                lines.append(f"{idx:>2}. {token_cs} ({descriptor}){extra}")
             else:
-                self.console.log(f"{idx:>2}. {token_cs}{extra}")
+                lines.append(f"{idx:>2}. {token_cs}{extra}")
+        if lines:
+            self.console.print("\n".join(lines), markup=False, highlight=False)
 
         token_label = questionary.select(
             "Select token to transfer:",
@@ -586,28 +1294,24 @@ class BatchTransferManager:
             if decimals is None:
                 decimals = self._fetch_token_decimals(token_sel)
 
+        # Sender balances never cost one RPC each: the background multicall
+        # prefetch covers the common case and any stragglers are fetched in a
+        # single aggregate3 (or batched JSON-RPC) round-trip below.
         token_key = self._coerce_address_key(token_sel)
         balances: Dict[str, Optional[int]] = {}
-        for wallet in self.sender_addresses:
-            wallet_key = self._coerce_address_key(wallet)
-            bal = self.prefetched_balances.get((wallet_key, token_key))
+        missing: List[str] = []
+        balance_row = self.prefetched_balance_rows.get(token_key) or {}
+        for wallet_key in sender_keys:
+            bal = balance_row.get(wallet_key)
             if bal is None:
-                if native_mode == "true-native":
-                    try:
-                        bal = self.w3.eth.get_balance(wallet_key)
-                    except Exception:
-                        bal = None
-                else:
-                    try:
-                        contract = self.w3.eth.contract(address=token_key, abi=self.erc20_abi)
-                        bal = contract.functions.balanceOf(wallet_key).call()
-                    except Exception:
-                        bal = None
+                missing.append(wallet_key)
             balances[wallet_key] = bal
+        if missing:
+            balances.update(self._fetch_missing_balances(missing, token_key, native_mode))
 
         self.console.rule("[bold]Sender Balances[/bold]")
-        for wallet in self.sender_addresses:
-            wallet_key = self._coerce_address_key(wallet)
+        lines = []
+        for wallet_key in sender_keys:
             bal = balances.get(wallet_key)
             ens = self.prefetched_ens_reverse.get(wallet_key)
             label = f"{ens} -> {wallet_key}" if ens else wallet_key
@@ -618,7 +1322,9 @@ class BatchTransferManager:
                     bal_hr = bal / (10 ** decimals)
                 except Exception:
                     bal_hr = "N/A"
-            self.console.print(f"[blue]{label}[/blue]: {bal_hr}")
+            lines.append(f"[blue]{label}[/blue]: {bal_hr}")
+        if lines:
+            self.console.print("\n".join(lines), highlight=False)
 
         # Mode
         mode = questionary.select("Choose transfer mode:", choices=["Same number (1-to-1)", "Multi-number (multi-to-many)"]).ask()
@@ -634,7 +1340,7 @@ class BatchTransferManager:
             if amt_mode.startswith("Enter fixed"):
                 amt = questionary.text("Enter fixed amount for EACH pair (token units):").ask()
                 try:
-                    amt_wei = int(float(amt) * (10 ** decimals))
+                    amt_wei = self._units_to_wei(amt, decimals)
                 except Exception:
                     self.console.log("[red]Invalid amount[/red]"); return
                 for s, r in zip(self.sender_addresses, self.receiver_addresses):
@@ -672,28 +1378,16 @@ class BatchTransferManager:
                 if amt_mode.startswith("Enter fixed"):
                     per_recv_units = questionary.text("Enter amount PER RECEIVER (token units):").ask()
                     try:
-                        per_recv = int(float(per_recv_units) * (10 ** decimals))
+                        per_recv = self._units_to_wei(per_recv_units, decimals)
                     except Exception:
                         self.console.log("[red]Invalid amount[/red]"); return
 
                     # sequentially allocate from senders to fund each receiver equally
-                    targets = {r: per_recv for r in self.receiver_addresses}
                     sender_remaining = {s: balances.get(self._coerce_address_key(s), 0) or 0 for s in self.sender_addresses}
-                    for r in self.receiver_addresses:
-                        remaining = targets[r]
-                        for s in self.sender_addresses:
-                            if remaining == 0:
-                                break
-                            avail = sender_remaining[s]
-                            if avail <= 0:
-                                continue
-                            send_amt = min(avail, remaining)
-                            if send_amt > 0:
-                                plan.append((s, r, send_amt))
-                                sender_remaining[s] -= send_amt
-                                remaining -= send_amt
-                        if remaining > 0:
-                            self.console.log("[red]Insufficient total balance to fund all receivers equally.[/red]"); return
+                    alloc, funded, _ = self._allocate_plan(sender_remaining, per_recv)
+                    if not funded:
+                        self.console.log("[red]Insufficient total balance to fund all receivers equally.[/red]"); return
+                    plan.extend(alloc)
 
                 else:
                     # % of EACH sender's balance, aggregated then spread equally
@@ -712,20 +1406,8 @@ class BatchTransferManager:
                     if per_receiver == 0:
                         self.console.log("[red]Per-receiver share is zero; increase %[/red]"); return
                     sender_remaining = per_sender_amt.copy()
-                    for r in self.receiver_addresses:
-                        remaining = per_receiver
-                        for s in self.sender_addresses:
-                            if remaining == 0:
-                                break
-                            avail = sender_remaining[s]
-                            if avail <= 0:
-                                continue
-                            send_amt = min(avail, remaining)
-                            if send_amt > 0:
-                                plan.append((s, r, send_amt))
-                                sender_remaining[s] -= send_amt
-                                remaining -= send_amt
-                    leftover = sum(sender_remaining.values())
+                    alloc, _, leftover = self._allocate_plan(sender_remaining, per_receiver)
+                    plan.extend(alloc)
                     if leftover > 0:
                         self.console.log("[yellow]Note: remainder not distributed due to integer division.[/yellow]")
 
@@ -738,7 +1420,7 @@ class BatchTransferManager:
                 if in_mode.startswith("Enter fixed"):
                     unit = questionary.text("Enter fixed AMOUNT per sender (token units):").ask()
                     try:
-                        per_sender_amt = int(float(unit) * (10 ** decimals))
+                        per_sender_amt = self._units_to_wei(unit, decimals)
                     except Exception:
                         self.console.log("[red]Invalid amount[/red]"); return
                     total_sum = per_sender_amt * len(self.sender_addresses)
@@ -765,20 +1447,8 @@ class BatchTransferManager:
                 else:
                     sender_remaining = per_sender_map
 
-                for r in self.receiver_addresses:
-                    remaining = per_receiver
-                    for s in self.sender_addresses:
-                        if remaining == 0:
-                            break
-                        avail = sender_remaining[s]
-                        if avail <= 0:
-                            continue
-                        send_amt = min(avail, remaining)
-                        if send_amt > 0:
-                            plan.append((s, r, send_amt))
-                            sender_remaining[s] -= send_amt
-                            remaining -= send_amt
-                leftover = sum(sender_remaining.values())
+                alloc, _, leftover = self._allocate_plan(sender_remaining, per_receiver)
+                plan.extend(alloc)
                 if leftover > 0:
                     self.console.log("[yellow]Note: remainder not distributed due to integer division.[/yellow]")
 
@@ -786,28 +1456,50 @@ class BatchTransferManager:
         self.console.rule("[bold]Transfer Plan Preview[/bold]")
         total_tx = len(plan)
         total_amount = sum(a for _, _, a in plan)
-        self.console.print(f"[bold]Token Contract:[/bold] {token_sel}")
-        self.console.print(f"[bold]Decimals:[/bold] {decimals}")
-        self.console.print(f"[bold]Transfers:[/bold] {total_tx} txs")
-        self.console.print(f"[bold]Total Amount:[/bold] {total_amount / (10**decimals)}")
-        for i, (s, r, a) in enumerate(plan[:10], 1):
+        lines = [
+            f"[bold]Token Contract:[/bold] {token_sel}",
+            f"[bold]Decimals:[/bold] {decimals}",
+            f"[bold]Transfers:[/bold] {total_tx} txs",
+            f"[bold]Total Amount:[/bold] {Decimal(total_amount) / (Decimal(10) ** decimals)}",
+        ]
+        # Resolve any preview addresses the prefetch missed in one batched
+        # lookup instead of a serial reverse_ens round-trip per row.
+        preview_addrs = {self._coerce_address_key(x) for s, r, _ in plan[:10] for x in (s, r)}
+        unknown_addrs = [a for a in preview_addrs if a and a not in self.prefetched_ens_reverse]
+        if unknown_addrs:
             try:
-                s_cs = self.w3.to_checksum_address(s)
+                resolved = self.web3h.batch_ens_reverse(unknown_addrs, use_multicall=True) or {}
             except Exception:
-                s_cs = s
-            try:
-                r_cs = self.w3.to_checksum_address(r)
-            except Exception:
-                r_cs = r
-            se = self.prefetched_ens_reverse.get(s_cs) or self.reverse_ens(s)
-            re = self.prefetched_ens_reverse.get(r_cs) or self.reverse_ens(r)
-            sender_label = f"{se} -> {s}" if se else s
-            receiver_label = f"{re} -> {r}" if re else r
-            pretty_amount = a / (10 ** decimals)
-            self.console.print(f"{i:>3}. {sender_label} -> {receiver_label} | {pretty_amount}")
-
+                resolved = {}
+            now = time.monotonic()
+            for addr, name in resolved.items():
+                key = self._coerce_address_key(addr)
+                if key and name:
+                    self.prefetched_ens_reverse[key] = name
+                    self._ens_cache_put(self._ens_hit, key, (now, name))
+
+        # One pre-rendered table, one console write: no markup parse + stdout
+        # flush per preview row.
+        preview_table = Table(show_header=True, header_style="bold")
+        preview_table.add_column("#", justify="right")
+        preview_table.add_column("From")
+        preview_table.add_column("To")
+        preview_table.add_column("Amount", justify="right")
+        for i, (s, r, a) in enumerate(plan[:10], 1):
+            s_cs = self._coerce_address_key(s)
+            r_cs = self._coerce_address_key(r)
+            s_ens = self.prefetched_ens_reverse.get(s_cs)
+            r_ens = self.prefetched_ens_reverse.get(r_cs)
+            sender_label = f"{s_ens} -> {s}" if s_ens else s
+            receiver_label = f"{r_ens} -> {r}" if r_ens else r
+            pretty_amount = Decimal(a) / (Decimal(10) ** decimals)
+            preview_table.add_row(str(i), sender_label, receiver_label, str(pretty_amount))
+
+        self.console.print("\n".join(lines), highlight=False)
+        if preview_table.row_count:
+            self.console.print(preview_table)
         if total_tx > 10:
-            self.console.print(f"... and {total_tx-10} more")
+            self.console.print(f"... and {total_tx-10} more", highlight=False)
         if not questionary.confirm("Proceed with these transfers?").ask():
             self.console.log("[yellow]Cancelled by user[/yellow]")
             return
@@ -822,8 +1514,103 @@ class BatchTransferManager:
                 self.console.log("[red]Failed to get gas fees[/red]"); return
             fixed_fees = (mf, mp)
 
+        # Fire-and-forget mode keeps the send loop at sign+broadcast speed and
+        # settles all receipts in one batched pass at the end, instead of
+        # blocking each worker a block per transaction.
+        wait_mode = questionary.select(
+            "Receipt handling:",
+            choices=["sync (wait per tx)", "async (collect receipts at the end)"],
+            default="sync (wait per tx)",
+        ).ask()
+        async_mode = wait_mode.startswith("async")
+
+        # Optional submit stagger: spraying the whole plan into the mempool at
+        # once gets the tail of it stuck behind full blocks; a small jittered
+        # gap per tx spreads the batch across several blocks instead.
+        window_raw = questionary.text(
+            "Spread submissions over how many seconds? (0 = no stagger):", default="0"
+        ).ask()
+        try:
+            submit_window_s = max(0.0, float(window_raw or 0))
+        except ValueError:
+            submit_window_s = 0.0
+        submit_delay = submit_window_s / max(1, total_tx)
+
+        def _fees_for() -> Tuple[int, int]:
+            if fixed_fees:
+                return fixed_fees
+            mf, mp = self.fetch_suggested_fees(chosen_tier)
+            if not mf:
+                raise RuntimeError("Failed to get gas fees")
+            return mf, mp
+
+        batcher = None
+        if self.batch_transfer_address:
+            try:
+                batcher = self.w3.eth.contract(
+                    address=self.w3.to_checksum_address(self.batch_transfer_address),
+                    abi=BATCH_TRANSFER_ABI,
+                )
+                self.console.log(f"[cyan]Using batch-transfer contract {batcher.address}[/cyan]")
+            except Exception as e:
+                self.console.log(f"[yellow]Batch-transfer contract unavailable ({e}); sending individually[/yellow]")
+                batcher = None
+
         # ---- Execute with live progress ----
+        # Group the plan by sender: transfers from one wallet must go out in
+        # nonce order, but distinct wallets have independent nonce spaces and
+        # can be dispatched in parallel.
+        plan_by_sender: Dict[str, List[Tuple[str, int]]] = {}
+        for sender, receiver, amt_wei in plan:
+            plan_by_sender.setdefault(sender, []).append((receiver, amt_wei))
+
+        # Key lookup is a dict hit under both the raw and checksummed form,
+        # never a linear sender_addresses.index scan per transfer.
+        pk_by_sender: Dict[str, str] = {}
+        for s, pk in zip(self.sender_addresses, self.wallet_private_keys):
+            pk_by_sender[s] = pk
+            pk_by_sender[self._coerce_address_key(s)] = pk
+
+        # One batched pending-nonce read for all senders; each worker then
+        # increments its local counter instead of re-querying per transaction.
+        senders = list(plan_by_sender.keys())
+        sender_keys = [self._coerce_address_key(s) for s in senders]
+        try:
+            nonce_results = self._json_rpc_batch(
+                [("eth_getTransactionCount", [k, "pending"]) for k in sender_keys]
+            )
+        except Exception:
+            nonce_results = [None] * len(senders)
+        nonces: Dict[str, Optional[int]] = {}
+        for s, raw in zip(senders, nonce_results):
+            try:
+                nonces[s] = int(raw, 16) if isinstance(raw, str) else raw
+            except (TypeError, ValueError):
+                nonces[s] = None
+
+        # Warm the per-token gas-limit cache with one representative estimate
+        # so no worker pays the estimate_gas round-trip inside the send loop.
+        if native_mode != "true-native" and batcher is None and plan and token_sel not in self._gas_limit_cache:
+            s0, r0, a0 = plan[0]
+            try:
+                est = self.w3.eth.estimate_gas({
+                    "from": self._coerce_address_key(s0),
+                    "to": token_sel,
+                    "value": 0,
+                    "data": self._encode_transfer(r0, a0),
+                })
+                self._gas_limit_cache[token_sel] = int(est * 12 // 10)
+            except Exception:
+                pass  # send_erc20 estimates (and caches) on first use
+
+        # The flat plan has served preview, totals, and grouping; workers
+        # only read plan_by_sender, so drop the duplicate tuple list before
+        # execution instead of pinning O(N) triples for the whole run.
+        del plan
+
         success = 0
+        sent_hashes: List[str] = []
+        hash_lock = threading.Lock()
         progress = Progress(
             "[progress.description]{task.description}",
             BarColumn(),
@@ -834,11 +1621,28 @@ class BatchTransferManager:
             TimeRemainingColumn(),
             console=self.console,
         )
-        with progress:
-            task = progress.add_task("[cyan]Transferring...", total=total_tx)
-            for (sender, receiver, amt_wei) in plan:
+
+        def _send_for_sender(sender: str) -> int:
+            ok_count = 0
+            pk = pk_by_sender.get(sender) or pk_by_sender.get(self._coerce_address_key(sender))
+            nonce = nonces.get(sender)
+            if nonce is None:
+                # Batched read failed for this sender: read once here so the
+                # queue still runs on a local counter instead of one
+                # eth_getTransactionCount round-trip per transaction.
+                try:
+                    nonce = self.w3.eth.get_transaction_count(self._coerce_address_key(sender), "pending")
+                except Exception:
+                    nonce = None  # send_erc20 falls back to per-tx reads
+            if batcher is not None:
+                return self._disperse_for_sender(
+                    pk, plan_by_sender[sender], token_sel, native_mode,
+                    batcher, _fees_for, nonce, progress, task,
+                )
+            for tx_idx, (receiver, amt_wei) in enumerate(plan_by_sender[sender]):
+                if submit_delay and tx_idx:
+                    time.sleep(submit_delay * random.uniform(0.5, 1.5))
                 try:
-                    pk = self.wallet_private_keys[self.sender_addresses.index(sender)]
                     if fixed_fees:
                         max_fee, max_prio = fixed_fees
                     else:
@@ -846,40 +1650,82 @@ class BatchTransferManager:
                         if not max_fee:
                             raise RuntimeError("Failed to get gas fees")
 
-                    txh = self.send_erc20(pk, token_sel, receiver, amt_wei, max_fee, max_prio)
+                    txh = self.send_erc20(pk, token_sel, receiver, amt_wei, max_fee, max_prio, nonce=nonce)
+                    if nonce is not None:
+                        nonce += 1
                     self.console.log(f"[green]Sent tx: {txh}[/green]")
-                    rcpt = self.wait_receipt_slow(txh)
-                    if rcpt and rcpt.get("status", 0) == 1:
-                        success += 1
+                    if async_mode:
+                        with hash_lock:
+                            sent_hashes.append(txh)
                     else:
-                        self.console.log(f"[red]Tx failed in block {rcpt.get('blockNumber')}[/red]")
+                        rcpt = self.wait_receipt_slow(txh)
+                        if rcpt and rcpt.get("status", 0) == 1:
+                            ok_count += 1
+                        else:
+                            self.console.log(f"[red]Tx failed in block {rcpt.get('blockNumber')}[/red]")
 
                 except Exception as e:
                     msg = (str(e) or "").lower()
                     self.console.log(f"[red]Error sending tx ({sender} → {receiver}): {e}[/red]")
                     # Gas-related immediate retry with fresh 'medium' fees + fresh estimate
-                    if any(h in msg for h in GAS_ERROR_HINTS):
-                        self.console.log("[yellow]Gas-related error → retrying with fresh 'medium' fees[/yellow]")
-                        try:
-                            max_fee, max_prio = self.fetch_suggested_fees("medium")
-                            if not max_fee:
-                                raise RuntimeError("Gas API failed on retry")
-                            txh = self.send_erc20(pk, token_sel, receiver, amt_wei, max_fee, max_prio)
-                            self.console.log(f"[green]Retry tx: {txh}[/green]")
-                            rcpt = self.wait_receipt_slow(txh)
-                            if rcpt and rcpt.get("status", 0) == 1:
-                                success += 1
-                            else:
-                                self.console.log(f"[red]Retry failed in block {rcpt.get('blockNumber')}[/red]")
-                        except Exception as e2:
-                            self.console.log(f"[red]Retry error: {e2}[/red]")
+                    if _GAS_ERR_RE.search(msg):
+                        for attempt, (tier, mult) in enumerate(GAS_RETRY_LADDER):
+                            time.sleep(2 ** attempt)
+                            self.console.log(
+                                f"[yellow]Gas-related error → retry {attempt + 1} with '{tier}' fees x{mult}[/yellow]"
+                            )
+                            try:
+                                max_fee, max_prio = self.fetch_suggested_fees(tier)
+                                if not max_fee:
+                                    raise RuntimeError("Gas API failed on retry")
+                                max_fee = int(max_fee * mult)
+                                max_prio = int(max_prio * mult)
+                                txh = self.send_erc20(pk, token_sel, receiver, amt_wei, max_fee, max_prio, nonce=nonce)
+                                if nonce is not None:
+                                    nonce += 1
+                                self.console.log(f"[green]Retry tx: {txh}[/green]")
+                                if async_mode:
+                                    with hash_lock:
+                                        sent_hashes.append(txh)
+                                else:
+                                    rcpt = self.wait_receipt_slow(txh)
+                                    if rcpt and rcpt.get("status", 0) == 1:
+                                        ok_count += 1
+                                    else:
+                                        # The tx landed but reverted; the nonce is
+                                        # spent, so resending would double-pay.
+                                        self.console.log(f"[red]Retry failed in block {rcpt.get('blockNumber')}[/red]")
+                                break
+                            except Exception as e2:
+                                self.console.log(f"[red]Retry error: {e2}[/red]")
                     # else non-gas error → continue
                 finally:
                     progress.advance(task, 1)
+            return ok_count
+
+        with progress:
+            task = progress.add_task("[cyan]Transferring...", total=total_tx)
+            max_workers = max(1, min(32, len(plan_by_sender)))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for ok_count in pool.map(_send_for_sender, senders):
+                    success += ok_count
+
+        if async_mode and sent_hashes:
+            self.console.log(f"[cyan]Collecting receipts for {len(sent_hashes)} txs...[/cyan]")
+            receipts = self.wait_receipts_slow(sent_hashes)
+            success += sum(1 for r in receipts.values() if r and r.get("status", 0) == 1)
+            for tx_key, rcpt in receipts.items():
+                if rcpt is None:
+                    self.console.log(f"[red]No receipt for {tx_key} (still pending?)[/red]")
+                elif rcpt.get("status", 0) != 1:
+                    self.console.log(f"[red]Tx {tx_key} failed in block {rcpt.get('blockNumber')}[/red]")
 
         self.console.rule("[bold]Done[/bold]")
-        self.console.print(f"[bold green]Success:[/bold green] {success}/{total_tx} txs")
-        self.console.print(f"[bold red]Failed:[/bold red] {total_tx - success} txs")
+        self.console.print(
+            f"[bold green]Success:[/bold green] {success}/{total_tx} txs\n"
+            f"[bold red]Failed:[/bold red] {total_tx - success} txs",
+            highlight=False,
+        )
 
 
 def main():
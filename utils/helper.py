@@ -1,13 +1,18 @@
 import os
 import json
+import mmap
+import struct
 import time
 import logging , threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Set
-from customtkinter import CTk, CTkTextbox, CTkButton, CTkLabel, CTkFrame
-import tkinter as tk
-from tkinter import messagebox,StringVar
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from web3 import Web3
 from eth_account import Account
+from eth_hash.auto import keccak as _keccak_raw
+from eth_keys import keys as _eth_keys
 from web3.types import HexBytes
 
 import sys , re
@@ -17,6 +22,532 @@ import config
 
 
 NATIVE_SENTINEL = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE".lower()
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+@lru_cache(maxsize=4096)
+def _keccak_label(label: str) -> bytes:
+    """Keccak of a single ENS label, memoized.
+
+    Reverse lookups hash the same constant labels ("addr", "reverse") for
+    every wallet, and batches re-hash shared suffixes like "eth"; caching
+    per label makes those free after the first wallet.
+    """
+    return bytes(Web3.keccak(text=label))
+
+
+@lru_cache(maxsize=4096)
+def _namehash_cached(name: str) -> bytes:
+    node = b"\x00" * 32
+    if name:
+        for label in name.split(".")[::-1]:
+            node = bytes(Web3.keccak(node + _keccak_label(label)))
+    return node
+
+
+# Precomputed namehash("addr.reverse"): reverse nodes only need one more
+# keccak for the address-hex label plus the combining hash.
+_ADDR_REVERSE_SUFFIX_NODE = _namehash_cached("addr.reverse")
+
+# Shape gate for the inlined EIP-55 path below.
+_HEX40_RE = re.compile(r"0x[0-9a-f]{40}$")
+
+
+@lru_cache(maxsize=65536)
+def _checksum_cached(addr_lower: str) -> str:
+    # Inlined EIP-55 for the common shape: one C-backed keccak (eth-hash's
+    # pycryptodome backend) plus a 40-char walk, skipping the validation and
+    # conversion layers inside eth_utils. Anything unusual falls back.
+    if _HEX40_RE.match(addr_lower):
+        body = addr_lower[2:]
+        h = _keccak_raw(body.encode("ascii")).hex()
+        return "0x" + "".join(
+            c.upper() if h[i] in "89abcdef" else c for i, c in enumerate(body)
+        )
+    return Web3.to_checksum_address(addr_lower)
+
+
+def _cs(addr) -> str:
+    """Checksum an address with one keccak per unique address process-wide.
+
+    to_checksum_address hashes its input every call, and the helper's hot
+    paths re-checksum the same handful of wallets, tokens and resolvers
+    constantly; routing through an lru_cache keyed on the lowercased form
+    makes repeats a dict hit. Accepts str or raw 20-byte values.
+    """
+    if isinstance(addr, (bytes, bytearray)):
+        addr = "0x" + bytes(addr).hex()
+    return _checksum_cached(str(addr).lower())
+
+
+def _derive_address(private_key: str) -> Optional[str]:
+    """Checksum address for one private key, or None when invalid.
+
+    Module level (picklable) so bulk imports can fan the secp256k1
+    derivations out to worker processes; the pure-Python curve math is
+    ~2 ms per key and GIL-bound, so threads buy nothing here. Goes through
+    eth-keys directly rather than Account.from_key, which would wrap the
+    same derivation in keyfile validation and a LocalAccount object, and
+    checksums via the cached fast path.
+    """
+    try:
+        s = private_key[2:] if private_key.startswith(("0x", "0X")) else private_key
+        addr = _eth_keys.PrivateKey(bytes.fromhex(s)).public_key.to_address()
+        return _checksum_cached(addr)
+    except Exception:
+        return None
+
+
+# Hardcoded 4-byte selectors for the fixed-shape calls the helper batches.
+# keccak("balanceOf(address)") etc. never change, so calldata can be built by
+# concatenation instead of running the ABI encoder per call. Computed once at
+# import; nothing in the batch builders re-hashes a signature per call.
+SEL_BALANCEOF = bytes.fromhex("70a08231")
+SEL_ALLOWANCE = bytes.fromhex("dd62ed3e")
+SEL_TRANSFER = bytes.fromhex("a9059cbb")
+SEL_APPROVE = bytes.fromhex("095ea7b3")
+SEL_DECIMALS = bytes.fromhex("313ce567")
+SEL_SYMBOL = bytes.fromhex("95d89b41")
+SEL_NAME0 = bytes.fromhex("06fdde03")          # name()
+SEL_ENS_RESOLVER = bytes.fromhex("0178b8bf")   # resolver(bytes32)
+SEL_ENS_NAME = bytes.fromhex("691f3431")       # name(bytes32)
+SEL_ENS_ADDR = bytes.fromhex("3b3b57de")       # addr(bytes32)
+SEL_GETETHBALANCE = bytes.fromhex("4d2301cc")  # Multicall3 getEthBalance(address)
+
+_ERC20_SELECTORS = {
+    "balanceOf": SEL_BALANCEOF,
+    "allowance": SEL_ALLOWANCE,
+    "transfer": SEL_TRANSFER,
+    "approve": SEL_APPROVE,
+    "decimals": SEL_DECIMALS,
+    "symbol": SEL_SYMBOL,
+    "name": SEL_NAME0,
+}
+
+
+def _pad_addr(a: str) -> bytes:
+    """Left-pad a hex address to a 32-byte ABI word."""
+    return b"\x00" * 12 + bytes.fromhex(a[2:])
+
+
+# Fallback native-token labels per chain when the chain config doesn't name
+# them; built once instead of per balance fetch.
+_DEFAULT_NATIVE_SYMBOLS = {
+    "polygon": "MATIC",
+    "optimism": "ETH",
+    "op": "ETH",
+    "ethereum": "ETH",
+    "eth": "ETH",
+    "base": "ETH",
+    "arbitrum": "ETH",
+    "linea": "ETH",
+}
+_DEFAULT_NATIVE_NAMES = {
+    "polygon": "Matic",
+    "optimism": "Ether",
+    "op": "Ether",
+    "ethereum": "Ether",
+    "eth": "Ether",
+    "base": "Ether",
+    "arbitrum": "Ether",
+    "linea": "Ether",
+}
+
+
+# Keep-alive session for the gas API so repeated fee lookups reuse one TCP/TLS
+# connection; transient 5xx from the provider get a couple of quick retries.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
+# Gas tiers don't move sub-second; a 5 s memo lets bursts of lookups (one per
+# worker at dispatch time) share a single HTTP round-trip.
+_FEES_TTL = 5.0
+_FEES_CACHE: Dict[str, Tuple[float, dict]] = {}
+
+
+# Lazily imported GUI/CLI toolkits, cached so repeat loader calls skip the
+# sys.modules machinery (customtkinter alone drags in PIL and theme JSON).
+_ctk = None
+_q = None
+
+
+def _get_ctk():
+    global _ctk
+    if _ctk is None:
+        import customtkinter
+        _ctk = customtkinter
+    return _ctk
+
+
+def _get_questionary():
+    global _q
+    if _q is None:
+        import questionary
+        _q = questionary
+    return _q
+
+
+# Single worker for dialog submit_work jobs, started on first use.
+_DIALOG_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _dialog_executor() -> ThreadPoolExecutor:
+    global _DIALOG_EXECUTOR
+    if _DIALOG_EXECUTOR is None:
+        _DIALOG_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+    return _DIALOG_EXECUTOR
+
+
+_CTK_CONFIGURED = False
+
+
+_SCREEN_DIMS: Optional[Tuple[int, int]] = None
+
+
+def _screen_dims(root) -> Tuple[int, int]:
+    """Screen size, read through Tcl once per process."""
+    global _SCREEN_DIMS
+    if _SCREEN_DIMS is None:
+        _SCREEN_DIMS = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return _SCREEN_DIMS
+
+
+# Item separators in the paste dialogs' counters: commas or any whitespace.
+_SEP_RE = re.compile(r"[,\s]+")
+
+# Dotted-name shape check for single candidate strings; the blob tokenizer
+# below has its own ENS branch.
+_ENS_RE = re.compile(r"(?i)^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)+$")
+
+# One tokenizer pass for pasted blobs: comments, private keys, addresses and
+# ENS-style names in a single C-level sweep instead of per-line replace/
+# split/regex churn. Order matters — comments swallow their line tail, and
+# 64-hex keys must win over the 40-hex address prefix rule. Compiled once
+# here; every loader (file/CLI/GUI) funnels through it.
+_TOKEN_RE = re.compile(
+    r"(?P<comment>#[^\r\n]*)"
+    r"|(?P<pk>(?<![0-9a-fA-Fx])(?:0x)?[0-9a-fA-F]{64})\b"
+    r"|(?P<addr>0x[0-9a-fA-F]{40})\b"
+    r"|(?P<ens>[A-Za-z0-9][A-Za-z0-9-]*(?:\.[A-Za-z0-9][A-Za-z0-9-]+)+)"
+)
+
+
+# Bytes twin of the tokenizer so memory-mapped files can be scanned without
+# decoding the whole buffer first; every token branch is ASCII-only.
+_TOKEN_RE_B = re.compile(_TOKEN_RE.pattern.encode("ascii"))
+_SEP_RE_B = re.compile(_SEP_RE.pattern.encode("ascii"))
+
+
+def _scan_blob(blob):
+    """Yield (kind, value) for each token; accepts str or bytes-like.
+
+    Comments are dropped. Runs between tokens that are not just separators
+    come out as ("junk", run) so loaders can log what they rejected instead
+    of silently swallowing it.
+    """
+    if isinstance(blob, str):
+        pos = 0
+        for m in _TOKEN_RE.finditer(blob):
+            for junk in _SEP_RE.split(blob[pos:m.start()]):
+                if junk:
+                    yield "junk", junk
+            pos = m.end()
+            if m.lastgroup != "comment":
+                yield m.lastgroup, m.group()
+        for junk in _SEP_RE.split(blob[pos:]):
+            if junk:
+                yield "junk", junk
+    else:
+        pos = 0
+        for m in _TOKEN_RE_B.finditer(blob):
+            for junk in _SEP_RE_B.split(blob[pos:m.start()]):
+                if junk:
+                    yield "junk", bytes(junk).decode("ascii", "replace")
+            pos = m.end()
+            if m.lastgroup != "comment":
+                yield m.lastgroup, m.group().decode("ascii")
+        for junk in _SEP_RE_B.split(blob[pos:]):
+            if junk:
+                yield "junk", bytes(junk).decode("ascii", "replace")
+
+
+class _PasteDialog:
+    """
+    The one paste dialog behind load_wallets_gui/load_tokens_gui/
+    load_privatekeys_gui, parametrized by title/icon/heading/instructions/
+    submit label. Defined once at module scope so each call reuses the
+    compiled class instead of re-executing a ~250-line class body (the token
+    and private-key loaders used to carry two separate inner classes both
+    named TokenInputDialog).
+    """
+
+    def __init__(self, title: str, icon: str, heading: str, instructions: str, submit_label: str,
+                 submit_work=None):
+        ctk = _get_ctk()
+        self.ctk = ctk
+        self.icon = icon
+        self.heading = heading
+        self.instructions = instructions
+        self.submit_label = submit_label
+        # Optional callable run on a worker thread with the submitted text,
+        # so heavy post-processing overlaps Tk teardown (see work_future).
+        self._submit_work = submit_work
+        self.work_future = None
+        # Configure appearance once per process - both setters walk
+        # customtkinter's theme tables and restyle existing widgets.
+        global _CTK_CONFIGURED
+        if not _CTK_CONFIGURED:
+            ctk.set_appearance_mode("dark")
+            ctk.set_default_color_theme("blue")
+            _CTK_CONFIGURED = True
+        self.root = ctk.CTk()
+        self.root.title(title)
+        self.root.geometry("600x500")
+        self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        self.result = None
+        self.destroyed = False
+        self._pending_update = None
+        self._last_counter = (-1, -1)
+        self.setup_ui()
+        # Ensure window appears centered and focused/selected after launch;
+        # after_idle fires as soon as geometry is realized instead of
+        # stalling a fixed 100 ms.
+        try:
+            self.root.after_idle(self.center_and_focus)
+        except Exception:
+            pass
+
+    def setup_ui(self):
+        ctk = self.ctk
+        # tkinter is stdlib but still loads Tcl/Tk; keep it off the module
+        # import path along with customtkinter.
+        from tkinter import StringVar
+        # Main container with modern styling
+        main_frame = ctk.CTkFrame(self.root, corner_radius=15)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        # Header section
+        header_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=(20, 10))
+        # Icon and title
+        icon_label = ctk.CTkLabel(
+            header_frame,
+            text=self.icon,
+            font=("Arial", 24),
+            text_color="#4CC9F0"
+        )
+        icon_label.pack(side="left", padx=(0, 10))
+
+        title_label = ctk.CTkLabel(
+            header_frame,
+            text=self.heading,
+            font=("Arial", 20, "bold"),
+            text_color="white"
+        )
+        title_label.pack(side="left")
+
+        # Instructions
+        instructions = ctk.CTkLabel(
+            main_frame,
+            text=self.instructions,
+            font=("Arial", 14),
+            text_color="#B0B0B0",
+            justify="left"
+        )
+        instructions.pack(pady=(0, 20))
+
+        # Text input area with modern styling
+        input_frame = ctk.CTkFrame(main_frame, corner_radius=10)
+        input_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        self.text_widget = ctk.CTkTextbox(
+            input_frame,
+            height=200,
+            border_width=0,
+            corner_radius=8,
+            fg_color="#2B2B2B",
+            text_color="white",
+            font=("Consolas", 12),
+            wrap="word"
+        )
+        self.text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        self.text_widget.focus_set()
+
+        # Character counter
+        self.counter_var = StringVar(value="0 characters")
+        counter_label = ctk.CTkLabel(
+            main_frame,
+            textvariable=self.counter_var,
+            font=("Arial", 11),
+            text_color="#808080"
+        )
+        counter_label.pack(pady=(5, 0))
+
+        # Event-driven counter updates: recompute only when the
+        # text changes instead of waking Tk every 500 ms.
+        self.text_widget.bind("<KeyRelease>", self._schedule_update)
+        try:
+            tb = self.text_widget._textbox
+            tb.edit_modified(False)
+            tb.bind("<<Modified>>", self._on_modified)
+        except Exception:
+            pass
+
+        # Button frame
+        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=20)
+
+        # Cancel button
+        cancel_btn = ctk.CTkButton(
+            button_frame,
+            text="Cancel",
+            command=self.on_cancel,
+            fg_color="transparent",
+            border_width=2,
+            text_color=("black", "white"),
+            hover_color="#3A3A3A",
+            font=("Arial", 14, "bold")
+        )
+        cancel_btn.pack(side="left", padx=(0, 10))
+
+        # Submit button
+        submit_btn = ctk.CTkButton(
+            button_frame,
+            text=self.submit_label,
+            command=self.on_submit,
+            fg_color="#4CC9F0",
+            hover_color="#3AA8CC",
+            font=("Arial", 14, "bold"),
+            text_color="white"
+        )
+        submit_btn.pack(side="right")
+
+        # Bind Enter key to submit
+        self.root.bind('<Return>', lambda e: self.on_submit())
+        self.root.bind('<Escape>', lambda e: self.on_cancel())
+
+        # Update counter initially
+        self.update_counter()
+
+    def center_and_focus(self):
+        try:
+            # The dialog is created at a fixed 600x500, so skip the layout
+            # pass and the winfo round-trips that re-derived known values.
+            w, h = 600, 500
+            sw, sh = _screen_dims(self.root)
+            x = max(0, (sw - w) // 2)
+            y = max(0, (sh - h) // 2)
+            self.root.geometry(f"+{x}+{y}")
+
+            # Bring to front and focus so users don't need to re-select
+            self.root.deiconify()
+            self.root.lift()
+            # temporary topmost to steal focus on Windows, then drop it as
+            # soon as Tk has processed the raise instead of 300 ms later
+            self.root.attributes('-topmost', True)
+            self.root.update_idletasks()
+            self.root.after_idle(lambda: self.root.attributes('-topmost', False))
+            # focus window and primary input
+            self.root.focus_force()
+            try:
+                self.text_widget.focus_set()
+            except Exception:
+                pass
+        except Exception:
+            pass
+
+    def _on_modified(self, event=None):
+        # <<Modified>> also covers paste/undo; the flag is re-armed in
+        # update_counter after the recount.
+        self._schedule_update()
+
+    def _schedule_update(self, event=None):
+        # Debounce: holding a key or a chunked paste fires many
+        # events; coalesce them into one recount per 80 ms window.
+        if self._pending_update is None and not self.destroyed:
+            delay = 80
+            try:
+                # Each recount copies the whole buffer out of Tcl, so ask
+                # Tcl for the size (an integer, no copy) and widen the
+                # window on big pastes to make those copies rarer.
+                n = self.text_widget._textbox.count("1.0", "end-1c", "chars")
+                if (n[0] if isinstance(n, tuple) else n or 0) > 65536:
+                    delay = 300
+            except Exception:
+                pass
+            self._pending_update = self.root.after(delay, self._do_update)
+
+    def _do_update(self):
+        self._pending_update = None
+        self.update_counter()
+
+    def update_counter(self, event=None):
+        try:
+            if self.destroyed:
+                return
+            # Cheap probe first: when Tk says the buffer hasn't changed
+            # since the last recount (arrow keys, focus events), skip
+            # re-reading it entirely.
+            tb = None
+            try:
+                tb = self.text_widget._textbox
+                if not tb.edit_modified():
+                    return
+            except Exception:
+                tb = None
+            text = self.text_widget.get("1.0", "end-1c")
+            char_count = len(text)
+            # One pass, no per-item strip(): trimming the ends first means
+            # every field the regex split yields is already non-empty.
+            stripped = text.strip(", \t\r\n")
+            item_count = len(_SEP_RE.split(stripped)) if stripped else 0
+            # Only touch the StringVar when the numbers moved - every set()
+            # fires a variable trace and repaints the label.
+            if (char_count, item_count) != self._last_counter:
+                self.counter_var.set(f"{char_count} characters, {item_count} items")
+                self._last_counter = (char_count, item_count)
+            if tb is not None:
+                tb.edit_modified(False)  # re-arm the probe
+        except Exception:
+            # Ignore errors during update
+            pass
+
+    def on_submit(self):
+        try:
+            text = self.text_widget.get("1.0", "end-1c").strip()
+            self.result = text
+            if self._submit_work is not None:
+                try:
+                    self.work_future = _dialog_executor().submit(self._submit_work, text)
+                except Exception:
+                    self.work_future = None
+            self.cleanup()
+        except Exception:
+            self.result = ""
+            self.cleanup()
+
+    def on_cancel(self):
+        self.result = ""
+        self.cleanup()
+
+    def cleanup(self):
+        """Proper cleanup to avoid after script errors"""
+        self.destroyed = True
+        try:
+            self.root.quit()
+        except:
+            pass
+        try:
+            self.root.destroy()
+        except:
+            pass
+
+    def get_input(self):
+        self.root.mainloop()
+        return self.result
 
 
 class Web3Helper:
@@ -27,6 +558,29 @@ class Web3Helper:
     This class owns a rotating provider and a Web3 instance.
     """
 
+    # Slot descriptors make the per-wallet self.* lookups in the batch ENS
+    # loops C-level and shrink the instance; any new field must be added here.
+    __slots__ = (
+        "console", "cfg", "rpc_urls", "provider", "w3", "ens",
+        "wallet_addresses", "tokens", "ens_names", "private_keys",
+        "pk_addresses", "erc20_tokens", "multicall", "erc20_abi",
+        "_erc20_cache", "ens_resolver_abi", "_chain_id", "_native_set",
+        "ens_provider", "ens_w3", "ens_multicall", "ens_registry",
+        "ens_universal_resolver", "ens_public_resolver",
+        "_ens_rev_cache", "_ens_fwd_cache", "_chunk_size",
+        "_token_meta_cache",
+    )
+
+    # ENS answers are stable on the minutes scale; UIs re-resolve the same
+    # wallet list constantly, so repeat lookups within the TTL skip the
+    # network entirely.
+    ENS_CACHE_TTL = 300.0
+    ENS_CACHE_MAX = 10000
+
+    # decimals/name/symbol are immutable per contract, so cached entries
+    # never expire; the cap just bounds memory on long sessions.
+    TOKEN_META_MAX = 10000
+
     def __init__(self, chain_config, console=None):
         self.console = console
         self.cfg = chain_config
@@ -47,10 +601,26 @@ class Web3Helper:
 
         # Multicall3 (optional)
         self.multicall = self.w3.eth.contract(
-            address= self.w3.to_checksum_address(self.cfg.MULTICALL3_ADDRESS),
+            address= _cs(self.cfg.MULTICALL3_ADDRESS),
             abi= json.loads(self.cfg.MULTICALL3_ABI))
         self.erc20_abi = json.loads(self.cfg.TOKEN_ABI)
-        self.ens_resolver_abi = json.loads(getattr(self.cfg, "ENS_PUBLIC_RESOLVER_ABI")) 
+        # Contract objects per token: building one wraps the full ABI every
+        # time, so _erc20 reuses them instead.
+        self._erc20_cache: Dict[str, object] = {}
+        self.ens_resolver_abi = json.loads(getattr(self.cfg, "ENS_PUBLIC_RESOLVER_ABI"))
+        # Per-tx constants hoisted out of the send paths: chain id and the
+        # native-token sentinel set don't change after construction.
+        self._chain_id = int(getattr(chain_config, 'CHAIN_ID', 0))
+        self._native_set = frozenset({NATIVE_SENTINEL, str(getattr(chain_config, 'NATIVE_TOKEN', '')).lower()})
+        # key -> (expiry, value); plain dicts stand in for a TTL cache since
+        # cachetools isn't a dependency here.
+        self._ens_rev_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._ens_fwd_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        # Per-URL aggregate3 chunk size, tuned from observed latency; the
+        # fixed BATCH_READ_CHUNK is just the starting point.
+        self._chunk_size: Dict[str, int] = {}
+        # (chain_id, token) -> known metadata fields; see _token_meta_put.
+        self._token_meta_cache: Dict[Tuple[int, str], Dict[str, object]] = {}
         self._init_ens_clients()
 
     # ---------- RPC ----------
@@ -70,13 +640,8 @@ class Web3Helper:
         extras = [u.strip() for u in extras_raw.split(',') if u.strip()]
         urls.extend(extras)
 
-        # de-duplicate
-        dedup: List[str] = []
-        seen = set()
-        for u in urls:
-            if u not in seen:
-                dedup.append(u)
-                seen.add(u)
+        # dict.fromkeys de-duplicates in one C-level pass, order preserved
+        dedup = [u for u in dict.fromkeys(urls) if u]
         if not dedup:
             raise RuntimeError('No RPC URLs configured. Set ALCHEMY_API_KEY or EXTRA_RPC_URLS in .env')
         return dedup
@@ -95,13 +660,7 @@ class Web3Helper:
         fallback = getattr(getattr(config, 'ETHER', None), 'ALCHEMY_RPC_URL', None)
         if fallback and 'None' not in str(fallback):
             urls.append(str(fallback))
-        dedup: List[str] = []
-        seen = set()
-        for u in urls:
-            if u and u not in seen:
-                dedup.append(u)
-                seen.add(u)
-        return dedup
+        return [u for u in dict.fromkeys(urls) if u]
 
     def _init_ens_clients(self) -> None:
         self.ens_provider = None
@@ -125,7 +684,7 @@ class Web3Helper:
         if self.ens_w3 is not self.w3:
             try:
                 self.ens_multicall = self.ens_w3.eth.contract(
-                    address=self.ens_w3.to_checksum_address(getattr(self.cfg, 'MULTICALL3_ADDRESS', config.MULTICALL3_ADDRESS)),
+                    address=_cs(getattr(self.cfg, 'MULTICALL3_ADDRESS', config.MULTICALL3_ADDRESS)),
                     abi=json.loads(getattr(self.cfg, 'MULTICALL3_ABI', config.MULTICALL3_ABI))
                 )
             except Exception:
@@ -136,22 +695,38 @@ class Web3Helper:
         registry_address = getattr(self.cfg, 'ENS_REGISTRY_ADDRESS', '0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e')
         registry_abi = json.loads(getattr(self.cfg, 'ENS_REGISTRY_ABI'))
         self.ens_registry = self.ens_w3.eth.contract(
-            address=self.ens_w3.to_checksum_address(registry_address),
+            address=_cs(registry_address),
             abi=registry_abi
         )
 
+        # ENS Universal Resolver: folds the registry->resolver->record walk
+        # into one on-chain call per name. Calls against it simply fail on
+        # chains where it is not deployed, and the registry walk takes over.
+        self.ens_universal_resolver = getattr(
+            self.cfg, 'ENS_UNIVERSAL_RESOLVER_ADDRESS',
+            '0xce01f8eee7E479C928F8919abD53E553a36CeF67'
+        )
+        # Canonical public resolver, used to speculatively pack record reads
+        # into the registry-walk fallback's first aggregate3.
+        self.ens_public_resolver = getattr(
+            self.cfg, 'ENS_PUBLIC_RESOLVER_ADDRESS',
+            '0x231b0Ee14048e9dCcD1d247744d114a4EB5E8E63'
+        )
+
     # ---------- ENS ----------
     def _namehash(self, name: str) -> bytes:
-        node = b"\x00" * 32
-        if name:
-            for label in name.split(".")[::-1]:
-                node = Web3.keccak(node + Web3.keccak(text=label))
-        return node
-    
+        return _namehash_cached(name)
+
     def _reverse_node(self, address: str) -> bytes:
-        w3 = getattr(self, 'ens_w3', None) or self.w3
-        addr_hex = w3.to_checksum_address(address)[2:].lower()
-        return self._namehash(f"{addr_hex}.addr.reverse")
+        # The label is the *lowercased* address hex, so the checksum keccak
+        # _cs would spend is wasted here - plain strip/lower is enough.
+        s = address[2:] if address.startswith(("0x", "0X")) else address
+        s = s.lower()
+        if len(s) != 40 or any(c not in "0123456789abcdef" for c in s):
+            raise ValueError(f"invalid address for reverse node: {address!r}")
+        # Combine with the precomputed addr.reverse node directly: one keccak
+        # for the address label, one to fold it in, nothing for the suffix.
+        return Web3.keccak(_ADDR_REVERSE_SUFFIX_NODE + Web3.keccak(text=s))
     
     def _normalize_addr(self, s: str) -> str | None:
         if not s:
@@ -159,7 +734,7 @@ class Web3Helper:
         s = s.strip()
         try:
             if self.w3.is_address(s):
-                return self.w3.to_checksum_address(s)
+                return _cs(s)
         except Exception:
             pass
         return None
@@ -172,29 +747,34 @@ class Web3Helper:
         Uses local operations only - no RPC calls needed since address derivation 
         is purely cryptographic.
         """
-        from eth_account import Account
-
         filtered_keys: list[str] = []
         derived: list[str] = []
-        
-        # Single pass: derive addresses locally
-        for k in keys:
+
+        # Large imports fan the derivations out to worker processes; the
+        # per-key cost is pure-Python secp256k1 under the GIL, so only
+        # processes (not threads) actually overlap the work. Small lists
+        # stay inline — pool startup would cost more than it saves.
+        addresses: Optional[list[Optional[str]]] = None
+        if len(keys) >= 64:
             try:
-                # Account.from_key does the private key -> public key -> address derivation
-                addr = Account.from_key(k).address
-                # to_checksum_address is a local operation that implements EIP-55
-                caddr = self.w3.to_checksum_address(addr)
+                with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 8)) as ex:
+                    addresses = list(ex.map(_derive_address, keys, chunksize=64))
+            except Exception:
+                addresses = None
+        if addresses is None:
+            addresses = [_derive_address(k) for k in keys]
+
+        for k, addr in zip(keys, addresses):
+            if addr:
                 filtered_keys.append(k)
-                derived.append(caddr)
-            except Exception as e:
-                if self.console:
-                    masked = f"{k[:6]}...{k[-4:]}" if len(k) > 12 else "****"
-                    self.console.log(f"[yellow]Skipping invalid private key: {masked} ({e})[/yellow]")
-        
+                derived.append(addr)
+            elif self.console:
+                masked = f"{k[:6]}...{k[-4:]}" if len(k) > 12 else "****"
+                self.console.log(f"[yellow]Skipping invalid private key: {masked}[/yellow]")
+
         return filtered_keys, derived
 
     def _is_ens_like(self, s: str) -> bool:
-        _ENS_RE = re.compile(r"(?i)^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)+$")
         if not s or s.startswith("0x"):
             return False
         s = s.strip().lower()
@@ -208,37 +788,21 @@ class Web3Helper:
         """
         if not blob:
             return ([], [])
-        text = blob.replace(",", "\n")
-        addrs, ens, seen_a, seen_e = [], [], set(), set()
-
-        def add_addr(a: str):
-            if a not in seen_a:
-                seen_a.add(a); addrs.append(a)
-
-        def add_ens(n: str):
-            n = n.lower()
-            if n not in seen_e:
-                seen_e.add(n); ens.append(n)
-
-        for raw in text.splitlines():
-            line = raw.split("#", 1)[0].strip()
-            if not line:
-                continue
-            for tok in re.split(r"[\s,;]+", line):
-                if not tok:
-                    continue
-                a = self._normalize_addr(tok)
+        # Dicts double as order-preserving de-dupe (one linear C pass, same
+        # as dict.fromkeys). Addresses are lowercased inside _normalize_addr
+        # before checksumming, so dedupe and normalization happen together.
+        addrs: Dict[str, None] = {}
+        ens: Dict[str, None] = {}
+        for kind, value in _scan_blob(blob):
+            if kind == "addr":
+                a = self._normalize_addr(value)
                 if a:
-                    add_addr(a)
-                    continue
-                if self._is_ens_like(tok):
-                    add_ens(tok)
-                    continue
-                # silently ignore junk; optionally log
-                if self.console:
-                    self.console.log(f"[yellow]wallets: ignoring invalid entry: {tok}[/yellow]")
-
-        return (addrs, ens)
+                    addrs[a] = None
+            elif kind == "ens":
+                ens[value.lower()] = None
+            elif kind == "junk" and self.console:
+                self.console.log(f"[yellow]Ignoring unrecognized wallet entry: {value}[/yellow]")
+        return (list(addrs), list(ens))
         
     def _parse_addresses_blob(self, blob: str, label: str) -> list[str]:
         """
@@ -246,21 +810,17 @@ class Web3Helper:
         """
         if not blob:
             return []
-        text = blob.replace(",", "\n")
-        out, seen = [], set()
-        for raw in text.splitlines():
-            line = raw.split("#", 1)[0].strip()
-            if not line:
-                continue
-            for tok in re.split(r"[\s,;]+", line):
-                if not tok:
-                    continue
-                a = self._normalize_addr(tok)
-                if a and a not in seen:
-                    seen.add(a); out.append(a)
-                elif not a and self.console:
-                    self.console.log(f"[yellow]{label}: ignoring invalid address: {tok}[/yellow]")
-        return out
+        out: Dict[str, None] = {}
+        for kind, value in _scan_blob(blob):
+            if kind == "addr":
+                a = self._normalize_addr(value)
+                if a:
+                    out[a] = None
+                elif self.console:
+                    self.console.log(f"[yellow]{label}: ignoring invalid address: {value}[/yellow]")
+            elif kind == "junk" and self.console:
+                self.console.log(f"[yellow]{label}: ignoring unrecognized entry: {value}[/yellow]")
+        return list(out)
 
     
 
@@ -268,29 +828,16 @@ class Web3Helper:
         """
         Private keys: hex with/without 0x, 64 hex chars. Returns normalized '0x' + lowercase, unique.
         """
-        _PRIV_RE = re.compile(r"^(?:0x)?([0-9a-fA-F]{64})$")
         if not blob:
             return []
-        text = blob.replace(",", "\n")
-        out, seen = [], set()
-        for raw in text.splitlines():
-            line = raw.split("#", 1)[0].strip()
-            if not line:
-                continue
-            for tok in re.split(r"[\s,;]+", line):
-                if not tok:
-                    continue
-                m = _PRIV_RE.match(tok.strip())
-                if not m:
-                    if self.console:
-                        # mask for safety
-                        masked = f"{tok[:6]}...{tok[-4:]}" if len(tok) > 12 else "****"
-                        self.console.log(f"[yellow]private key: invalid, skipped: {masked}[/yellow]")
-                    continue
-                key = "0x" + m.group(1).lower()
-                if key not in seen:
-                    seen.add(key); out.append(key)
-        return out
+        out: Dict[str, None] = {}
+        for kind, value in _scan_blob(blob):
+            if kind == "pk":
+                out["0x" + value[-64:].lower()] = None
+            elif kind == "junk" and self.console:
+                masked = f"{value[:6]}...{value[-4:]}" if len(value) > 12 else value
+                self.console.log(f"[yellow]Ignoring unrecognized key entry: {masked}[/yellow]")
+        return list(out)
     
     def _aggregate3(self, calls: List[Tuple[str, bytes]], allow_failure: bool=True, *, w3: Optional[Web3]=None, contract=None) -> List[Tuple[bool, bytes]]:
         """
@@ -302,169 +849,525 @@ class Web3Helper:
         contract = contract or self.multicall
         if contract:
             try:
-                call3 = [{"target": w3.to_checksum_address(t), "allowFailure": allow_failure, "callData": d} for t, d in calls]
+                call3 = [{"target": _cs(t), "allowFailure": allow_failure, "callData": d} for t, d in calls]
                 results = contract.functions.aggregate3(call3).call()
-                return [(bool(r[0] if isinstance(r, (list, tuple)) else r['success']),
-                         bytes(r[1] if isinstance(r, (list, tuple)) else r['returnData'])) for r in results]
+                # web3 decodes (bool,bytes)[] to tuples; specialize for that
+                # and keep dict-shaped results as the exceptional path.
+                try:
+                    return [(r[0], r[1] if type(r[1]) is bytes else bytes(r[1])) for r in results]
+                except (TypeError, IndexError, KeyError):
+                    return [(bool(r['success']), bytes(r['returnData'])) for r in results]
             except Exception as e:
                 if self.console:
                     self.console.log(f"[yellow]aggregate3 failed, falling back: {e}[/yellow]")
+        return self._batch_eth_call(calls, w3=w3)
+
+    def _aggregate3_chunks(self, calls: List[Tuple[str, bytes]], allow_failure: bool = True) -> List[Tuple[bool, bytes]]:
+        """
+        Dispatch an aggregate3 workload in chunks. When the provider
+        supports JSON-RPC batching, every chunk's eth_call goes out in ONE
+        HTTP POST instead of one round-trip per chunk; otherwise (or on any
+        batch error) chunks fall back to sequential _aggregate3.
+
+        The chunk size starts at BATCH_READ_CHUNK and is tuned per RPC URL
+        from observed latency: fast dispatches grow it toward
+        BATCH_READ_CHUNK_MAX (fewer chunks next time), slow ones shrink it
+        toward BATCH_READ_CHUNK_MIN (providers that throttle or cap large
+        payloads get smaller requests).
+        """
+        url = getattr(self.provider, "current_url", None) \
+            or str(getattr(self.provider, "endpoint_uri", ""))
+        sz = self._chunk_size.get(url, self.BATCH_READ_CHUNK)
+        chunks = [calls[i:i + sz] for i in range(0, len(calls), sz)]
+        started = time.perf_counter()
+        try:
+            return self._dispatch_chunks(chunks, allow_failure)
+        finally:
+            elapsed = time.perf_counter() - started
+            per_chunk = elapsed / max(1, len(chunks))
+            if per_chunk < 0.1 and sz < self.BATCH_READ_CHUNK_MAX:
+                self._chunk_size[url] = min(self.BATCH_READ_CHUNK_MAX, sz * 2)
+            elif per_chunk > 2.0 and sz > self.BATCH_READ_CHUNK_MIN:
+                self._chunk_size[url] = max(self.BATCH_READ_CHUNK_MIN, sz // 2)
+
+    def _dispatch_chunks(self, chunks: List[List[Tuple[str, bytes]]], allow_failure: bool) -> List[Tuple[bool, bytes]]:
+        batcher = getattr(self.provider, "make_batch_request", None)
+        if len(chunks) > 1 and callable(batcher) and self.multicall:
+            try:
+                mc = self.multicall
+                reqs = []
+                for part in chunks:
+                    data = mc.encodeABI(fn_name="aggregate3", args=[[
+                        {"target": _cs(t), "allowFailure": allow_failure, "callData": d}
+                        for t, d in part]])
+                    reqs.append(("eth_call", [{"to": mc.address, "data": data}, "latest"]))
+                responses = batcher(reqs)
+                # make_batch_request aligns replies to requests by id, with
+                # None for anything unanswered; a short or unaligned list
+                # would pair chunks with the wrong replies, so refuse it
+                # outright rather than zip-truncate.
+                if len(responses) != len(chunks):
+                    raise ValueError(
+                        f"batch returned {len(responses)} responses for {len(chunks)} chunks")
+                out: List[Tuple[bool, bytes]] = []
+                for part, resp in zip(chunks, responses):
+                    raw = resp.get("result") if isinstance(resp, dict) else None
+                    if not isinstance(raw, str):
+                        out.extend(self._aggregate3(part, allow_failure=allow_failure))
+                        continue
+                    decoded = self.w3.codec.decode(["(bool,bytes)[]"], bytes.fromhex(raw[2:]))[0]
+                    if len(decoded) != len(part):
+                        out.extend(self._aggregate3(part, allow_failure=allow_failure))
+                        continue
+                    out.extend([(r[0], r[1] if type(r[1]) is bytes else bytes(r[1])) for r in decoded])
+                return out
+            except Exception as e:
+                if self.console:
+                    self.console.log(f"[yellow]batched aggregate3 failed, falling back: {e}[/yellow]")
+        # Sequential fallback: each chunk is an independent IO-bound
+        # round-trip, so overlap them instead of paying RTTs back to back.
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as ex:
+                parts = list(ex.map(
+                    lambda part: self._aggregate3(part, allow_failure=allow_failure), chunks))
+            return [r for part in parts for r in part]
+        out = []
+        for part in chunks:
+            out.extend(self._aggregate3(part, allow_failure=allow_failure))
+        return out
+
+    def _batch_eth_call(self, calls: List[Tuple[str, bytes]], *, w3: Optional[Web3] = None,
+                        chunk: int = 25) -> List[Tuple[bool, bytes]]:
+        """
+        eth_call fan-out as JSON-RPC 2.0 batches: one HTTP POST per chunk of
+        25 (public RPCs commonly cap batch length) instead of one round-trip
+        per call. Falls back to sequential eth_call per chunk on batch errors.
+        """
+        w3 = w3 or self.w3
+        provider = getattr(w3, 'provider', None) or self.provider
+        url = getattr(provider, 'current_url', None) or getattr(provider, 'endpoint_uri', None)
         out: List[Tuple[bool, bytes]] = []
-        for target, data in calls:
+        for i in range(0, len(calls), chunk):
+            group = calls[i:i + chunk]
             try:
-                ret = w3.eth.call({'to': w3.to_checksum_address(target), 'data': data})
-                out.append((True, ret))
+                payload = [{"jsonrpc": "2.0", "id": j, "method": "eth_call",
+                            "params": [{"to": _cs(t), "data": "0x" + bytes(d).hex()}, "latest"]}
+                           for j, (t, d) in enumerate(group)]
+                resp = _HTTP_SESSION.post(url, json=payload, timeout=15)
+                resp.raise_for_status()
+                by_id = {r.get("id"): r for r in resp.json()}
+                for j in range(len(group)):
+                    r = by_id.get(j)
+                    if r and isinstance(r.get("result"), str):
+                        out.append((True, bytes.fromhex(r["result"][2:])))
+                    else:
+                        out.append((False, b''))
             except Exception:
-                out.append((False, b''))
+                for t, d in group:
+                    try:
+                        out.append((True, bytes(w3.eth.call({'to': _cs(t), 'data': d}))))
+                    except Exception:
+                        out.append((False, b''))
         return out
         
     def _enc(self, addr: str, fn: str, args=None):
-        c = self.w3.eth.contract(address=self.w3.to_checksum_address(addr), abi=self.erc20_abi)
-        return HexBytes(c.encodeABI(fn_name=fn, args=args or []))
+        # All batched ERC-20 reads have fixed shapes, so build calldata by
+        # concatenating the precomputed selector with padded words instead of
+        # running the full ABI encoder through a Contract object.
+        data = _ERC20_SELECTORS[fn]
+        for a in (args or []):
+            if isinstance(a, int):
+                data += a.to_bytes(32, 'big')
+            else:
+                data += _pad_addr(_cs(a))
+        return HexBytes(data)
     
-    def _decode_string_like(self, data: bytes) -> Optional[str]:
-        """Decode string or bytes32 -> str (handles non-standard ERC-20s)."""
+    @staticmethod
+    def _decode_string_like(data: bytes) -> Optional[str]:
+        """Decode string or bytes32 -> str (handles non-standard ERC-20s).
+
+        The return layout is fixed (offset word + length word + padded bytes,
+        or a raw bytes32), so parse it directly instead of going through the
+        general ABI decoder for every token.
+        """
         if not data:
             return None
-        try:
-            s = self.w3.codec.decode(['string'], data)[0]
-            return s if isinstance(s, str) else s.decode('utf-8', errors='ignore')
-        except Exception:
-            pass
-        try:
-            b32 = self.w3.codec.decode(['bytes32'], data)[0]
-            if isinstance(b32, (bytes, bytearray)):
-                return bytes(b32).rstrip(b'\x00').decode('utf-8', errors='ignore') or None
-        except Exception:
-            pass
-        return None
+        data = bytes(data)
+        if len(data) >= 64:
+            off = int.from_bytes(data[:32], 'big')
+            if 32 <= off <= len(data) - 32:
+                ln = int.from_bytes(data[off:off + 32], 'big')
+                if 0 < ln <= len(data) - off - 32:
+                    return data[off + 32:off + 32 + ln].decode('utf-8', errors='ignore') or None
+                if ln == 0:
+                    return None
+        s = data[:32].rstrip(b'\x00')
+        return s.decode('utf-8', errors='ignore') or None if s else None
     
+    @staticmethod
+    def _dns_encode(name: str) -> bytes:
+        """DNS wire-format encode an ENS name (length-prefixed labels)."""
+        out = b""
+        for label in (name or "").strip(".").split("."):
+            raw = label.encode("utf-8")
+            if not raw or len(raw) > 63:
+                raise ValueError(f"invalid DNS label in {name!r}")
+            out += bytes([len(raw)]) + raw
+        return out + b"\x00"
+
+    def _ens_forward_universal(self, ens_names: List[str]) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Forward-resolve names via the Universal Resolver in one round-trip.
+
+        Each resolve(bytes,bytes) call folds the registry->resolver->addr walk
+        into a single on-chain invocation, and all names ride one aggregate3.
+        Returns (resolved_map, names_to_retry); names whose call failed (e.g.
+        no Universal Resolver on this chain) go back to the registry-walk
+        fallback, while successful calls are authoritative even when they
+        yield no address.
+        """
+        w3 = getattr(self, 'ens_w3', None) or self.w3
+        resolve_sel = Web3.keccak(text="resolve(bytes,bytes)")[:4]
+        addr_sel = Web3.keccak(text="addr(bytes32)")[:4]
+        calls: List[Tuple[str, bytes]] = []
+        encodable: List[str] = []
+        retry: List[str] = []
+        for n in ens_names:
+            try:
+                payload = resolve_sel + w3.codec.encode(
+                    ['bytes', 'bytes'],
+                    [self._dns_encode(n), addr_sel + self._namehash(n)]
+                )
+            except Exception:
+                retry.append(n)
+                continue
+            calls.append((self.ens_universal_resolver, payload))
+            encodable.append(n)
+        out: Dict[str, Optional[str]] = {}
+        if calls:
+            res = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            for n, (ok, data) in zip(encodable, res):
+                if not (ok and data):
+                    retry.append(n)
+                    continue
+                try:
+                    answer, _resolver = w3.codec.decode(['bytes', 'address'], data)
+                    addr = None
+                    if answer:
+                        a = w3.codec.decode(['address'], bytes(answer))[0]
+                        if int(a, 16) != 0:
+                            addr = _cs(a)
+                    out[n] = addr
+                except Exception:
+                    retry.append(n)
+        return out, retry
+
+    def _ens_reverse_universal(self, wallets: List[str]) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Reverse-resolve addresses via the Universal Resolver in one round-trip.
+
+        Mirrors _ens_forward_universal: one reverse(bytes) call per address,
+        batched through aggregate3. Returns (name_map keyed by checksum
+        address, wallets_to_retry).
+        """
+        w3 = getattr(self, 'ens_w3', None) or self.w3
+        reverse_sel = Web3.keccak(text="reverse(bytes)")[:4]
+        calls: List[Tuple[str, bytes]] = []
+        keys: List[str] = []
+        retry: List[str] = []
+        for wallet in wallets:
+            try:
+                checksum = _cs(wallet)
+                reverse_name = f"{checksum[2:].lower()}.addr.reverse"
+                payload = reverse_sel + w3.codec.encode(['bytes'], [self._dns_encode(reverse_name)])
+            except Exception:
+                retry.append(wallet)
+                continue
+            calls.append((self.ens_universal_resolver, payload))
+            keys.append(checksum)
+        out: Dict[str, Optional[str]] = {}
+        if calls:
+            res = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            for checksum, (ok, data) in zip(keys, res):
+                if not (ok and data):
+                    retry.append(checksum)
+                    continue
+                try:
+                    name = w3.codec.decode(['string', 'address', 'address', 'address'], data)[0]
+                    out[checksum] = name or None
+                except Exception:
+                    retry.append(checksum)
+        return out, retry
+
+    def _resolver_group_calls(self, raddr: str, pairs: List[Tuple[str, bytes]], sel: bytes,
+                              w3: Web3, use_multicall: bool) -> List[Tuple[bool, bytes]]:
+        """Read sel(node) for one resolver's (key, node) pairs; raw return data."""
+        if use_multicall and self.ens_multicall is not None:
+            calls = [(raddr, HexBytes(sel + node)) for _, node in pairs]
+            return self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+        res: List[Tuple[bool, bytes]] = []
+        to = _cs(raddr)
+        for _, node in pairs:
+            try:
+                res.append((True, bytes(w3.eth.call({'to': to, 'data': HexBytes(sel + node)}))))
+            except Exception:
+                res.append((False, b''))
+        return res
+
+    def _resolver_fanout(self, groups: List[Tuple[str, List[Tuple[str, bytes]]]], sel: bytes,
+                         w3: Web3, use_multicall: bool) -> List[List[Tuple[bool, bytes]]]:
+        """
+        Run per-resolver reads for every group; IO-bound, so multiple resolver
+        groups (the slow registry-walk path) go through a small thread pool.
+        Eight workers keeps us under typical provider rate limits.
+        """
+        if len(groups) <= 1:
+            return [self._resolver_group_calls(r, p, sel, w3, use_multicall) for r, p in groups]
+        with ThreadPoolExecutor(max_workers=min(8, len(groups))) as ex:
+            return list(ex.map(lambda g: self._resolver_group_calls(g[0], g[1], sel, w3, use_multicall), groups))
+
+    def _ens_cache_put(self, cache: Dict[str, Tuple[float, Optional[str]]],
+                       key: str, value: Optional[str], now: float) -> None:
+        cache[key] = (now + self.ENS_CACHE_TTL, value)
+        if len(cache) > self.ENS_CACHE_MAX:
+            for k in list(cache.keys())[: len(cache) - self.ENS_CACHE_MAX]:
+                cache.pop(k, None)
+
+    def _token_meta_get(self, token: str, field: str):
+        entry = self._token_meta_cache.get((self._chain_id, token))
+        return entry.get(field) if entry else None
+
+    def _token_meta_put(self, token: str, field: str, value) -> None:
+        key = (self._chain_id, token)
+        entry = self._token_meta_cache.get(key)
+        if entry is None:
+            if len(self._token_meta_cache) >= self.TOKEN_META_MAX:
+                for k in list(self._token_meta_cache.keys())[
+                        : len(self._token_meta_cache) - self.TOKEN_META_MAX + 1]:
+                    self._token_meta_cache.pop(k, None)
+            entry = self._token_meta_cache[key] = {}
+        entry[field] = value
+
+    def invalidate_ens(self, name_or_addr: str) -> None:
+        """Force the next resolution of this wallet/name to hit the network."""
+        if name_or_addr.startswith(("0x", "0X")):
+            self._ens_rev_cache.pop(_cs(name_or_addr), None)
+        else:
+            self._ens_fwd_cache.pop(name_or_addr.lower(), None)
+
     def batch_ens_reverse(self, wallets: List[str], use_multicall: bool=True) -> Dict[str, Optional[str]]:
+        now = time.time()
+        out: Dict[str, Optional[str]] = {}
+        pending: List[str] = []
+        for w in wallets:
+            k = _cs(w)
+            e = self._ens_rev_cache.get(k)
+            if e and e[0] > now:
+                out[k] = e[1]
+            else:
+                pending.append(k)
+        if pending:
+            resolved = self._batch_ens_reverse_uncached(pending, use_multicall=use_multicall)
+            for k, v in resolved.items():
+                self._ens_cache_put(self._ens_rev_cache, k, v, now)
+            out.update(resolved)
+        return out
+
+    def _batch_ens_reverse_uncached(self, wallets: List[str], use_multicall: bool=True) -> Dict[str, Optional[str]]:
         w3 = getattr(self, 'ens_w3', None) or self.w3
         registry = self.ens_registry
-        nodes = {w3.to_checksum_address(w): self._reverse_node(w) for w in wallets}
 
+        universal: Dict[str, Optional[str]] = {}
+        if use_multicall and self.ens_multicall is not None and getattr(self, 'ens_universal_resolver', None):
+            universal, wallets = self._ens_reverse_universal(wallets)
+            if not wallets:
+                return universal
+
+        # Parallel arrays indexed by wallet position; dicts only at the edges.
+        keys = [_cs(w) for w in wallets]
+        nodes = [self._reverse_node(k) for k in keys]
+        n = len(keys)
+        resolvers: List[str] = [ZERO_ADDRESS] * n
+        out_vals: List[Optional[str]] = [None] * n
+
+        spec_resolver = None
+        spec_res: List[Tuple[bool, bytes]] = []
         if use_multicall and self.ens_multicall is not None:
-            calls = [(registry.address, registry.encodeABI(fn_name='resolver', args=[node])) for node in nodes.values()]
-            res = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            calls = [(registry.address, HexBytes(SEL_ENS_RESOLVER + node)) for node in nodes]
+            # Speculatively pack name(node) against the canonical public
+            # resolver in the same aggregate3: wallets whose registry answer
+            # matches it skip the second round-trip entirely.
+            if getattr(self, 'ens_public_resolver', None):
+                try:
+                    spec_resolver = w3.eth.contract(
+                        address=_cs(self.ens_public_resolver),
+                        abi=self.ens_resolver_abi,
+                    )
+                    calls += [(spec_resolver.address, HexBytes(SEL_ENS_NAME + node)) for node in nodes]
+                except Exception:
+                    spec_resolver = None
+            res_all = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            res = res_all[:n]
+            if spec_resolver is not None:
+                spec_res = res_all[n:]
         else:
             res = []
-            for node in nodes.values():
+            for node in nodes:
                 try:
                     r = registry.functions.resolver(node).call()
                     res.append((True, w3.codec.encode(['address'], [r])))
                 except Exception:
                     res.append((False, b''))
 
-        resolvers: Dict[str, str] = {}
-        for (wallet, node), (ok, data) in zip(nodes.items(), res):
+        for i, (ok, data) in enumerate(res):
             if ok and data and len(data) >= 32:
-                try:
-                    raddr = w3.codec.decode(['address'], data)[0]
-                    resolvers[wallet] = raddr
-                except Exception:
-                    resolvers[wallet] = '0x0000000000000000000000000000000000000000'
-            else:
-                resolvers[wallet] = '0x0000000000000000000000000000000000000000'
-
-        out: Dict[str, Optional[str]] = {w: None for w in wallets}
-        by_resolver: Dict[str, List[Tuple[str, bytes]]] = {}
-        for w, node in nodes.items():
-            r = resolvers.get(w)
-            if r and int(r, 16) != 0:
-                by_resolver.setdefault(r, []).append((w, node))
-
-        for raddr, pairs in by_resolver.items():
-            resolver = w3.eth.contract(address=w3.to_checksum_address(raddr), abi=self.ens_resolver_abi)
-            if use_multicall and self.ens_multicall is not None:
-                calls = [(raddr, resolver.encodeABI(fn_name='name', args=[node])) for _, node in pairs]
-                res2 = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
-            else:
-                res2 = []
-                for _, node in pairs:
+                # Single right-aligned word; slice the address out instead of
+                # dispatching through the ABI grammar per result.
+                resolvers[i] = '0x' + data[12:32].hex()
+
+        # Harvest the speculative reads whose resolver guess was right.
+        satisfied = [False] * n
+        if spec_resolver is not None and spec_res:
+            spec_key = spec_resolver.address.lower()
+            for i, (ok, data) in enumerate(spec_res):
+                if resolvers[i].lower() == spec_key and ok and data:
                     try:
-                        nm = resolver.functions.name(node).call()
-                        res2.append((True, w3.codec.encode(['string'], [nm])))
+                        out_vals[i] = spec_resolver.decode_function_output('name', data)[0] or None
+                        satisfied[i] = True
                     except Exception:
-                        res2.append((False, b''))
-            for (wallet, _node), (ok, data) in zip(pairs, res2):
+                        pass
+
+        by_resolver: Dict[str, List[int]] = {}
+        for i in range(n):
+            r = resolvers[i]
+            if not satisfied[i] and int(r, 16) != 0:
+                by_resolver.setdefault(r, []).append(i)
+
+        groups = [(r, [(i, nodes[i]) for i in idxs]) for r, idxs in by_resolver.items()]
+        for (raddr, pairs), res2 in zip(groups, self._resolver_fanout(groups, SEL_ENS_NAME, w3, use_multicall)):
+            for (i, _node), (ok, data) in zip(pairs, res2):
                 if ok and data:
                     try:
-                        nm = resolver.decode_function_output('name', data)[0]
-                        out[wallet] = nm or None
+                        nm = w3.codec.decode(['string'], data)[0]
+                        out_vals[i] = nm or None
                     except Exception:
-                        out[wallet] = None
-        return out
+                        out_vals[i] = None
+        universal.update(zip(keys, out_vals))
+        return universal
 
 
 
     def batch_ens_forward(self, ens_names: List[str], use_multicall: bool=True) -> Dict[str, Optional[str]]:
+        now = time.time()
+        out: Dict[str, Optional[str]] = {}
+        pending: List[str] = []
+        for nm in ens_names:
+            k = nm.lower()
+            e = self._ens_fwd_cache.get(k)
+            if e and e[0] > now:
+                out[k] = e[1]
+            else:
+                pending.append(k)
+        if pending:
+            resolved = self._batch_ens_forward_uncached(pending, use_multicall=use_multicall)
+            for k, v in resolved.items():
+                self._ens_cache_put(self._ens_fwd_cache, k, v, now)
+            out.update(resolved)
+        return out
+
+    def _batch_ens_forward_uncached(self, ens_names: List[str], use_multicall: bool=True) -> Dict[str, Optional[str]]:
         w3 = getattr(self, 'ens_w3', None) or self.w3
         registry = self.ens_registry
-        name_nodes = {n: self._namehash(n) for n in ens_names}
 
+        universal: Dict[str, Optional[str]] = {}
+        if use_multicall and self.ens_multicall is not None and getattr(self, 'ens_universal_resolver', None):
+            universal, ens_names = self._ens_forward_universal(ens_names)
+            if not ens_names:
+                return universal
+
+        # Same SoA layout as batch_ens_reverse: index-parallel arrays.
+        names = list(dict.fromkeys(ens_names))
+        nodes = [self._namehash(nm) for nm in names]
+        n = len(names)
+        resolvers: List[str] = [ZERO_ADDRESS] * n
+        out_vals: List[Optional[str]] = [None] * n
+
+        spec_resolver = None
+        spec_res: List[Tuple[bool, bytes]] = []
         if use_multicall and self.ens_multicall is not None:
-            calls = [(registry.address, registry.encodeABI(fn_name='resolver', args=[node])) for node in name_nodes.values()]
-            res = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            calls = [(registry.address, HexBytes(SEL_ENS_RESOLVER + node)) for node in nodes]
+            # Speculative addr(node) reads against the canonical public
+            # resolver ride the same aggregate3 (see batch_ens_reverse).
+            if getattr(self, 'ens_public_resolver', None):
+                try:
+                    spec_resolver = w3.eth.contract(
+                        address=_cs(self.ens_public_resolver),
+                        abi=self.ens_resolver_abi,
+                    )
+                    calls += [(spec_resolver.address, HexBytes(SEL_ENS_ADDR + node)) for node in nodes]
+                except Exception:
+                    spec_resolver = None
+            res_all = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
+            res = res_all[:n]
+            if spec_resolver is not None:
+                spec_res = res_all[n:]
         else:
             res = []
-            for node in name_nodes.values():
+            for node in nodes:
                 try:
                     r = registry.functions.resolver(node).call()
                     res.append((True, w3.codec.encode(['address'], [r])))
                 except Exception:
                     res.append((False, b''))
 
-        resolvers: Dict[str, str] = {}
-        for (nm, node), (ok, data) in zip(name_nodes.items(), res):
+        for i, (ok, data) in enumerate(res):
             if ok and data and len(data) >= 32:
-                try:
-                    raddr = w3.codec.decode(['address'], data)[0]
-                    resolvers[nm] = raddr
-                except Exception:
-                    resolvers[nm] = '0x0000000000000000000000000000000000000000'
-            else:
-                resolvers[nm] = '0x0000000000000000000000000000000000000000'
-
-        out: Dict[str, Optional[str]] = {n: None for n in ens_names}
-        by_resolver: Dict[str, List[Tuple[str, bytes]]] = {}
-        for nm, node in name_nodes.items():
-            r = resolvers.get(nm)
-            if r and int(r, 16) != 0:
-                by_resolver.setdefault(r, []).append((nm, node))
-
-        for raddr, pairs in by_resolver.items():
-            resolver = w3.eth.contract(address=w3.to_checksum_address(raddr), abi=self.ens_resolver_abi)
-            if use_multicall and self.ens_multicall is not None:
-                calls = [(raddr, resolver.encodeABI(fn_name='addr', args=[node])) for _, node in pairs]
-                res2 = self._aggregate3(calls, allow_failure=True, w3=w3, contract=self.ens_multicall)
-            else:
-                res2 = []
-                for _, node in pairs:
+                # Single right-aligned word; slice the address out instead of
+                # dispatching through the ABI grammar per result.
+                resolvers[i] = '0x' + data[12:32].hex()
+
+        satisfied = [False] * n
+        if spec_resolver is not None and spec_res:
+            spec_key = spec_resolver.address.lower()
+            for i, (ok, data) in enumerate(spec_res):
+                if resolvers[i].lower() == spec_key and ok and data and len(data) >= 32:
                     try:
-                        a = resolver.functions.addr(node).call()
-                        res2.append((True, w3.codec.encode(['address'], [a])))
+                        a = '0x' + data[12:32].hex()
+                        out_vals[i] = _cs(a) if int(a, 16) != 0 else None
+                        satisfied[i] = True
                     except Exception:
-                        res2.append((False, b''))
-            for (nm, _node), (ok, data) in zip(pairs, res2):
+                        pass
+
+        by_resolver: Dict[str, List[int]] = {}
+        for i in range(n):
+            r = resolvers[i]
+            if not satisfied[i] and int(r, 16) != 0:
+                by_resolver.setdefault(r, []).append(i)
+
+        groups = [(r, [(i, nodes[i]) for i in idxs]) for r, idxs in by_resolver.items()]
+        for (raddr, pairs), res2 in zip(groups, self._resolver_fanout(groups, SEL_ENS_ADDR, w3, use_multicall)):
+            for (i, _node), (ok, data) in zip(pairs, res2):
                 if ok and data and len(data) >= 32:
                     try:
-                        a = w3.codec.decode(['address'], data)[0]
-                        out[nm] = w3.to_checksum_address(a) if int(a, 16) != 0 else None
+                        a = '0x' + data[12:32].hex()
+                        out_vals[i] = _cs(a) if int(a, 16) != 0 else None
                     except Exception:
-                        out[nm] = None
-        return out
+                        out_vals[i] = None
+        universal.update(zip(names, out_vals))
+        return universal
 
     # ---------- Gas ----------
     def fetch_suggested_fees(self, api_url: Optional[str], tier: str = 'medium') -> Tuple[Optional[int], Optional[int]]:
-        import requests
         try:
             if not api_url:
                 raise ValueError("No gas API URL provided")
 
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
-            gas_data = response.json()  # Fixed: Called json() as a method
+            cached = _FEES_CACHE.get(api_url)
+            if cached and time.time() - cached[0] < _FEES_TTL:
+                gas_data = cached[1]
+            else:
+                response = _HTTP_SESSION.get(api_url, timeout=10)
+                response.raise_for_status()
+                gas_data = response.json()  # Fixed: Called json() as a method
+                _FEES_CACHE[api_url] = (time.time(), gas_data)
 
             # Check if gas_data has the expected structure
             if tier not in gas_data:
@@ -523,72 +1426,183 @@ class Web3Helper:
             time.sleep(delay)
             delay = min(max_delay, delay * 1.5)
 
+    def wait_for_receipts(self, tx_hashes, timeout: int = 300, start_delay: float = 2,
+                          max_delay: float = 8, max_workers: int = 8) -> Dict[str, Optional[dict]]:
+        """
+        Wait for several receipts concurrently. Polling is network-bound, so
+        overlapping the waits in a small thread pool collapses N sequential
+        waits into roughly the slowest one. Returns hash -> receipt, with
+        None for transactions that timed out or errored.
+        """
+        if not tx_hashes:
+            return {}
+        out: Dict[str, Optional[dict]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tx_hashes))) as ex:
+            futures = {
+                ex.submit(self.wait_for_receipt, h, timeout, start_delay, max_delay): h
+                for h in tx_hashes
+            }
+            for fut, h in futures.items():
+                key = h.hex() if hasattr(h, 'hex') else str(h)
+                try:
+                    out[key] = fut.result()
+                except Exception:
+                    out[key] = None
+        return out
+
     # ---------- ERC20 ----------
     def _erc20(self, token_address: str):
-        return self.w3.eth.contract(address=self.w3.to_checksum_address(token_address), abi=self.erc20_abi)
+        key = _cs(token_address)
+        c = self._erc20_cache.get(key)
+        if c is None:
+            c = self.w3.eth.contract(address=key, abi=self.erc20_abi)
+            self._erc20_cache[key] = c
+        return c
 
     def check_token_balance(self, token_address: str, account_address: str) -> Optional[int]:
         if not token_address:
             return None
-        if token_address.lower() in {NATIVE_SENTINEL, getattr(self.chain_config, 'NATIVE_TOKEN', '').lower()}:
+        if token_address.lower() in self._native_set:
             try:
-                return int(self.w3.eth.get_balance(self.w3.to_checksum_address(account_address)))
+                return int(self.w3.eth.get_balance(_cs(account_address)))
             except Exception:
                 return None
-        try:
-            c = self._erc20(token_address)
-            return int(c.functions.balanceOf(self.w3.to_checksum_address(account_address)).call())
-        except Exception:
-            return None
+        res = self.batch_check_balances([(token_address, account_address)])
+        return res[0] if res else None
 
     def check_allowance(self, token_address: str, owner_address: str, spender_address: str) -> Optional[int]:
+        res = self.batch_check_allowances([(token_address, owner_address, spender_address)])
+        return res[0] if res else None
+
+    # Chunk size for batched reads; keeps each aggregate3 payload well under
+    # typical RPC request-size and gas caps. The fused fetch path tunes its
+    # per-URL size between the MIN/MAX bounds from observed latency.
+    BATCH_READ_CHUNK = 500
+    BATCH_READ_CHUNK_MIN = 50
+    BATCH_READ_CHUNK_MAX = 1500
+
+    def batch_check_balances(self, pairs: List[Tuple[str, str]]) -> List[Optional[int]]:
+        """balanceOf for many (token, account) pairs via chunked aggregate3.
+
+        One round-trip per chunk instead of one eth_call per pair; failed or
+        malformed entries come back as None in position.
+        """
+        out: List[Optional[int]] = []
+        for i in range(0, len(pairs), self.BATCH_READ_CHUNK):
+            calls = [(t, HexBytes(SEL_BALANCEOF + _pad_addr(_cs(a))))
+                     for t, a in pairs[i:i + self.BATCH_READ_CHUNK]]
+            for ok, data in self._aggregate3(calls, allow_failure=True):
+                out.append(int.from_bytes(data[:32], 'big') if ok and len(data) >= 32 else None)
+        return out
+
+    def batch_check_allowances(self, triples: List[Tuple[str, str, str]]) -> List[Optional[int]]:
+        """allowance for many (token, owner, spender) triples via chunked aggregate3."""
+        out: List[Optional[int]] = []
+        for i in range(0, len(triples), self.BATCH_READ_CHUNK):
+            calls = [(t, HexBytes(SEL_ALLOWANCE + _pad_addr(_cs(o)) + _pad_addr(_cs(s))))
+                     for t, o, s in triples[i:i + self.BATCH_READ_CHUNK]]
+            for ok, data in self._aggregate3(calls, allow_failure=True):
+                out.append(int.from_bytes(data[:32], 'big') if ok and len(data) >= 32 else None)
+        return out
+
+    def prepare_send_context(self, senders: List[str], chunk: int = 100) -> Dict[str, Tuple[int, int, int]]:
+        """
+        One JSON-RPC batch for the pre-flight reads of a send burst.
+        Returns sender -> (pending nonce, gasPrice, maxPriorityFee); pass the
+        dict as ctx= to send_erc20/send_approval so K signers cost one
+        round-trip of nonce/fee lookups instead of 3*K.
+        """
+        senders = [_cs(s) for s in senders]
+        ctx: Dict[str, Tuple[int, int, int]] = {}
         try:
-            c = self._erc20(token_address)
-            return int(c.functions.allowance(
-                self.w3.to_checksum_address(owner_address),
-                self.w3.to_checksum_address(spender_address)
-            ).call())
-        except Exception:
-            return None
+            url = self.provider.current_url
+            gas_price: Optional[int] = None
+            prio: Optional[int] = None
+            for i in range(0, len(senders), chunk):
+                group = senders[i:i + chunk]
+                payload = [{"jsonrpc": "2.0", "id": j, "method": "eth_getTransactionCount",
+                            "params": [a, "pending"]} for j, a in enumerate(group)]
+                if gas_price is None:
+                    payload.append({"jsonrpc": "2.0", "id": len(group), "method": "eth_gasPrice", "params": []})
+                    payload.append({"jsonrpc": "2.0", "id": len(group) + 1, "method": "eth_maxPriorityFeePerGas", "params": []})
+                resp = _HTTP_SESSION.post(url, json=payload, timeout=15)
+                resp.raise_for_status()
+                by_id = {r.get("id"): r for r in resp.json()}
+                if gas_price is None:
+                    gas_price = int(by_id[len(group)]["result"], 16)
+                    prio_r = by_id.get(len(group) + 1, {})
+                    prio = int(prio_r["result"], 16) if "result" in prio_r else int(self.w3.eth.max_priority_fee)
+                for j, a in enumerate(group):
+                    ctx[a] = (int(by_id[j]["result"], 16), gas_price, prio)
+            return ctx
+        except Exception as e:
+            if self.console:
+                self.console.log(f"[yellow]batched send-context fetch failed, falling back: {e}[/yellow]")
+        gas_price = int(self.w3.eth.gas_price)
+        prio = int(self.w3.eth.max_priority_fee)
+        for a in senders:
+            try:
+                ctx[a] = (int(self.w3.eth.get_transaction_count(a, 'pending')), gas_price, prio)
+            except Exception:
+                continue
+        return ctx
+
+    def _tx_fields(self, sender: str, max_fee_per_gas: Optional[int],
+                   max_priority_fee_per_gas: Optional[int],
+                   ctx: Optional[Dict[str, Tuple[int, int, int]]]) -> Tuple[int, int, int]:
+        """Nonce and fee fields for one tx, from ctx when available."""
+        entry = ctx.get(sender) if ctx else None
+        if entry:
+            nonce, gas_price, prio = entry
+        else:
+            nonce = self.w3.eth.get_transaction_count(sender)
+            gas_price = prio = None
+        return (nonce,
+                max_fee_per_gas or gas_price or self.w3.eth.gas_price,
+                max_priority_fee_per_gas or prio or self.w3.eth.max_priority_fee)
 
     def send_approval(self, private_key: str, token_address: str, spender: str, amount: int,
-                      max_fee_per_gas: Optional[int] = None, max_priority_fee_per_gas: Optional[int] = None) -> HexBytes:
+                      max_fee_per_gas: Optional[int] = None, max_priority_fee_per_gas: Optional[int] = None,
+                      ctx: Optional[Dict[str, Tuple[int, int, int]]] = None) -> HexBytes:
         acct = Account.from_key(private_key)
+        nonce, max_fee, prio = self._tx_fields(acct.address, max_fee_per_gas, max_priority_fee_per_gas, ctx)
         c = self._erc20(token_address)
-        tx = c.functions.approve(self.w3.to_checksum_address(spender), int(amount)).build_transaction({
+        tx = c.functions.approve(_cs(spender), int(amount)).build_transaction({
             'from': acct.address,
-            'chainId': int(getattr(self.chain_config, 'CHAIN_ID', 0)),
-            'nonce': self.w3.eth.get_transaction_count(acct.address),
+            'chainId': self._chain_id,
+            'nonce': nonce,
             'type': 2,
-            'maxFeePerGas': max_fee_per_gas or self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': max_priority_fee_per_gas or self.w3.eth.max_priority_fee,
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': prio,
         })
         signed = self.w3.eth.account.sign_transaction(tx, private_key=private_key)
         return self.w3.eth.send_raw_transaction(signed.rawTransaction)
 
     def send_erc20(self, private_key: str, token_address: str, to: str, amount_wei: int,
-                   max_fee_per_gas: Optional[int] = None, max_priority_fee_per_gas: Optional[int] = None) -> HexBytes:
+                   max_fee_per_gas: Optional[int] = None, max_priority_fee_per_gas: Optional[int] = None,
+                   ctx: Optional[Dict[str, Tuple[int, int, int]]] = None) -> HexBytes:
         acct = Account.from_key(private_key)
-        if token_address.lower() in {NATIVE_SENTINEL, getattr(self.chain_config, 'NATIVE_TOKEN', '').lower()}:
+        nonce, max_fee, prio = self._tx_fields(acct.address, max_fee_per_gas, max_priority_fee_per_gas, ctx)
+        if token_address.lower() in self._native_set:
             tx = {
                 'from': acct.address,
-                'to': self.w3.to_checksum_address(to),
+                'to': _cs(to),
                 'value': int(amount_wei),
-                'chainId': int(getattr(self.chain_config, 'CHAIN_ID', 0)),
-                'nonce': self.w3.eth.get_transaction_count(acct.address),
+                'chainId': self._chain_id,
+                'nonce': nonce,
                 'type': 2,
-                'maxFeePerGas': max_fee_per_gas or self.w3.eth.gas_price,
-                'maxPriorityFeePerGas': max_priority_fee_per_gas or self.w3.eth.max_priority_fee,
+                'maxFeePerGas': max_fee,
+                'maxPriorityFeePerGas': prio,
             }
         else:
             c = self._erc20(token_address)
-            tx = c.functions.transfer(self.w3.to_checksum_address(to), int(amount_wei)).build_transaction({
+            tx = c.functions.transfer(_cs(to), int(amount_wei)).build_transaction({
                 'from': acct.address,
-                'chainId': int(getattr(self.chain_config, 'CHAIN_ID', 0)),
-                'nonce': self.w3.eth.get_transaction_count(acct.address),
+                'chainId': self._chain_id,
+                'nonce': nonce,
                 'type': 2,
-                'maxFeePerGas': max_fee_per_gas or self.w3.eth.gas_price,
-                'maxPriorityFeePerGas': max_priority_fee_per_gas or self.w3.eth.max_priority_fee,
+                'maxFeePerGas': max_fee,
+                'maxPriorityFeePerGas': prio,
             })
         signed = self.w3.eth.account.sign_transaction(tx, private_key=private_key)
         return self.w3.eth.send_raw_transaction(signed.rawTransaction)
@@ -599,226 +1613,39 @@ class Web3Helper:
         Returns (addresses, ens_names) and also stores them on the helper.
         """
         try:
-            with open(wallet_file, "r", encoding="utf-8-sig") as f:
-                blob = f.read()
+            # Memory-map instead of .read(): the scanner walks the OS page
+            # cache directly, so a large dump never gets copied into a str.
+            with open(wallet_file, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty file
+                    self.wallet_addresses, self.ens_names = [], []
+                    return ([], [])
+                try:
+                    view = memoryview(mm)
+                    if mm[:3] == b"\xef\xbb\xbf":  # UTF-8 BOM
+                        view = view[3:]
+                    addrs, ens = self._parse_wallets_blob(view)
+                finally:
+                    view.release()
+                    mm.close()
         except Exception as e:
             if self.console:
                 self.console.log(f"[red]Failed to read wallets file {wallet_file}: {e}[/red]")
             self.wallet_addresses, self.ens_names = [], []
             return ([], [])
-        addrs, ens = self._parse_wallets_blob(blob)
         self.wallet_addresses, self.ens_names = addrs, ens
         return (addrs, ens)
 
     def load_wallets_gui(self) -> tuple[list[str], list[str]]:
         try:
-            import customtkinter as ctk
-
-            class WalletInputDialog:
-                def __init__(self):
-                    # Configure appearance
-                    ctk.set_appearance_mode("dark")
-                    ctk.set_default_color_theme("blue")
-                    self.root = ctk.CTk()
-                    self.root.title("Wallet Input")
-                    self.root.geometry("600x500")
-                    self.root.resizable(True, True)
-                    self.root.eval('tk::PlaceWindow . center')
-                    self.root.protocol("WM_DELETE_WINDOW", self.on_cancel)
-                    self.result = None
-                    self.destroyed = False
-                    self.setup_ui()
-                    # Ensure window appears centered and focused/selected after launch
-                    try:
-                        self.root.after(100, self.center_and_focus)
-                    except Exception:
-                        pass
-                
-                def setup_ui(self):
-                    # Main container with modern styling
-                    main_frame = ctk.CTkFrame(self.root, corner_radius=15)
-                    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-                    # Header section
-                    header_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    header_frame.pack(fill="x", padx=20, pady=(20, 10))
-                    # Icon and title
-                    icon_label = ctk.CTkLabel(
-                        header_frame, 
-                        text="👛",
-                        font=("Arial", 24),
-                        text_color="#4CC9F0"
-                    )
-                    icon_label.pack(side="left", padx=(0, 10))
-                    
-                    title_label = ctk.CTkLabel(
-                        header_frame,
-                        text="Add Wallet Addresses",
-                        font=("Arial", 20, "bold"),
-                        text_color="white"
-                    )
-                    title_label.pack(side="left")
-                    
-                    # Instructions
-                    instructions = ctk.CTkLabel(
-                        main_frame,
-                        text="Enter wallet addresses and/or ENS names\nYou can separate them with commas, spaces, or newlines",
-                        font=("Arial", 14),
-                        text_color="#B0B0B0",
-                        justify="left"
-                    )
-                    instructions.pack(pady=(0, 20))
-                    
-                    # Text input area with modern styling
-                    input_frame = ctk.CTkFrame(main_frame, corner_radius=10)
-                    input_frame.pack(fill="both", expand=True, padx=20, pady=10)
-                    
-                    self.text_widget = ctk.CTkTextbox(
-                        input_frame,
-                        height=200,
-                        border_width=0,
-                        corner_radius=8,
-                        fg_color="#2B2B2B",
-                        text_color="white",
-                        font=("Consolas", 12),
-                        wrap="word"
-                    )
-                    self.text_widget.pack(fill="both", expand=True, padx=10, pady=10)
-                    self.text_widget.focus_set()
-                    
-                    # Character counter
-                    self.counter_var = StringVar(value="0 characters")
-                    counter_label = ctk.CTkLabel(
-                        main_frame,
-                        textvariable=self.counter_var,
-                        font=("Arial", 11),
-                        text_color="#808080"
-                    )
-                    counter_label.pack(pady=(5, 0))
-
-                    self.setup_counter_updater()
-                    
-                    # Button frame
-                    button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    button_frame.pack(fill="x", padx=20, pady=20)
-                    
-                    # Cancel button
-                    cancel_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Cancel",
-                        command=self.on_cancel,
-                        fg_color="transparent",
-                        border_width=2,
-                        text_color=("black", "white"),
-                        hover_color="#3A3A3A",
-                        font=("Arial", 14, "bold")
-                    )
-                    cancel_btn.pack(side="left", padx=(0, 10))
-                    
-                    # Submit button
-                    submit_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Import Wallets",
-                        command=self.on_submit,
-                        fg_color="#4CC9F0",
-                        hover_color="#3AA8CC",
-                        font=("Arial", 14, "bold"),
-                        text_color="white"
-                    )
-                    submit_btn.pack(side="right")
-                    
-                    # Bind Enter key to submit
-                    self.root.bind('<Return>', lambda e: self.on_submit())
-                    self.root.bind('<Escape>', lambda e: self.on_cancel())
-                    
-                    # Update counter initially
-                    self.update_counter()
-
-                def center_and_focus(self):
-                    try:
-                        # Compute geometry and center
-                        self.root.update_idletasks()
-                        w = self.root.winfo_width() or 600
-                        h = self.root.winfo_height() or 500
-                        # If not yet realized, parse from current geometry string
-                        if w <= 1 or h <= 1:
-                            try:
-                                g = self.root.geometry()
-                                size = g.split('+')[0]
-                                w, h = [int(x) for x in size.split('x')]
-                            except Exception:
-                                w, h = 600, 500
-                        sw = self.root.winfo_screenwidth()
-                        sh = self.root.winfo_screenheight()
-                        x = max(0, (sw - w) // 2)
-                        y = max(0, (sh - h) // 2)
-                        self.root.geometry(f"+{x}+{y}")
-
-                        # Bring to front and focus so users don't need to re-select
-                        self.root.deiconify()
-                        self.root.lift()
-                        # temporary topmost to steal focus on Windows, then drop it
-                        self.root.attributes('-topmost', True)
-                        self.root.after(300, lambda: self.root.attributes('-topmost', False))
-                        # focus window and primary input
-                        self.root.focus_force()
-                        try:
-                            self.text_widget.focus_set()
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
-                
-                def setup_counter_updater(self):
-                    def poll_counter():
-                        if not self.destroyed:
-                            self.update_counter()
-                            self.root.after(500, poll_counter)
-                    self.root.after(500, poll_counter)
-
-                def update_counter(self, event=None):
-                    try: 
-                        if self.destroyed:
-                            return
-                        text = self.text_widget.get("1.0", "end-1c")
-                        char_count = len(text)
-                        items = [x for x in text.replace(',', ' ').replace('\n', ' ').split() if x.strip()]
-                        item_count = len(items)
-                        self.counter_var.set(f"{char_count} characters, {item_count} items")
-                    except Exception:
-                        # Ignore errors during update
-                        pass
-                
-                def on_submit(self):
-                    try:
-                        text = self.text_widget.get("1.0", "end-1c").strip()
-                        self.result = text
-                        self.cleanup()
-                    except Exception:
-                        self.result = ""
-                        self.cleanup()
-                    
-                def on_cancel(self):
-                    self.result = ""
-                    self.cleanup()
-                
-                def cleanup(self):
-                    """Proper cleanup to avoid after script errors"""
-                    self.destroyed = True
-                    try:
-                        self.root.quit()
-                    except:
-                        pass
-                    try:
-                        self.root.destroy()
-                    except:
-                        pass
-
-                def get_input(self):
-                    self.root.mainloop()
-                    return self.result
-            
-            # Create and run the dialog
-            dialog = WalletInputDialog()
+            dialog = _PasteDialog(
+                title="Wallet Input",
+                icon="👛",
+                heading="Add Wallet Addresses",
+                instructions="Enter wallet addresses and/or ENS names\nYou can separate them with commas, spaces, or newlines",
+                submit_label="Import Wallets",
+            )
             blob = dialog.get_input()
             
         except Exception as e:
@@ -833,15 +1660,9 @@ class Web3Helper:
         # Show success message if we have results
         if addrs or ens:
             success_msg = f"Successfully imported {len(addrs)} addresses and {len(ens)} ENS names"
-            try:
-                # Show a brief success notification
-                import tkinter as tk
-                from tkinter import messagebox
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showinfo("Success", success_msg)
-                root.destroy()
-            except:
+            if self.console:
+                self.console.log(f"[green]{success_msg}[/green]")
+            else:
                 print(success_msg)
         
         return (addrs, ens)
@@ -852,7 +1673,7 @@ class Web3Helper:
         CLI prompt (newline/comma/space separated). Accepts addresses and ENS names.
         """
         try:
-            import questionary as q
+            q = _get_questionary()
             blob = q.text("Paste wallet addresses and/or ENS names:").ask()
         except Exception:
             blob = input("Paste wallet addresses and/or ENS names: ").strip()
@@ -862,8 +1683,12 @@ class Web3Helper:
     
     def load_tokens_file(self, token_file: str) -> list[str]:
         try:
-            with open(token_file, "r", encoding="utf-8-sig") as f:
+            # Binary read: addresses are ASCII, so the utf-8-sig codec pass
+            # was pure overhead - the tokenizer scans bytes directly.
+            with open(token_file, "rb") as f:
                 blob = f.read()
+            if blob[:3] == b"\xef\xbb\xbf":
+                blob = blob[3:]
         except Exception as e:
             if self.console:
                 self.console.log(f"[red]Failed to read tokens file {token_file}: {e}[/red]")
@@ -875,7 +1700,7 @@ class Web3Helper:
 
     def load_tokens_cli(self) -> list[str]:
         try:
-            import questionary as q
+            q = _get_questionary()
             blob = q.text("Paste token addresses (comma/newline/space separated):").ask()
         except Exception:
             blob = input("Paste token addresses: ").strip()
@@ -885,203 +1710,13 @@ class Web3Helper:
 
     def load_tokens_gui(self) -> list[str]:
         try:
-            import customtkinter as ctk
-        
-            class TokenInputDialog:
-                def __init__(self):
-                    # Configure appearance
-                    ctk.set_appearance_mode("dark")
-                    ctk.set_default_color_theme("blue")
-                    self.root = ctk.CTk()
-                    self.root.title("Token Input")
-                    self.root.geometry("600x500")
-                    self.root.resizable(True, True)
-                    self.root.eval('tk::PlaceWindow . center')
-                    self.root.protocol("WM_DELETE_WINDOW", self.on_cancel)
-                    self.result = None
-                    self.destroyed = False
-                    self.setup_ui()
-                    # Ensure window appears centered and focused/selected after launch
-                    try:
-                        self.root.after(100, self.center_and_focus)
-                    except Exception:
-                        pass
-                
-                def setup_ui(self):
-                    # Main container with modern styling
-                    main_frame = ctk.CTkFrame(self.root, corner_radius=15)
-                    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-                    # Header section
-                    header_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    header_frame.pack(fill="x", padx=20, pady=(20, 10))
-                    # Icon and title
-                    icon_label = ctk.CTkLabel(
-                        header_frame, 
-                        text="👛",
-                        font=("Arial", 24),
-                        text_color="#4CC9F0"
-                    )
-                    icon_label.pack(side="left", padx=(0, 10))
-                    
-                    title_label = ctk.CTkLabel(
-                        header_frame,
-                        text="Add Token Addresses",
-                        font=("Arial", 20, "bold"),
-                        text_color="white"
-                    )
-                    title_label.pack(side="left")
-                    
-                    # Instructions
-                    instructions = ctk.CTkLabel(
-                        main_frame,
-                        text="Enter token addresses\nYou can separate them with commas, spaces, or newlines",
-                        font=("Arial", 14),
-                        text_color="#B0B0B0",
-                        justify="left"
-                    )
-                    instructions.pack(pady=(0, 20))
-                    
-                    # Text input area with modern styling
-                    input_frame = ctk.CTkFrame(main_frame, corner_radius=10)
-                    input_frame.pack(fill="both", expand=True, padx=20, pady=10)
-                    
-                    self.text_widget = ctk.CTkTextbox(
-                        input_frame,
-                        height=200,
-                        border_width=0,
-                        corner_radius=8,
-                        fg_color="#2B2B2B",
-                        text_color="white",
-                        font=("Consolas", 12),
-                        wrap="word"
-                    )
-                    self.text_widget.pack(fill="both", expand=True, padx=10, pady=10)
-                    self.text_widget.focus_set()
-                    
-                    # Character counter
-                    self.counter_var = StringVar(value="0 characters")
-                    counter_label = ctk.CTkLabel(
-                        main_frame,
-                        textvariable=self.counter_var,
-                        font=("Arial", 11),
-                        text_color="#808080"
-                    )
-                    counter_label.pack(pady=(5, 0))
-
-                    self.setup_counter_updater()
-                    
-                    # Button frame
-                    button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    button_frame.pack(fill="x", padx=20, pady=20)
-                    
-                    # Cancel button
-                    cancel_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Cancel",
-                        command=self.on_cancel,
-                        fg_color="transparent",
-                        border_width=2,
-                        text_color=("black", "white"),
-                        hover_color="#3A3A3A",
-                        font=("Arial", 14, "bold")
-                    )
-                    cancel_btn.pack(side="left", padx=(0, 10))
-                    
-                    # Submit button
-                    submit_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Import Tokens",
-                        command=self.on_submit,
-                        fg_color="#4CC9F0",
-                        hover_color="#3AA8CC",
-                        font=("Arial", 14, "bold"),
-                        text_color="white"
-                    )
-                    submit_btn.pack(side="right")
-                    
-                    # Bind Enter key to submit
-                    self.root.bind('<Return>', lambda e: self.on_submit())
-                    self.root.bind('<Escape>', lambda e: self.on_cancel())
-                    
-                    # Update counter initially
-                    self.update_counter()
-
-                def center_and_focus(self):
-                    try:
-                        self.root.update_idletasks()
-                        w = self.root.winfo_width() or 600
-                        h = self.root.winfo_height() or 500
-                        if w <= 1 or h <= 1:
-                            try:
-                                g = self.root.geometry(); size = g.split('+')[0]
-                                w, h = [int(x) for x in size.split('x')]
-                            except Exception:
-                                w, h = 600, 500
-                        sw = self.root.winfo_screenwidth(); sh = self.root.winfo_screenheight()
-                        x = max(0, (sw - w) // 2); y = max(0, (sh - h) // 2)
-                        self.root.geometry(f"+{x}+{y}")
-                        self.root.deiconify(); self.root.lift()
-                        self.root.attributes('-topmost', True)
-                        self.root.after(300, lambda: self.root.attributes('-topmost', False))
-                        self.root.focus_force()
-                        try:
-                            self.text_widget.focus_set()
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
-                
-                def setup_counter_updater(self):
-                    def poll_counter():
-                        if not self.destroyed:
-                            self.update_counter()
-                            self.root.after(500, poll_counter)
-                    self.root.after(500, poll_counter)
-
-                def update_counter(self, event=None):
-                    try: 
-                        if self.destroyed:
-                            return
-                        text = self.text_widget.get("1.0", "end-1c")
-                        char_count = len(text)
-                        items = [x for x in text.replace(',', ' ').replace('\n', ' ').split() if x.strip()]
-                        item_count = len(items)
-                        self.counter_var.set(f"{char_count} characters, {item_count} items")
-                    except Exception:
-                        # Ignore errors during update
-                        pass
-                
-                def on_submit(self):
-                    try:
-                        text = self.text_widget.get("1.0", "end-1c").strip()
-                        self.result = text
-                        self.cleanup()
-                    except Exception:
-                        self.result = ""
-                        self.cleanup()
-                    
-                def on_cancel(self):
-                    self.result = ""
-                    self.cleanup()
-                
-                def cleanup(self):
-                    """Proper cleanup to avoid after script errors"""
-                    self.destroyed = True
-                    try:
-                        self.root.quit()
-                    except:
-                        pass
-                    try:
-                        self.root.destroy()
-                    except:
-                        pass
-
-                def get_input(self):
-                    self.root.mainloop()
-                    return self.result
-                
-            # Create and run the dialog
-            dialog = TokenInputDialog()
+            dialog = _PasteDialog(
+                title="Token Input",
+                icon="👛",
+                heading="Add Token Addresses",
+                instructions="Enter token addresses\nYou can separate them with commas, spaces, or newlines",
+                submit_label="Import Tokens",
+            )
             blob = dialog.get_input()
             
         except Exception as e:
@@ -1096,20 +1731,21 @@ class Web3Helper:
         # Show success message if we have results
         if toks:
             success_msg = f"Successfully imported {len(toks)} token addresses"
-            try:
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showinfo("Success", success_msg)
-                root.destroy()
-            except:
+            if self.console:
+                self.console.log(f"[green]{success_msg}[/green]")
+            else:
                 print(success_msg)
         
         return toks
 
     def load_privatekeys_file(self, key_file: str) -> tuple[list[str], list[str]]:
         try:
-            with open(key_file, "r", encoding="utf-8-sig") as f:
+            # Binary read, as in load_tokens_file: hex keys are ASCII and the
+            # tokenizer takes bytes.
+            with open(key_file, "rb") as f:
                 blob = f.read()
+            if blob[:3] == b"\xef\xbb\xbf":
+                blob = blob[3:]
         except Exception as e:
             if self.console:
                 self.console.log(f"[red]Failed to read private keys file {key_file}: {e}[/red]")
@@ -1130,7 +1766,7 @@ class Web3Helper:
         CLI prompt. NOTE: not masked. For masking, collect per-line via getpass in a loop.
         """
         try:
-            import questionary as q
+            q = _get_questionary()
             blob = q.text("Paste private keys (hex; with or without 0x; comma/newline separated):").ask()
         except Exception:
             blob = input("Paste private keys (hex; with or without 0x): ").strip()
@@ -1145,222 +1781,37 @@ class Web3Helper:
 
     def load_privatekeys_gui(self) -> tuple[list[str], list[str]]:
         try:
-            import customtkinter as ctk
-            class TokenInputDialog:
-                def __init__(self):
-                    # Configure appearance
-                    ctk.set_appearance_mode("dark")
-                    ctk.set_default_color_theme("blue")
-                    self.root = ctk.CTk()
-                    self.root.title("Private key Input")
-                    self.root.geometry("600x500")
-                    self.root.resizable(True, True)
-                    self.root.eval('tk::PlaceWindow . center')
-                    self.root.protocol("WM_DELETE_WINDOW", self.on_cancel)
-                    self.result = None
-                    self.destroyed = False
-                    self.setup_ui()
-                    # Ensure window appears centered and focused/selected after launch
-                    try:
-                        self.root.after(100, self.center_and_focus)
-                    except Exception:
-                        pass
-                
-                def setup_ui(self):
-                    # Main container with modern styling
-                    main_frame = ctk.CTkFrame(self.root, corner_radius=15)
-                    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-                    # Header section
-                    header_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    header_frame.pack(fill="x", padx=20, pady=(20, 10))
-                    # Icon and title
-                    icon_label = ctk.CTkLabel(
-                        header_frame, 
-                        text="🔑",
-                        font=("Arial", 24),
-                        text_color="#4CC9F0"
-                    )
-                    icon_label.pack(side="left", padx=(0, 10))
-                    
-                    title_label = ctk.CTkLabel(
-                        header_frame,
-                        text="Add Private key",
-                        font=("Arial", 20, "bold"),
-                        text_color="white"
-                    )
-                    title_label.pack(side="left")
-                    
-                    # Instructions
-                    instructions = ctk.CTkLabel(
-                        main_frame,
-                        text="Enter private keys\nYou can separate them with commas, spaces, or newlines",
-                        font=("Arial", 14),
-                        text_color="#B0B0B0",
-                        justify="left"
-                    )
-                    instructions.pack(pady=(0, 20))
-                    
-                    # Text input area with modern styling
-                    input_frame = ctk.CTkFrame(main_frame, corner_radius=10)
-                    input_frame.pack(fill="both", expand=True, padx=20, pady=10)
-                    
-                    self.text_widget = ctk.CTkTextbox(
-                        input_frame,
-                        height=200,
-                        border_width=0,
-                        corner_radius=8,
-                        fg_color="#2B2B2B",
-                        text_color="white",
-                        font=("Consolas", 12),
-                        wrap="word"
-                    )
-                    self.text_widget.pack(fill="both", expand=True, padx=10, pady=10)
-                    self.text_widget.focus_set()
-                    
-                    # Character counter
-                    self.counter_var = StringVar(value="0 characters")
-                    counter_label = ctk.CTkLabel(
-                        main_frame,
-                        textvariable=self.counter_var,
-                        font=("Arial", 11),
-                        text_color="#808080"
-                    )
-                    counter_label.pack(pady=(5, 0))
-
-                    self.setup_counter_updater()
-                    
-                    # Button frame
-                    button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-                    button_frame.pack(fill="x", padx=20, pady=20)
-                    
-                    # Cancel button
-                    cancel_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Cancel",
-                        command=self.on_cancel,
-                        fg_color="transparent",
-                        border_width=2,
-                        text_color=("black", "white"),
-                        hover_color="#3A3A3A",
-                        font=("Arial", 14, "bold")
-                    )
-                    cancel_btn.pack(side="left", padx=(0, 10))
-                    
-                    # Submit button
-                    submit_btn = ctk.CTkButton(
-                        button_frame,
-                        text="Import Private keys",
-                        command=self.on_submit,
-                        fg_color="#4CC9F0",
-                        hover_color="#3AA8CC",
-                        font=("Arial", 14, "bold"),
-                        text_color="white"
-                    )
-                    submit_btn.pack(side="right")
-                    
-                    # Bind Enter key to submit
-                    self.root.bind('<Return>', lambda e: self.on_submit())
-                    self.root.bind('<Escape>', lambda e: self.on_cancel())
-                    
-                    # Update counter initially
-                    self.update_counter()
-
-                def center_and_focus(self):
-                    try:
-                        self.root.update_idletasks()
-                        w = self.root.winfo_width() or 600
-                        h = self.root.winfo_height() or 500
-                        if w <= 1 or h <= 1:
-                            try:
-                                g = self.root.geometry(); size = g.split('+')[0]
-                                w, h = [int(x) for x in size.split('x')]
-                            except Exception:
-                                w, h = 600, 500
-                        sw = self.root.winfo_screenwidth(); sh = self.root.winfo_screenheight()
-                        x = max(0, (sw - w) // 2); y = max(0, (sh - h) // 2)
-                        self.root.geometry(f"+{x}+{y}")
-                        self.root.deiconify(); self.root.lift()
-                        self.root.attributes('-topmost', True)
-                        self.root.after(300, lambda: self.root.attributes('-topmost', False))
-                        self.root.focus_force()
-                        try:
-                            self.text_widget.focus_set()
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
-                
-                def setup_counter_updater(self):
-                    def poll_counter():
-                        if not self.destroyed:
-                            self.update_counter()
-                            self.root.after(500, poll_counter)
-                    self.root.after(500, poll_counter)
-
-                def update_counter(self, event=None):
-                    try: 
-                        if self.destroyed:
-                            return
-                        text = self.text_widget.get("1.0", "end-1c")
-                        char_count = len(text)
-                        items = [x for x in text.replace(',', ' ').replace('\n', ' ').split() if x.strip()]
-                        item_count = len(items)
-                        self.counter_var.set(f"{char_count} characters, {item_count} items")
-                    except Exception:
-                        # Ignore errors during update
-                        pass
-                
-                def on_submit(self):
-                    try:
-                        text = self.text_widget.get("1.0", "end-1c").strip()
-                        self.result = text
-                        self.cleanup()
-                    except Exception:
-                        self.result = ""
-                        self.cleanup()
-                    
-                def on_cancel(self):
-                    self.result = ""
-                    self.cleanup()
-                
-                def cleanup(self):
-                    """Proper cleanup to avoid after script errors"""
-                    self.destroyed = True
-                    try:
-                        self.root.quit()
-                    except:
-                        pass
-                    try:
-                        self.root.destroy()
-                    except:
-                        pass
-
-                def get_input(self):
-                    self.root.mainloop()
-                    return self.result
-                
-            # Create and run the dialog
-            dialog = TokenInputDialog()
+            dialog = _PasteDialog(
+                title="Private key Input",
+                icon="🔑",
+                heading="Add Private key",
+                instructions="Enter private keys\nYou can separate them with commas, spaces, or newlines",
+                submit_label="Import Private keys",
+                # Key derivation is the expensive part (secp256k1 + keccak
+                # per key); kick it off on submit so it overlaps Tk teardown.
+                submit_work=lambda text: self._derive_addresses_from_private_keys(
+                    self._parse_privatekeys_blob(text)),
+            )
             blob = dialog.get_input()
-            
+            work = dialog.work_future
         except Exception as e:
             # Fallback to traditional input if GUI fails
             print(f"GUI failed: {e}")
             blob = input("Paste Private keys: ").strip()
-        
-        # Parse the input
-        pks = self._parse_privatekeys_blob(blob or "")
-        keys, addrs = self._derive_addresses_from_private_keys(pks)
+            work = None
+
+        if work is not None:
+            keys, addrs = work.result()
+        else:
+            pks = self._parse_privatekeys_blob(blob or "")
+            keys, addrs = self._derive_addresses_from_private_keys(pks)
         
         # Show success message if we have results
         if keys and addrs:
             success_msg = f"Successfully imported {len(keys)} pk addresses"
-            try:
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showinfo("Success", success_msg)
-                root.destroy()
-            except:
+            if self.console:
+                self.console.log(f"[green]{success_msg}[/green]")
+            else:
                 print(success_msg)
         self.private_keys = keys
         self.pk_addresses = addrs
@@ -1371,32 +1822,24 @@ class Web3Helper:
         Internal: fetch token name/symbol via Multicall3 (aggregate3) with safe decode.
         Returns: {addr: {'name': str|None, 'symbol': str|None}}
         """
-        out = {self.w3.to_checksum_address(a): {} for a in addrs}
-        calls, order = [], []
-
-        sel_name   = HexBytes('0x06fdde03')  # name()
-        sel_symbol = HexBytes('0x95d89b41')  # symbol()
+        # Checksum once per token and reuse the module-level selectors.
+        checksums = [_cs(a) for a in addrs]
+        out = {T: {} for T in checksums}
 
-        for a in addrs:
-            T = self.w3.to_checksum_address(a)
-            if do_name:
-                try:
-                    calls.append((T, sel_name))
-                    order.append((T, "name"))
-                except Exception:
-                    pass
-            if do_symbol:
-                try:
-                    calls.append((T, sel_symbol))
-                    order.append((T, "symbol"))
-                except Exception:
-                    pass
+        wanted = [(f, HexBytes(s)) for f, s, on in (
+            ("name", SEL_NAME0, do_name), ("symbol", SEL_SYMBOL, do_symbol)) if on]
+        order = [(T, f) for T in checksums for f, _ in wanted]
+        calls = [(T, s) for T in checksums for _, s in wanted]
 
         if not calls:
             return out
 
-        # go through the same known-good pipeline as balanceOf
-        res = self._aggregate3(calls, allow_failure=True)
+        # go through the same known-good pipeline as balanceOf, chunked the
+        # same way - Multicall3 latency grows faster than linearly with
+        # call count.
+        res: List[Tuple[bool, bytes]] = []
+        for i in range(0, len(calls), self.BATCH_READ_CHUNK):
+            res.extend(self._aggregate3(calls[i:i + self.BATCH_READ_CHUNK], allow_failure=True))
 
         for (addr, field), (ok, data) in zip(order, res):
             out.setdefault(addr, {})
@@ -1441,13 +1884,107 @@ class Web3Helper:
         ens_forward_map: Dict[str, Optional[str]] = {}
         wallets = list(wallets or [])
 
-        if ens_names:
+        # Every aggregate3-eligible read (decimals, labels, balances,
+        # allowances) lands in one shared calls list with a parallel tags
+        # list and is demultiplexed after a single chunked dispatch - one
+        # batch per request instead of one per read kind.
+        mc_calls: List[Tuple[str, bytes]] = []
+        mc_tags: List[Tuple[str, ...]] = []
+
+        # Dedupe tokens by checksum once, keeping first-seen order: callers
+        # routinely pass the same token twice (symbol list + address list)
+        # and each duplicate would become its own multicall entry. Wallets
+        # are deduped by _push_wallet below.
+        native_aliases = {NATIVE_SENTINEL}
+        cfg_native = getattr(self.cfg, "NATIVE_TOKEN", None)
+        if cfg_native:
+            native_aliases.add(str(cfg_native).lower())
+        token_meta: List[Tuple[str, bool]] = []
+        seen_tokens: Set[str] = set()
+        for t in (tokens or []):
+            token_str = str(t).strip()
+            if not token_str:
+                continue
             try:
-                ens_forward_map = self.batch_ens_forward(ens_names, use_multicall=use_multicall) or {}
-            except Exception as exc:
-                ens_forward_map = {}
-                if self.console:
-                    self.console.log(f"[yellow]ENS forward lookup failed: {exc}[/yellow]")
+                T = _cs(token_str)
+            except Exception:
+                continue
+            if T in seen_tokens:
+                continue
+            seen_tokens.add(T)
+            token_meta.append((T, token_str.lower() in native_aliases))
+
+        # --- DECIMALS ---
+        if want_decimals and token_meta:
+            if use_multicall:
+                for T, _ in token_meta:
+                    cached = self._token_meta_get(T, "decimals")
+                    if cached is not None:
+                        out["decimals"][T] = cached
+                        continue
+                    # Tokens were checksummed during dedupe, so the encode
+                    # can't fail; no per-iteration try/except needed.
+                    mc_calls.append((T, self._enc(T, "decimals")))
+                    mc_tags.append(("decimals", T))
+            else:
+                for T, _ in token_meta:
+                    try:
+                        c = self.w3.eth.contract(address=T, abi=self.erc20_abi)
+                        d = c.functions.decimals().call()
+                        out["decimals"][T] = int(d)
+                    except Exception:
+                        pass
+
+        # --- NAME / SYMBOL ---
+        if (with_name or with_symbol) and token_meta:
+            out.setdefault("names", {})
+            out.setdefault("symbols", {})
+            if use_multicall:
+                wanted = [(f, HexBytes(s)) for f, s, on in (
+                    ("name", SEL_NAME0, with_name), ("symbol", SEL_SYMBOL, with_symbol)) if on]
+                for T, _ in token_meta:
+                    for f, s in wanted:
+                        cached = self._token_meta_get(T, f)
+                        if cached is not None:
+                            out["names" if f == "name" else "symbols"][T] = cached
+                            continue
+                        mc_calls.append((T, s))
+                        mc_tags.append((f, T))
+            else:
+                labels = self._multicall_fetch_labels([T for T, _ in token_meta], with_name, with_symbol)
+                for addr, kv in labels.items():
+                    if with_name and kv.get('name') is not None:
+                        out["names"][addr] = kv['name']
+                    if with_symbol and kv.get('symbol') is not None:
+                        out["symbols"][addr] = kv['symbol']
+
+        # Token metadata and ENS forward resolution have no data dependency
+        # (names only feed the wallet-set expansion, which the balance phase
+        # waits for anyway), so when both are needed their round-trips
+        # overlap: names resolve on a worker thread while this thread waits
+        # on the metadata dispatch. Balances/allowances still join the
+        # remaining batch below.
+        meta_res: Optional[List[Tuple[bool, bytes]]] = None
+        n_meta = 0
+        if ens_names:
+            if mc_calls:
+                with ThreadPoolExecutor(max_workers=1) as ex:
+                    fut = ex.submit(self.batch_ens_forward, ens_names, use_multicall=use_multicall)
+                    n_meta = len(mc_calls)
+                    meta_res = self._aggregate3_chunks(mc_calls, allow_failure=True)
+                    try:
+                        ens_forward_map = fut.result() or {}
+                    except Exception as exc:
+                        ens_forward_map = {}
+                        if self.console:
+                            self.console.log(f"[yellow]ENS forward lookup failed: {exc}[/yellow]")
+            else:
+                try:
+                    ens_forward_map = self.batch_ens_forward(ens_names, use_multicall=use_multicall) or {}
+                except Exception as exc:
+                    ens_forward_map = {}
+                    if self.console:
+                        self.console.log(f"[yellow]ENS forward lookup failed: {exc}[/yellow]")
 
         final_wallets: List[str] = []
         seen_wallets: Set[str] = set()
@@ -1456,7 +1993,10 @@ class Web3Helper:
             if not addr:
                 return
             try:
-                checksum = self.w3.to_checksum_address(addr)
+                # _cs costs one keccak on first sight and a cache hit after;
+                # an is_checksum_address pre-check would pay the same keccak
+                # without warming the cache.
+                checksum = _cs(addr)
             except Exception:
                 checksum = addr
             key = checksum.lower() if isinstance(checksum, str) else str(checksum)
@@ -1476,55 +2016,23 @@ class Web3Helper:
                 _push_wallet(addr)
 
         wallets = final_wallets
+        # Checksummed once for the balance/allowance loops; entries that
+        # fail (raw junk kept by _push_wallet's fallback) are dropped here.
+        wallet_cs: List[str] = []
+        for w in wallets:
+            try:
+                wallet_cs.append(_cs(w))
+            except Exception:
+                pass
 
         if want_ens:
+            # batch_ens_reverse/forward are TTL-cached (ENS_CACHE_TTL), so
+            # repeat fetches for a recently-resolved wallet set skip the RPC.
             out["ens_reverse"] = self.batch_ens_reverse(wallets, use_multicall=use_multicall) if wallets else {}
         out["ens_forward"] = ens_forward_map
 
-        # --- DECIMALS ---
-        # --- DECIMALS ---
-        if want_decimals and tokens:
-            if use_multicall:
-                calls = []
-                for t in tokens:
-                    try:
-                        calls.append( (t, self._enc(t, "decimals")) )
-                    except Exception:
-                        pass
-                res = self._aggregate3(calls, allow_failure=True)
-                for (t, _), (ok, data) in zip(calls, res):
-                    if ok and data:
-                        try:
-                            val = self.w3.codec.decode(['uint8'], data)[0]
-                            out["decimals"][self.w3.to_checksum_address(t)] = int(val)
-                        except Exception:
-                            pass
-            else:
-                for t in tokens:
-                    try:
-                        c = self.w3.eth.contract(address=self.w3.to_checksum_address(t), abi=self.erc20_abi)
-                        d = c.functions.decimals().call()
-                        out["decimals"][self.w3.to_checksum_address(t)] = int(d)
-                    except Exception:
-                        pass
-        
-        if (with_name or with_symbol) and tokens:
-            out.setdefault("names", {})
-            out.setdefault("symbols", {})
-            labels = self._multicall_fetch_labels(tokens, with_name, with_symbol)
-            for addr, kv in labels.items():
-                if with_name and kv.get('name') is not None:
-                    out["names"][addr] = kv['name']
-                if with_symbol and kv.get('symbol') is not None:
-                    out["symbols"][addr] = kv['symbol']
-
         # --- BALANCES ---
-        if want_balance and tokens and wallets:
-            native_aliases = {NATIVE_SENTINEL}
-            cfg_native = getattr(self.cfg, "NATIVE_TOKEN", None)
-            if cfg_native:
-                native_aliases.add(str(cfg_native).lower())
-
+        if want_balance and token_meta and wallets:
             chain_name_raw = getattr(self.cfg, "CHAIN_NAME", "")
             chain_name = str(chain_name_raw).strip().lower() if chain_name_raw else ""
 
@@ -1535,17 +2043,7 @@ class Web3Helper:
             if symbol_from_cfg:
                 native_symbol = str(symbol_from_cfg).strip() or None
             else:
-                default_symbols = {
-                    "polygon": "MATIC",
-                    "optimism": "ETH",
-                    "op": "ETH",
-                    "ethereum": "ETH",
-                    "eth": "ETH",
-                    "base": "ETH",
-                    "arbitrum": "ETH",
-                    "linea": "ETH",
-                }
-                native_symbol = default_symbols.get(chain_name)
+                native_symbol = _DEFAULT_NATIVE_SYMBOLS.get(chain_name)
             if not native_symbol:
                 native_symbol = (chain_name.upper() if chain_name else "NATIVE")
 
@@ -1556,86 +2054,32 @@ class Web3Helper:
             if name_from_cfg:
                 native_name = str(name_from_cfg).strip() or None
             else:
-                default_names = {
-                    "polygon": "Matic",
-                    "optimism": "Ether",
-                    "op": "Ether",
-                    "ethereum": "Ether",
-                    "eth": "Ether",
-                    "base": "Ether",
-                    "arbitrum": "Ether",
-                    "linea": "Ether",
-                }
-                native_name = default_names.get(chain_name)
+                native_name = _DEFAULT_NATIVE_NAMES.get(chain_name)
             if not native_name:
                 native_name = f"{native_symbol} (native)"
 
             native_checksums = {}
+            native_pairs: List[Tuple[str, str]] = []
 
             if use_multicall:
-                calls = []
-                index = []
-                for w in wallets:
-                    try:
-                        W = self.w3.to_checksum_address(w)
-                    except Exception:
-                        continue
-                    for t in tokens:
-                        token_str = str(t).strip()
-                        if not token_str:
-                            continue
-                        token_lower = token_str.lower()
-                        try:
-                            T = self.w3.to_checksum_address(token_str)
-                        except Exception:
-                            continue
-                        if token_lower in native_aliases:
-                            try:
-                                val = int(self.w3.eth.get_balance(W))
-                            except Exception:
-                                val = 0
-                            out["balances"][(W, T)] = val
+                for W in wallet_cs:
+                    for T, is_native in token_meta:
+                        if is_native:
+                            # Multicall3 itself exposes getEthBalance, so the
+                            # native read rides the same batch as the ERC-20
+                            # calls; a failed call decodes to the old 0.
+                            mc_calls.append((self.multicall.address,
+                                             HexBytes(SEL_GETETHBALANCE + _pad_addr(W))))
+                            mc_tags.append(("balance", W, T))
                             native_checksums[T] = (native_name, native_symbol)
                             continue
-                        try:
-                            calls.append((T, self._enc(T, "balanceOf", [W])))
-                            index.append((W, T))
-                        except Exception:
-                            pass
-                # chunk to be safe
-                chunk = 500
-                for i in range(0, len(calls), chunk):
-                    part = calls[i:i+chunk]
-                    res = self._aggregate3(part, allow_failure=True)
-                    for (w,t), (ok, data) in zip(index[i:i+chunk], res):
-                        val = 0
-                        if ok and data:
-                            try:
-                                val = int.from_bytes(data[-32:], 'big')
-                            except Exception:
-                                val = 0
-                        out["balances"][(w,t)] = val
+                        mc_calls.append((T, self._enc(T, "balanceOf", [W])))
+                        mc_tags.append(("balance", W, T))
             else:
-                for w in wallets:
-                    try:
-                        W = self.w3.to_checksum_address(w)
-                    except Exception:
-                        continue
-                    for t in tokens:
-                        token_str = str(t).strip()
-                        if not token_str:
-                            continue
-                        token_lower = token_str.lower()
-                        try:
-                            T = self.w3.to_checksum_address(token_str)
-                        except Exception:
-                            continue
-                        if token_lower in native_aliases:
-                            try:
-                                val = int(self.w3.eth.get_balance(W))
-                            except Exception:
-                                val = 0
-                            out["balances"][(W, T)] = val
+                for W in wallet_cs:
+                    for T, is_native in token_meta:
+                        if is_native:
+                            native_pairs.append((W, T))
                             native_checksums[T] = (native_name, native_symbol)
                             continue
                         try:
@@ -1645,6 +2089,22 @@ class Web3Helper:
                             val = 0
                         out["balances"][(W,T)] = int(val)
 
+            # Native balances can't go through the ERC-20 batch, so fan the
+            # eth_getBalance calls out over a pool instead of serializing
+            # one round-trip per wallet; failures keep the old 0 default.
+            if native_pairs:
+                native_wallets = list(dict.fromkeys(W for W, _ in native_pairs))
+                native_bal: Dict[str, int] = {}
+                with ThreadPoolExecutor(max_workers=min(16, len(native_wallets))) as ex:
+                    futs = {ex.submit(self.w3.eth.get_balance, W): W for W in native_wallets}
+                    for fut in as_completed(futs):
+                        try:
+                            native_bal[futs[fut]] = int(fut.result())
+                        except Exception:
+                            native_bal[futs[fut]] = 0
+                for W, T in native_pairs:
+                    out["balances"][(W, T)] = native_bal.get(W, 0)
+
             if native_checksums:
                 if with_name:
                     out.setdefault("names", {})
@@ -1657,37 +2117,18 @@ class Web3Helper:
                         out["symbols"][checksum] = n_symbol
 
         # --- ALLOWANCES ---
-        if want_allowance and spender and wallets and tokens:
-            S = self.w3.to_checksum_address(spender)
+        if want_allowance and spender and wallets and token_meta:
+            S = _cs(spender)
+            owner_cs = wallet_cs
+            spend_tokens = [T for T, _ in token_meta]
             if use_multicall:
-                calls = []
-                index = []
-                for w in wallets:
-                    W = self.w3.to_checksum_address(w)
-                    for t in tokens:
-                        T = self.w3.to_checksum_address(t)
-                        try:
-                            calls.append( (T, self._enc(T, "allowance", [W, S])) )
-                            index.append( (W, T) )
-                        except Exception:
-                            pass
-                chunk = 500
-                for i in range(0, len(calls), chunk):
-                    part = calls[i:i+chunk]
-                    res = self._aggregate3(part, allow_failure=True)
-                    for (w,t), (ok, data) in zip(index[i:i+chunk], res):
-                        val = 0
-                        if ok and data:
-                            try:
-                                val = int.from_bytes(data[-32:], 'big')
-                            except Exception:
-                                val = 0
-                        out["allowance"][(w,t)] = val
+                for W in owner_cs:
+                    for T in spend_tokens:
+                        mc_calls.append( (T, self._enc(T, "allowance", [W, S])) )
+                        mc_tags.append( ("allowance", W, T) )
             else:
-                for w in wallets:
-                    W = self.w3.to_checksum_address(w)
-                    for t in tokens:
-                        T = self.w3.to_checksum_address(t)
+                for W in owner_cs:
+                    for T in spend_tokens:
                         try:
                             c = self.w3.eth.contract(address=T, abi=self.erc20_abi)
                             v = c.functions.allowance(W, S).call()
@@ -1695,6 +2136,40 @@ class Web3Helper:
                             v = 0
                         out["allowance"][(W,T)] = int(v)
 
+        # --- DEMUX ---
+        if mc_calls:
+            pending = mc_calls[n_meta:]
+            res = list(meta_res) if meta_res is not None else []
+            if pending:
+                res.extend(self._aggregate3_chunks(pending, allow_failure=True))
+            # Word-valued results (balances, allowances, decimals) decode in
+            # one C-level pass: concatenate every trailing 32-byte word and
+            # let struct.iter_unpack split it, leaving four shifts per
+            # element instead of a per-result int.from_bytes call. The
+            # unpack iterator is consumed in lockstep with the tags, so no
+            # intermediate value list is materialized on large fetches.
+            # Failed or short returns decode to 0, the old default.
+            buf = b''.join(
+                d[-32:] if (ok and d and len(d) >= 32) else b'\x00' * 32
+                for ok, d in res)
+            for (tag, (ok, data), (wa, wb, wc, wd)) in zip(
+                    mc_tags, res, struct.iter_unpack('>4Q', buf)):
+                kind = tag[0]
+                if kind == "balance" or kind == "allowance":
+                    out["balances" if kind == "balance" else "allowance"][(tag[1], tag[2])] = \
+                        (wa << 192) | (wb << 128) | (wc << 64) | wd
+                elif kind == "decimals":
+                    if ok and data:
+                        val = (wa << 192) | (wb << 128) | (wc << 64) | wd
+                        out["decimals"][tag[1]] = val
+                        self._token_meta_put(tag[1], "decimals", val)
+                else:  # name / symbol
+                    if ok and data:
+                        v = self._decode_string_like(data)
+                        if v is not None:
+                            out["names" if kind == "name" else "symbols"][tag[1]] = v
+                            self._token_meta_put(tag[1], kind, v)
+
         out["wallets_resolved"] = list(wallets)
         return out
 
@@ -1725,14 +2200,15 @@ class FileHelper:
             s = s.split('#', 1)[0].strip()
         return s
 
+    # One line per match: skip blank/comment lines, capture the payload with
+    # surrounding whitespace and any trailing "# ..." comment trimmed. Same
+    # semantics as _strip_comment, but findall scans the whole file in C.
+    _LINE_RE = re.compile(r'^\s*([^#\s][^#]*?)\s*(?:#.*)?$', re.M)
+
     @staticmethod
     def load_lines(file_path: str) -> List[str]:
-        out: List[str] = []
         if not os.path.exists(file_path):
-            return out
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                s = FileHelper._strip_comment(line)
-                if s:
-                    out.append(s)
-        return out
+            return []
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8', 'replace')
+        return FileHelper._LINE_RE.findall(text)
@@ -1,8 +1,13 @@
-from typing import List, Optional, Tuple
+import atexit
+import email.utils
+from typing import Dict, List, Optional, Tuple
 import threading
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import HTTPProvider
+from web3._utils.request import cache_and_return_session
 
 
 class RotatingHTTPProvider(HTTPProvider):
@@ -10,16 +15,53 @@ class RotatingHTTPProvider(HTTPProvider):
     HTTP provider that rotates between multiple RPC URLs when rate-limited
     or on connection errors. Attempts each URL in order and advances on
     failures. Thread-safe for simple usage.
+
+    Deliberately synchronous: callers overlap IO through make_batch_request
+    (many calls per HTTP POST) and thread-pool fan-out, which covers the
+    concurrency an AsyncHTTPProvider would buy without pulling an event
+    loop through the questionary/Tk front-ends.
     """
 
     def __init__(self, rpc_urls: List[str], request_kwargs: Optional[dict] = None):
         if not rpc_urls:
             raise ValueError("rpc_urls must be a non-empty list")
-        # Initialize with the first URL for superclass
-        super().__init__(endpoint_uri=rpc_urls[0], request_kwargs=request_kwargs)
-        self._urls: List[str] = list(dict.fromkeys([u.strip() for u in rpc_urls if u and u.strip()]))
+        urls = list(dict.fromkeys([u.strip() for u in rpc_urls if u and u.strip()]))
+        if not urls:
+            raise ValueError("rpc_urls must contain at least one non-empty URL")
+        # One pooled keep-alive session per endpoint, registered with web3's
+        # session cache up front. web3 looks sessions up by endpoint URI, so
+        # without this each rotation lands on a default session and pays
+        # fresh TCP+TLS setup; pre-seeding keeps established connections
+        # alive across rotations.
+        self._sessions: Dict[str, requests.Session] = {u: self._make_session() for u in urls}
+        super().__init__(endpoint_uri=urls[0], request_kwargs=request_kwargs, session=self._sessions[urls[0]])
+        for u in urls[1:]:
+            cache_and_return_session(u, self._sessions[u])
+        atexit.register(self.close_sessions)
+        self._urls: List[str] = urls
         self._idx: int = 0
         self._lock = threading.Lock()
+        # URL -> monotonic timestamp until which the endpoint is throttled;
+        # _advance skips URLs still cooling down.
+        self._cooldown: Dict[str, float] = {}
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        # Sized for thread-pool concurrency: the default adapter holds ~10
+        # pooled connections, which parallel dispatch/prefetch workers
+        # exhaust and then pay TCP+TLS setup per request.
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close_sessions(self) -> None:
+        for session in self._sessions.values():
+            try:
+                session.close()
+            except Exception:
+                pass
 
     @property
     def current_url(self) -> str:
@@ -28,9 +70,38 @@ class RotatingHTTPProvider(HTTPProvider):
 
     def _advance(self) -> None:
         with self._lock:
-            self._idx = (self._idx + 1) % len(self._urls)
+            now = time.monotonic()
+            total = len(self._urls)
+            idx = self._idx
+            # Prefer the next URL not in cooldown; if every URL is cooling
+            # down the loop wraps back to a plain round-robin step.
+            for step in range(1, total + 1):
+                idx = (self._idx + step) % total
+                if self._cooldown.get(self._urls[idx], 0.0) <= now:
+                    break
+            self._idx = idx
             # update underlying provider endpoint
-            self.endpoint_uri = self._urls[self._idx]
+            self.endpoint_uri = self._urls[idx]
+
+    def _mark_throttled(self, url: str, seconds: float) -> None:
+        with self._lock:
+            self._cooldown[url] = time.monotonic() + max(seconds, 0.1)
+
+    @staticmethod
+    def _retry_after_seconds(response) -> float:
+        """Parse a Retry-After header (seconds or HTTP-date) into seconds."""
+        hdr = response.headers.get("Retry-After") if response is not None else None
+        if not hdr:
+            return 0.0
+        try:
+            return max(0.0, float(hdr))
+        except ValueError:
+            pass
+        try:
+            dt = email.utils.parsedate_to_datetime(hdr)
+            return max(0.0, dt.timestamp() - time.time())
+        except Exception:
+            return 0.0
 
     def _should_rotate_on_error(self, error_obj: dict) -> bool:
         # Common rate limit indicators across providers
@@ -51,6 +122,56 @@ class RotatingHTTPProvider(HTTPProvider):
             return True
         return False
 
+    def make_batch_request(self, reqs: List[Tuple[str, list]]) -> List[dict]:
+        """
+        POST several JSON-RPC calls as a single HTTP batch (a JSON array per
+        the 2.0 spec) and return one response slot per request, aligned to
+        the request order by id. Requests the provider did not answer (or
+        answered with a null/unknown id) map to None so callers can retry
+        them individually. Rotates on rate limits like make_request; raises
+        the last exception when every URL fails.
+        """
+        payload = [{"jsonrpc": "2.0", "id": i, "method": m, "params": p}
+                   for i, (m, p) in enumerate(reqs)]
+        attempts = 0
+        last_exc: Optional[BaseException] = None
+        total = len(self._urls)
+
+        while attempts < total:
+            url = self.current_url
+            try:
+                resp = self._sessions[url].post(url, json=payload, timeout=30)
+                if resp.status_code in (429, 502, 503, 504):
+                    retry_after = self._retry_after_seconds(resp)
+                    self._mark_throttled(url, retry_after or 1.0)
+                    time.sleep(min(retry_after, 2.0) if retry_after else 0.1)
+                    self._advance()
+                    attempts += 1
+                    continue
+                resp.raise_for_status()
+                body = resp.json()
+                if isinstance(body, dict):
+                    # Some providers answer a batch with a single error object
+                    body = [body]
+                # Pair replies with requests by id, never by position: batch
+                # replies may arrive out of order, short, or with null-id
+                # error entries, and positional pairing silently misaligns
+                # every request after the first gap.
+                by_id: Dict[int, dict] = {}
+                for entry in body:
+                    if isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                        by_id[entry["id"]] = entry
+                return [by_id.get(i) for i in range(len(reqs))]
+            except Exception as e:
+                last_exc = e
+                self._advance()
+                attempts += 1
+                time.sleep(0.1)
+
+        if last_exc is not None:
+            raise last_exc
+        raise requests.HTTPError("All RPC URLs rate limited or failed")
+
     def make_request(self, method: str, params: list):  # type: ignore[override]
         attempts = 0
         last_exc: Optional[BaseException] = None
@@ -58,10 +179,12 @@ class RotatingHTTPProvider(HTTPProvider):
         total = len(self._urls)
 
         while attempts < total:
+            url = self.current_url
             try:
                 response = super().make_request(method, params)
                 # If JSON-RPC error indicates rate limit, rotate and retry
                 if isinstance(response, dict) and "error" in response and self._should_rotate_on_error(response["error"]):
+                    self._mark_throttled(url, 1.0)
                     self._advance()
                     attempts += 1
                     last_error_resp = response
@@ -69,6 +192,20 @@ class RotatingHTTPProvider(HTTPProvider):
                     time.sleep(0.1)
                     continue
                 return response
+            except requests.HTTPError as e:
+                # Providers commonly throttle with plain HTTP 429/5xx bodies
+                # that web3 raises before the JSON-RPC heuristics run.
+                last_exc = e
+                resp = e.response
+                status = resp.status_code if resp is not None else None
+                if status in (429, 502, 503, 504):
+                    retry_after = self._retry_after_seconds(resp)
+                    self._mark_throttled(url, retry_after or 1.0)
+                    time.sleep(min(retry_after, 2.0) if retry_after else 0.1)
+                else:
+                    time.sleep(0.1)
+                self._advance()
+                attempts += 1
             except Exception as e:  # Connection errors, timeouts, etc.
                 last_exc = e
                 self._advance()